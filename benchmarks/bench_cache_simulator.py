@@ -0,0 +1,71 @@
+"""Replay a synthetic request log through every cache policy and key mode.
+
+Prompts are drawn from a Zipf-like popularity curve over --distinct
+templates; a share of repeats differ only in case, spacing or trailing
+punctuation, which normalized keys catch and exact keys do not. Reports
+replay throughput, the process's peak resident memory and each scenario's savings.
+
+    python -m benchmarks.bench_cache_simulator [--requests 10000000] [--distinct 1000000]
+"""
+import argparse
+import os
+import resource
+import shutil
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from config import MODEL_RATES
+from utils.cache_simulator import KEY_MODES, POLICIES, CacheSettings, simulate_log
+
+def write_requests(path, requests, distinct, seed=9, batch=1_000_000):
+    rng = np.random.default_rng(seed)
+    models = np.array(list(MODEL_RATES))
+    start = pd.Timestamp("2025-01-01", tz="UTC")
+    with open(path, "w", encoding="utf-8") as f:
+        for first in range(0, requests, batch):
+            n = min(batch, requests - first)
+            ids = np.minimum(rng.zipf(1.2, n), distinct) - 1
+            prompts = pd.Series(ids).map("Summarize support ticket {} for the weekly report".format)
+            variant = rng.random(n)
+            prompts[variant < 0.1] = prompts[variant < 0.1].str.upper()
+            prompts[(variant >= 0.1) & (variant < 0.2)] += "  ."
+            seconds = (first + np.arange(n)) * (30 * 86400 / requests)
+            pd.DataFrame({
+                "timestamp": (start + pd.to_timedelta(seconds, unit="s")).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "model": models[ids % len(models)],
+                "prompt": prompts,
+                "prompt_tokens": 40 + ids % 200,
+                "completion_tokens": 100 + ids % 400,
+            }).to_csv(f, header=first == 0, index=False)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=1_000_000)
+    parser.add_argument("--distinct", type=int, default=1_000_000)
+    parser.add_argument("--capacity", type=int, default=100_000)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp()
+    path = os.path.join(workdir, "requests.csv")
+    try:
+        start = time.perf_counter()
+        write_requests(path, args.requests, args.distinct)
+        print(f"wrote {args.requests:,} requests ({os.path.getsize(path) / 2**20:,.0f} MiB) "
+              f"in {time.perf_counter() - start:.0f}s")
+
+        scenarios = [(policy, mode) for policy in POLICIES for mode in KEY_MODES]
+        settings = CacheSettings(args.capacity, 24 * 3600, args.capacity * 300)
+        report = simulate_log(path, scenarios, MODEL_RATES, settings)
+        # tracemalloc would slow the per-request replay several-fold; use the OS high-water mark
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        print(report.frame().to_string(index=False, float_format=lambda v: f"{v:,.3f}"))
+        print(f"{len(scenarios)} scenarios in {report.seconds:.0f}s: {report.requests_per_second:,.0f} requests/s "
+              f"({report.requests_per_second * len(scenarios):,.0f} cache lookups/s), peak {peak:,.0f} MiB")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
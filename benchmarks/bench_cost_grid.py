@@ -0,0 +1,51 @@
+"""Time the cost-scenario grid: one NumPy broadcast vs a Python loop per cell.
+
+Grids span every model in MODEL_RATES; the token axes get finer until the
+grid reaches --max-cells. The loop baseline is timed on the first grid
+only and extrapolated per cell.
+
+    python -m benchmarks.bench_cost_grid [--max-cells 10000000] [--repeats 5]
+"""
+import argparse
+import statistics
+import time
+
+from config import MODEL_RATES
+from utils.cost_scenarios import axis, build_grid
+
+def loop_grid(rates, tokens_in, tokens_out, requests):
+    return [
+        [[[((ti * rate["in"] + to * rate["out"]) / 1000) * rq for rq in requests] for to in tokens_out] for ti in tokens_in]
+        for rate in rates.values()
+    ]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-cells", type=int, default=10_000_000)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    requests = axis(10, 5000, 10)
+    print(f"{'cells':>12} {'numpy ms':>10} {'loop ms (est.)':>15} {'MiB':>8}")
+    per_cell_loop = None
+    step = 400
+    while True:
+        tokens = axis(100, 4000, step)
+        cells = len(MODEL_RATES) * len(tokens) ** 2 * len(requests)
+        if cells > args.max_cells:
+            break
+        timings = []
+        for _ in range(args.repeats):
+            start = time.perf_counter()
+            grid = build_grid(MODEL_RATES, tokens, tokens, requests)
+            timings.append((time.perf_counter() - start) * 1000)
+        if per_cell_loop is None:
+            start = time.perf_counter()
+            loop_grid(MODEL_RATES, tokens.tolist(), tokens.tolist(), requests.tolist())
+            per_cell_loop = (time.perf_counter() - start) * 1000 / cells
+        print(f"{cells:>12,} {statistics.median(timings):>10.1f} {per_cell_loop * cells:>15.0f} "
+              f"{grid.daily.nbytes / 2**20:>8.1f}")
+        step //= 2
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Measure near-duplicate detection throughput, precision and recall.
+
+Generates synthetic comments, a share of which are lightly edited copies of
+earlier ones (case changes, punctuation, a swapped or dropped word), then
+runs them through the MinHash/LSH index as the submit path would.
+
+    python -m benchmarks.bench_feedback_dedup [--docs 100000]
+"""
+import argparse
+import random
+import time
+
+from benchmarks.bench_feedback_search import synthetic_comments
+from utils.feedback_dedup import NearDuplicateIndex
+
+def perturb(text: str, rng: random.Random) -> str:
+    words = text.split()
+    edit = rng.randrange(4)
+    if edit == 0:
+        return text.upper() + "!"
+    if edit == 1 and len(words) > 8:
+        del words[rng.randrange(len(words))]
+    elif edit == 2:
+        words[rng.randrange(len(words))] += ","
+    return "  ".join(words)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=100_000)
+    parser.add_argument("--duplicate-share", type=float, default=0.1)
+    args = parser.parse_args()
+
+    rng = random.Random(11)
+    texts, is_copy = [], []
+    for row in synthetic_comments(args.docs):
+        if texts and rng.random() < args.duplicate_share:
+            texts.append(perturb(rng.choice(texts), rng))
+            is_copy.append(True)
+        else:
+            texts.append(row["Feedback"] + f" (order {len(texts)})")
+            is_copy.append(False)
+
+    index = NearDuplicateIndex()
+    start = time.perf_counter()
+    flagged = [index.check_and_add(text) is not None for text in texts]
+    elapsed = time.perf_counter() - start
+
+    true_positives = sum(f and c for f, c in zip(flagged, is_copy))
+    print(f"checked {len(texts)} comments in {elapsed:.1f}s ({len(texts) / elapsed:,.0f}/s, "
+          f"{elapsed / len(texts) * 1000:.3f} ms each)")
+    print(f"precision {true_positives / max(sum(flagged), 1):.3f}   "
+          f"recall {true_positives / max(sum(is_copy), 1):.3f}")
+
+if __name__ == "__main__":
+    main()
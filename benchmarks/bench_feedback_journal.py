@@ -0,0 +1,119 @@
+"""Benchmark the append-only feedback journal.
+
+Measures per-submission latency as the journal grows past 100k rows and checks
+that concurrent submitters in separate processes never lose a row.
+
+    python -m benchmarks.bench_feedback_journal [--rows 200000] [--writers 50]
+"""
+import argparse
+import csv
+import multiprocessing
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+from utils.feedback_store import FEEDBACK_FIELDS, FeedbackJournal
+
+SAMPLE_ENTRY = {
+    "Name": "Alex",
+    "Email": "alex@startup.ie",
+    "Rating": 4,
+    "Feedback": "Clear explanations, would love more on pricing.",
+    "Suggested Topic": "LLM APIs",
+    "Attachment Name": "",
+}
+
+def seed(path, rows):
+    """Grow the journal to `rows` rows without going through the journal."""
+    with open(path, "a", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=FEEDBACK_FIELDS, lineterminator="\n")
+        if f.tell() == 0:
+            writer.writeheader()
+        writer.writerows([SAMPLE_ENTRY] * rows)
+
+def count_rows(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        return sum(1 for _ in csv.reader(f)) - 1
+
+def time_appends(journal, samples):
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        journal.append(SAMPLE_ENTRY)
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return statistics.mean(timings), timings[int(len(timings) * 0.99) - 1]
+
+def time_legacy_appends(path, samples):
+    """The previous read-modify-write implementation, for comparison."""
+    import pandas as pd
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        df = pd.concat([pd.read_csv(path), pd.DataFrame([SAMPLE_ENTRY])], ignore_index=True)
+        df.to_csv(path, index=False)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.mean(timings)
+
+def latency_benchmark(directory, max_rows, samples):
+    path = os.path.join(directory, "latency.csv")
+    journal = FeedbackJournal(path)
+    print(f"{'rows':>10} {'mean ms':>10} {'p99 ms':>10} {'legacy ms':>10}")
+    size = 0
+    for target in (1_000, 10_000, 100_000, max_rows):
+        if target <= size:
+            continue
+        seed(path, target - size)
+        size = target
+        mean, p99 = time_appends(journal, samples)
+        size += samples
+        legacy = "-"
+        if target <= 10_000:
+            try:
+                legacy_path = os.path.join(directory, f"legacy_{target}.csv")
+                seed(legacy_path, target)
+                legacy = f"{time_legacy_appends(legacy_path, 20):.2f}"
+            except ImportError:
+                pass
+        print(f"{size:>10} {mean:>10.3f} {p99:>10.3f} {legacy:>10}")
+    journal.close()
+
+def _submitter(path, count):
+    journal = FeedbackJournal(path)
+    for i in range(count):
+        journal.append(dict(SAMPLE_ENTRY, Name=f"writer-{os.getpid()}-{i}"))
+    journal.close()
+
+def concurrency_benchmark(directory, writers, per_writer):
+    path = os.path.join(directory, "concurrent.csv")
+    start = time.perf_counter()
+    procs = [multiprocessing.Process(target=_submitter, args=(path, per_writer)) for _ in range(writers)]
+    for proc in procs:
+        proc.start()
+    for proc in procs:
+        proc.join()
+    elapsed = time.perf_counter() - start
+
+    expected = writers * per_writer
+    found = count_rows(path)
+    print(f"{writers} writers x {per_writer} rows: {found}/{expected} rows in {elapsed:.2f}s")
+    return found == expected
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--samples", type=int, default=500)
+    parser.add_argument("--writers", type=int, default=50)
+    parser.add_argument("--per-writer", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        latency_benchmark(directory, args.rows, args.samples)
+        if not concurrency_benchmark(directory, args.writers, args.per_writer):
+            print("Lost writes detected!")
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
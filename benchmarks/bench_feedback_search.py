@@ -0,0 +1,66 @@
+"""Compare BM25 index lookups with a pandas `str.contains` scan over feedback.
+
+Generates synthetic comments with a Zipf-like vocabulary, indexes them, then
+times the same queries against the index and against a case-insensitive
+pandas scan of the "Feedback" column.
+
+    python -m benchmarks.bench_feedback_search [--docs 1000000]
+"""
+import argparse
+import random
+import statistics
+import time
+
+from utils.feedback_search import FeedbackSearchIndex
+
+VOCABULARY = (
+    "guide prompt pricing token cost model temperature sampling hallucination bias ethics "
+    "startup example clear helpful confusing great more less api quiz section glossary "
+    "explanation support chatbot latency budget gpt cache batch summary marketing founder "
+    "product onboarding checklist template fairness review retrieval context output input"
+).split()
+
+QUERIES = ["pricing", "temperature examples", "confusing quiz", "cache batch cost", "onboarding template review"]
+
+def synthetic_comments(count, seed=7):
+    rng = random.Random(seed)
+    weights = [1 / (rank + 1) for rank in range(len(VOCABULARY))]
+    for i in range(count):
+        words = rng.choices(VOCABULARY, weights, k=rng.randint(4, 20))
+        yield {"Name": f"user{i}", "Feedback": " ".join(words)}
+
+def time_queries(run, repeats):
+    timings = []
+    for _ in range(repeats):
+        for query in QUERIES:
+            start = time.perf_counter()
+            run(query)
+            timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return statistics.mean(timings), timings[int(len(timings) * 0.99) - 1]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=1_000_000)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = list(synthetic_comments(args.docs))
+    index = FeedbackSearchIndex()
+    start = time.perf_counter()
+    index.add_many(rows)
+    print(f"indexed {len(index)} comments in {time.perf_counter() - start:.1f}s")
+
+    mean, p99 = time_queries(lambda q: index.search(q, 20), args.repeats)
+    print(f"{'bm25 index':<14} mean {mean:9.2f} ms   p99 {p99:9.2f} ms")
+
+    try:
+        import pandas as pd
+    except ImportError:
+        return
+    comments = pd.DataFrame(rows)["Feedback"]
+    mean, p99 = time_queries(lambda q: comments[comments.str.contains(q.split()[0], case=False)], args.repeats)
+    print(f"{'pandas scan':<14} mean {mean:9.2f} ms   p99 {p99:9.2f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Compare feedback submit latency with and without the write-behind queue.
+
+"before" is a synchronous append to the feedback journal in the submitting
+thread; "after" only enqueues the entry. Both run with several concurrent
+submitters, and the journal is checked for lost rows once the queue drains.
+
+    python -m benchmarks.bench_feedback_submit [--submits 5000] [--threads 8]
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+from benchmarks.bench_feedback_journal import SAMPLE_ENTRY, count_rows
+from utils.feedback_queue import FeedbackWriteQueue
+from utils.feedback_store import FeedbackJournal
+
+def run_submitters(submit, submits, threads):
+    timings = []
+    lock = threading.Lock()
+
+    def worker(count):
+        local = []
+        for _ in range(count):
+            start = time.perf_counter()
+            submit(SAMPLE_ENTRY)
+            local.append((time.perf_counter() - start) * 1000)
+        with lock:
+            timings.extend(local)
+
+    pool = [threading.Thread(target=worker, args=(submits // threads,)) for _ in range(threads)]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    timings.sort()
+    return timings
+
+def report(label, timings):
+    p50 = timings[len(timings) // 2]
+    p99 = timings[int(len(timings) * 0.99) - 1]
+    print(f"{label:<8} mean {statistics.mean(timings):8.3f} ms   p50 {p50:8.3f} ms   p99 {p99:8.3f} ms")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--submits", type=int, default=5000)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--fsync-every", type=int, default=1,
+                        help="journal fsync batch size (1 approximates a slow, durable disk)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        before_path = os.path.join(directory, "before.csv")
+        journal = FeedbackJournal(before_path, fsync_every=args.fsync_every)
+        report("before", run_submitters(journal.append, args.submits, args.threads))
+        journal.close()
+
+        after_path = os.path.join(directory, "after.csv")
+        journal = FeedbackJournal(after_path, fsync_every=args.fsync_every)
+        write_queue = FeedbackWriteQueue(journal.append_many, max_pending=args.submits)
+        report("after", run_submitters(write_queue.submit, args.submits, args.threads))
+        write_queue.drain()
+        journal.close()
+
+        expected = (args.submits // args.threads) * args.threads
+        found = count_rows(after_path)
+        print(f"queued rows written: {found}/{expected}")
+        if found != expected:
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Time the script run triggered by each kind of interaction on the reading pages.
+
+For every page, in an AppTest session, this times:
+
+* a full rerun with every section expanded (sub-topic change,
+  expand/collapse, reset),
+* ticking "Mark as complete",
+* answering the first quiz question or moving the first slider.
+
+A browser tags a widget interaction inside a fragment with that fragment's
+id, and the server then reruns only that fragment. AppTest always sends a
+full-run request, so this script adds the fragment id that owns the
+widget, as the frontend would. Pages without fragments fall back to a full
+run, which is what those interactions cost before fragments.
+
+    python -m benchmarks.bench_interactions [--pages Home Prompt\\ Engineering] [--repeats 20]
+"""
+import argparse
+import os
+import shutil
+import statistics
+import tempfile
+import time
+
+import streamlit.testing.v1.local_script_runner as local_script_runner
+from streamlit.runtime.forward_msg_queue import ForwardMsgQueue
+from streamlit.runtime.scriptrunner import RerunData
+from streamlit.testing.v1 import AppTest
+
+from config import PAGE_MODULES
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+READING_PAGES = [
+    "Home", "Prompt Engineering", "Temperature & Sampling", "Hallucinations", "API Cost Optimization", "Ethics & Bias"
+]
+
+# Fragment id of the first element of each type in a run, recorded as deltas are enqueued
+widget_fragments = {}
+_enqueue = ForwardMsgQueue.enqueue
+
+def _record_fragment(queue, msg):
+    if msg.HasField("delta") and msg.delta.HasField("new_element"):
+        widget_fragments.setdefault(msg.delta.new_element.WhichOneof("type"), msg.delta.fragment_id)
+    return _enqueue(queue, msg)
+
+ForwardMsgQueue.enqueue = _record_fragment
+
+def run_in_fragment(app, fragment_id):
+    """Run `app` the way the server handles an interaction inside `fragment_id`."""
+    if not fragment_id:
+        return app.run()
+    original = local_script_runner.RerunData
+    local_script_runner.RerunData = lambda **kwargs: RerunData(fragment_id_queue=[fragment_id], **kwargs)
+    try:
+        return app.run()
+    finally:
+        local_script_runner.RerunData = original
+
+def timed(action):
+    start = time.perf_counter()
+    action()
+    return (time.perf_counter() - start) * 1000
+
+def measure(module, repeats):
+    app = AppTest.from_string(f"import importlib; importlib.import_module({module!r}).render()", default_timeout=120)
+    app.run()
+    # Collapsed sections build no widgets; set the flag the expand-all button syncs
+    app.session_state["expand_all_triggered"] = True
+    app.run()
+    full, checkbox, widget = [], [], []
+    for i in range(repeats):
+        full.append(timed(app.run))
+
+        box = app.checkbox[0]
+        checkbox.append(timed((box.uncheck() if box.value else box.check()).run))
+        # Fragment ids follow element positions, so take them from the latest full run
+        widget_fragments.clear()
+        app.run()
+
+        if app.radio:
+            radio = app.radio[0]
+            radio.set_value(radio.options[1 + i % (len(radio.options) - 1)])
+            fragment_id = widget_fragments.get("radio")
+        elif app.slider:
+            slider = app.slider[0]
+            slider.set_value(slider.min if slider.value != slider.min else slider.max)
+            fragment_id = widget_fragments.get("slider")
+        else:
+            continue
+        widget.append(timed(lambda: run_in_fragment(app, fragment_id)))
+        app.run()
+    median = lambda values: statistics.median(values) if values else float("nan")
+    return median(full), median(checkbox), median(widget)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", nargs="+", default=READING_PAGES)
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp()
+    shutil.copy(os.path.join(REPO_ROOT, "style.css"), workdir)
+    os.chdir(workdir)
+    try:
+        print(f"{'page':<24} {'full rerun ms':>14} {'checkbox ms':>12} {'quiz/slider ms':>15}")
+        for page in args.pages:
+            full, checkbox, widget = measure(PAGE_MODULES[page], args.repeats)
+            print(f"{page:<24} {full:>14.2f} {checkbox:>12.2f} {widget:>15.2f}")
+    finally:
+        from utils.helpers import get_progress_writer
+
+        get_progress_writer().close()  # flush pending progress before removing the directory
+        shutil.rmtree(workdir, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Measure the prefix-caching estimator on synthetic prompts that share system-prompt prefixes.
+
+Each prompt is one of --systems system prompts (300-3000 tokens, some
+extended by a few-shot block) followed by a unique 20-200 token question.
+Prompts are written as token ids, so the run times the log reader and the
+prefix trees rather than a tokenizer; the tokenizer-free fallback's own
+rate is printed separately. Run once with the default memory budget and
+once with a quarter of it to show the lower-bound behaviour.
+
+    python -m benchmarks.bench_prefix_cache [--prompts 300000] [--systems 200]
+"""
+import argparse
+import json
+import os
+import resource
+import shutil
+import tempfile
+import time
+
+import numpy as np
+
+from config import MODEL_RATES, PREFIX_TREE_MEMORY_BYTES
+from utils.prefix_cache import estimate_log
+from utils.token_counter import TokenCounter
+
+def write_prompts(path, prompts, systems, seed=5):
+    rng = np.random.default_rng(seed)
+    models = list(MODEL_RATES)
+    words = lambda n: " ".join(map(str, rng.integers(0, 50_000, n)))
+    system_prompts = [words(rng.integers(300, 3000)) for _ in range(systems)]
+    few_shot = [words(rng.integers(200, 800)) for _ in range(systems)]
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(prompts):
+            s = int(rng.zipf(1.5)) % systems
+            prompt = system_prompts[s] + (" " + few_shot[s] if rng.random() < 0.3 else "") + " " + words(rng.integers(20, 200))
+            f.write(json.dumps({"model": models[s % len(models)], "prompt": prompt}) + "\n")
+
+def encode_ids(texts):
+    return [np.array(text.split(), dtype=np.uint32) for text in texts]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--prompts", type=int, default=100_000)
+    parser.add_argument("--systems", type=int, default=200)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp()
+    path = os.path.join(workdir, "prompts.jsonl")
+    try:
+        start = time.perf_counter()
+        write_prompts(path, args.prompts, args.systems)
+        print(f"wrote {args.prompts:,} prompts ({os.path.getsize(path) / 2**20:,.0f} MiB) in {time.perf_counter() - start:.0f}s")
+
+        for budget in (PREFIX_TREE_MEMORY_BYTES, PREFIX_TREE_MEMORY_BYTES // 4):
+            report = estimate_log(path, MODEL_RATES, encode_ids, memory_budget=budget)
+            results = report.frame()
+            tokens = results["Prompt tokens"].sum()
+            print(f"\nbudget {budget / 2**20:,.0f} MiB: {report.prompts_per_second:,.0f} prompts/s "
+                  f"({tokens / report.seconds:,.0f} tokens/s), {report.nodes:,} nodes, "
+                  f"{report.stored_tokens:,} tokens stored of {tokens:,}, {report.memory_bytes / 2**20:,.0f} MiB, "
+                  f"{report.truncated:,} prompts not added")
+            print(results.to_string(index=False, float_format=lambda v: f"{v:,.3f}"))
+        print(f"peak resident memory {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:,.0f} MiB")
+
+        with open(path, encoding="utf-8") as f:
+            texts = [json.loads(next(f))["prompt"] for _ in range(min(args.prompts, 2000))]
+        start = time.perf_counter()
+        pieces = sum(map(len, TokenCounter(None).token_ids(texts)))
+        print(f"tokenizer-free fallback: {pieces / (time.perf_counter() - start):,.0f} tokens/s")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
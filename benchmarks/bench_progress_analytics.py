@@ -0,0 +1,70 @@
+"""Measure the cost of cross-user progress counters on the checkbox path and the admin view.
+
+Simulates learners toggling sections through the debounced progress writer
+with the counter hook attached, then compares reading the running counters
+(what the admin view does) with rebuilding them from every record.
+
+    python -m benchmarks.bench_progress_analytics [--learners 20000]
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from utils.progress_analytics import CounterStore, rebuild_counters
+from utils.progress_store import DebouncedProgressWriter, ProgressStore
+from utils.section_registry import READING_GROUPS, group_sections
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--learners", type=int, default=20_000)
+    parser.add_argument("--toggles", type=int, default=5, help="section toggles per learner")
+    args = parser.parse_args()
+
+    rng = random.Random(5)
+    groups = list(READING_GROUPS)
+    with tempfile.TemporaryDirectory() as root:
+        store = ProgressStore(os.path.join(root, "progress"))
+        counter_store = CounterStore(os.path.join(root, "progress_counters.json"))
+        hook_ms = []
+
+        def on_write(changes):
+            start = time.perf_counter()
+            counter_store.apply(changes)
+            hook_ms.append((time.perf_counter() - start) * 1000)
+
+        writer = DebouncedProgressWriter(store, delay=0.05, on_write=on_write)
+        submit_us = []
+        start = time.perf_counter()
+        for learner in range(args.learners):
+            user_id = f"learner{learner}"
+            group = rng.choice(groups)
+            bits = 0
+            for _ in range(args.toggles):
+                bits ^= 1 << rng.choice(group_sections(group))[0]
+                t0 = time.perf_counter()
+                writer.submit(user_id, group, bits)
+                submit_us.append((time.perf_counter() - t0) * 1e6)
+        writer.close(timeout=600)
+        elapsed = time.perf_counter() - start
+
+        submit_us.sort()
+        print(f"{args.learners} learners, {len(submit_us)} toggles in {elapsed:.1f}s; {writer.written} record writes")
+        print(f"checkbox path (submit): median {statistics.median(submit_us):.1f} us, "
+              f"p99 {submit_us[int(len(submit_us) * 0.99)]:.1f} us")
+        print(f"counter update per batch (writer thread): median {statistics.median(hook_ms):.2f} ms "
+              f"over {len(hook_ms)} batches")
+
+        start = time.perf_counter()
+        running = counter_store.load()
+        load_ms = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        rebuilt = rebuild_counters(store)
+        rebuild_ms = (time.perf_counter() - start) * 1000
+        print(f"admin view: running counters {load_ms:.2f} ms vs full rebuild {rebuild_ms:.0f} ms "
+              f"({'consistent' if rebuilt == running else 'MISMATCH'})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Measure the stat-validated progress cache against re-reading records from disk.
+
+Times `ProgressStore.load`, which every page start and every save performs,
+with the cache enabled and disabled (`cache_size=0`), from one thread and
+from several threads standing in for concurrent sessions. Then checks that a
+write from another store instance is seen on the next load.
+
+    python -m benchmarks.bench_progress_cache [--users 1000] [--threads 8]
+"""
+import argparse
+import os
+import random
+import tempfile
+import threading
+import time
+
+from utils.progress_store import ProgressStore, apply_pages, decode_record
+from utils.section_registry import bits_from_titles
+
+RECORD = {
+    "prompt_read_sections": ["Introduction to Prompt Engineering", "Types of Prompts"],
+    "temperature_read_sections": ["What is Temperature?", "Final Takeaway"],
+}
+
+def run_loads(store, users, loads, threads):
+    """Return microseconds per load with `threads` threads sharing `loads` loads."""
+    per_thread = loads // threads
+
+    def worker(seed):
+        rng = random.Random(seed)
+        for _ in range(per_thread):
+            store.load(f"user{rng.randrange(users)}")
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    start = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return (time.perf_counter() - start) / (per_thread * threads) * 1e6
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=1_000)
+    parser.add_argument("--loads", type=int, default=100_000)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        seeder = ProgressStore(os.path.join(root, "progress"), cache_size=0)
+        for i in range(args.users):
+            seeder.save(f"user{i}", RECORD)
+
+        print(f"{'':<10} {'1 thread us/load':>18} {f'{args.threads} threads us/load':>20}")
+        for label, cache_size in (("uncached", 0), ("cached", args.users)):
+            store = ProgressStore(os.path.join(root, "progress"), cache_size=cache_size)
+            run_loads(store, args.users, args.users * 2, 1)  # warm the cache
+            single = run_loads(store, args.users, args.loads, 1)
+            threaded = run_loads(store, args.users, args.loads, args.threads)
+            print(f"{label:<10} {single:>18.1f} {threaded:>20.1f}")
+
+        # An external write must be picked up on the next load
+        store = ProgressStore(os.path.join(root, "progress"))
+        store.load("user0")
+        pages = {"prompt_read_sections": bits_from_titles(["Types of Prompts"])}
+        seeder.update("user0", pages)
+        assert store.load("user0") == apply_pages(decode_record(RECORD), pages), "stale cache entry"
+        print("external write invalidated the cached record")
+
+if __name__ == "__main__":
+    main()
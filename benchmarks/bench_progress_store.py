@@ -0,0 +1,62 @@
+"""Compare progress save latency as the number of users grows.
+
+For each user count, seeds that many users' progress, then times a
+load-and-save of one user's page through the sharded per-user store and
+through the legacy single `progress.json` holding every user.
+
+    python -m benchmarks.bench_progress_store [--users 100 1000 10000]
+"""
+import argparse
+import json
+import os
+import statistics
+import tempfile
+import time
+
+from utils.progress_store import ProgressStore
+from utils.section_registry import bits_from_titles
+
+RECORD = {
+    "prompt_read_sections": ["Introduction to Prompt Engineering", "Types of Prompts", "Vague vs. Clear Examples"],
+    "ethics_read_sections": ["Types of Bias", "Why Bias Happens"],
+}
+
+def legacy_save(path, user_id, page_key, sections):
+    with open(path) as f:
+        data = json.load(f)
+    data.setdefault(user_id, {})[page_key] = sorted(sections)
+    with open(path, "w") as f:
+        json.dump(data, f)
+
+def median_ms(run, repeats):
+    timings = []
+    for i in range(repeats):
+        start = time.perf_counter()
+        run(i)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, nargs="+", default=[100, 1_000, 10_000])
+    parser.add_argument("--repeats", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{'users':>8} {'sharded ms':>12} {'legacy ms':>12}")
+    for users in args.users:
+        with tempfile.TemporaryDirectory() as root:
+            store = ProgressStore(os.path.join(root, "progress"))
+            for i in range(users):
+                store.save(f"user{i}", RECORD)
+            legacy_path = os.path.join(root, "progress.json")
+            with open(legacy_path, "w") as f:
+                json.dump({f"user{i}": RECORD for i in range(users)}, f)
+
+            sections = RECORD["prompt_read_sections"]
+            bits = bits_from_titles(sections)
+            sharded = median_ms(lambda i: store.update(f"user{i % users}", {"prompt_read_sections": bits}), args.repeats)
+            legacy = median_ms(lambda i: legacy_save(legacy_path, f"user{i % users}", "prompt_read_sections", sections), args.repeats)
+            print(f"{users:>8} {sharded:>12.3f} {legacy:>12.3f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Per-rerun CPU time and memory allocation of each page's script run.
+
+Each page is rendered in an AppTest session and then rerun repeatedly, as
+happens whenever a visitor interacts with a widget. CPU time is measured
+with `time.process_time` (all threads), allocations in a separate pass with
+`tracemalloc` (bytes allocated during the rerun and its peak).
+
+    python -m benchmarks.bench_render [--pages Home Glossary] [--reruns 20]
+"""
+import argparse
+import os
+import shutil
+import statistics
+import tempfile
+import time
+import tracemalloc
+
+from streamlit.testing.v1 import AppTest
+
+from config import PAGE_MODULES
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def new_session(module):
+    app = AppTest.from_string(
+        f"import importlib; importlib.import_module({module!r}).render()", default_timeout=120
+    )
+    app.secrets["ADMIN_PASSPHRASE"] = "benchmark"
+    app.run()
+    return app
+
+def cpu_ms_per_rerun(module, reruns):
+    app = new_session(module)
+    timings = []
+    for _ in range(reruns):
+        start = time.process_time()
+        app.run()
+        timings.append((time.process_time() - start) * 1000)
+    return statistics.median(timings)
+
+def allocation_per_rerun(module, reruns):
+    app = new_session(module)
+    allocated, peaks = [], []
+    tracemalloc.start()
+    try:
+        for _ in range(reruns):
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            snapshot = tracemalloc.take_snapshot()
+            app.run()
+            stats = tracemalloc.take_snapshot().compare_to(snapshot, "filename")
+            allocated.append(sum(stat.size_diff for stat in stats if stat.size_diff > 0))
+            peaks.append(tracemalloc.get_traced_memory()[1] - before)
+    finally:
+        tracemalloc.stop()
+    return statistics.median(allocated), statistics.median(peaks)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", nargs="+", default=[page for page in PAGE_MODULES if page != "Feedback"])
+    parser.add_argument("--reruns", type=int, default=20)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp()
+    shutil.copy(os.path.join(REPO_ROOT, "style.css"), workdir)
+    os.chdir(workdir)
+    try:
+        print(f"{'page':<24} {'cpu ms/rerun':>13} {'retained KiB':>13} {'peak KiB':>10}")
+        for page in args.pages:
+            module = PAGE_MODULES[page]
+            cpu = cpu_ms_per_rerun(module, args.reruns)
+            allocated, peak = allocation_per_rerun(module, max(3, args.reruns // 4))
+            print(f"{page:<24} {cpu:>13.2f} {allocated / 1024:>13.1f} {peak / 1024:>10.1f}")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Cold-start and first-render latency per page, with a regression budget.
+
+Each page is measured in fresh interpreters, from a scratch working
+directory:
+
+* `python -X importtime` with streamlit already imported reports what the
+  page module itself pulls in (the cumulative time of its import line).
+* A harness times interpreter start to page imported (cold start), then
+  the page's first `render()` under Streamlit's AppTest, and records which
+  heavy third-party modules the import loaded.
+
+The run fails (exit 1) if a page's import exceeds its budget or loads a
+heavy module it is not allowed to, so a regression that re-adds an eager
+import is caught.
+
+    python -m benchmarks.bench_startup [--repeats 3] [--scale 1.0]
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from config import PAGE_MODULES
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ("pandas", "numpy", "pyarrow", "fpdf", "PIL", "sklearn", "transformers")
+
+# Import budget in ms beyond streamlit itself, and heavy modules a page may load
+DEFAULT_BUDGET_MS = 150
+PAGE_BUDGET_MS = {"Feedback": 1500}
+ALLOWED_HEAVY = {"Feedback": {"pandas", "numpy", "pyarrow"}}  # pandas loads pyarrow when installed
+
+HARNESS = """
+import json, sys, time
+start = float(sys.argv[2])
+import importlib, streamlit
+module = importlib.import_module(sys.argv[1])
+imported = time.time()
+heavy = [name for name in sys.argv[3].split(",") if name in sys.modules]
+from streamlit.testing.v1 import AppTest
+app = AppTest.from_string(f"import importlib; importlib.import_module({sys.argv[1]!r}).render()", default_timeout=120)
+t0 = time.perf_counter()
+app.run()
+print(json.dumps({
+    "cold_start_ms": (imported - start) * 1000,
+    "first_render_ms": (time.perf_counter() - t0) * 1000,
+    "heavy": heavy,
+    "errors": [str(e.value) for e in app.exception],
+}))
+"""
+
+def run(args, cwd):
+    env = {**os.environ, "PYTHONPATH": REPO_ROOT}
+    return subprocess.run(args, cwd=cwd, env=env, capture_output=True, text=True, check=True)
+
+def import_time_ms(module, cwd):
+    """Cumulative import time of `module` from -X importtime, with streamlit preloaded."""
+    result = run([sys.executable, "-X", "importtime", "-c", f"import streamlit; import {module}"], cwd)
+    for line in result.stderr.splitlines():
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip() == module:
+            return int(parts[1]) / 1000
+    raise RuntimeError(f"{module} missing from -X importtime output")
+
+def measure(module, cwd):
+    result = run([sys.executable, "-c", HARNESS, module, repr(time.time()), ",".join(HEAVY_MODULES)], cwd)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply every budget, e.g. on slow CI machines")
+    parser.add_argument("--pages", nargs="+", default=list(PAGE_MODULES))
+    args = parser.parse_args()
+
+    failures = []
+    print(f"{'page':<24} {'import ms':>10} {'budget':>8} {'cold start ms':>14} {'first render ms':>16}  heavy modules")
+    with tempfile.TemporaryDirectory() as cwd:
+        shutil.copy(os.path.join(REPO_ROOT, "style.css"), cwd)
+        os.makedirs(os.path.join(cwd, ".streamlit"))
+        with open(os.path.join(cwd, ".streamlit", "secrets.toml"), "w") as f:
+            f.write('ADMIN_PASSPHRASE = "benchmark"\n')
+        for page in args.pages:
+            module = PAGE_MODULES[page]
+            imports = statistics.median(import_time_ms(module, cwd) for _ in range(args.repeats))
+            runs = [measure(module, cwd) for _ in range(args.repeats)]
+            cold = statistics.median(r["cold_start_ms"] for r in runs)
+            render = statistics.median(r["first_render_ms"] for r in runs)
+            heavy = sorted(set().union(*(r["heavy"] for r in runs)))
+            budget = PAGE_BUDGET_MS.get(page, DEFAULT_BUDGET_MS) * args.scale
+            print(f"{page:<24} {imports:>10.1f} {budget:>8.0f} {cold:>14.1f} {render:>16.1f}  {', '.join(heavy) or '-'}")
+
+            if imports > budget:
+                failures.append(f"{page}: import took {imports:.0f} ms, budget {budget:.0f} ms")
+            unexpected = set(heavy) - ALLOWED_HEAVY.get(page, set())
+            if unexpected:
+                failures.append(f"{page}: imports {', '.join(sorted(unexpected))} at startup")
+            for error in runs[0]["errors"]:
+                failures.append(f"{page}: render raised {error}")
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    if failures:
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
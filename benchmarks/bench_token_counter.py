@@ -0,0 +1,77 @@
+"""Measure token-counting throughput: one prompt per call vs one batched call.
+
+Without --tokenizer-dir, a byte-level BPE tokenizer is trained on the
+synthetic prompts and saved to a temporary directory, so the transformers
+code path runs offline. Each mode starts from an empty count cache; a final
+pass repeats the batch against the warm cache. Batching saves per-call
+overhead and lets the Rust tokenizer use every core.
+
+    python -m benchmarks.bench_token_counter [--prompts 20000] [--tokenizer-dir path]
+"""
+import argparse
+import os
+import random
+import shutil
+import tempfile
+import time
+
+from benchmarks.bench_feedback_search import VOCABULARY
+from utils.token_counter import TokenCounter, estimate_tokens
+
+def synthetic_prompts(count, min_words=40, max_words=400, seed=3):
+    rng = random.Random(seed)
+    words = VOCABULARY + ["the", "a", "of", "to", "and", "for", "with", "our", "users", "2025", "1,200", "(draft)"]
+    for i in range(count):
+        body = " ".join(rng.choices(words, k=rng.randint(min_words, max_words)))
+        yield f"You are a helpful assistant for a startup. Request #{i}: {body}."
+
+def train_tokenizer(texts, directory):
+    from tokenizers import Tokenizer, decoders, models, pre_tokenizers, trainers
+    from transformers import PreTrainedTokenizerFast
+
+    tokenizer = Tokenizer(models.BPE())
+    tokenizer.pre_tokenizer = pre_tokenizers.ByteLevel(add_prefix_space=False)
+    tokenizer.decoder = decoders.ByteLevel()
+    trainer = trainers.BpeTrainer(vocab_size=2000, initial_alphabet=pre_tokenizers.ByteLevel.alphabet())
+    tokenizer.train_from_iterator(texts, trainer)
+    PreTrainedTokenizerFast(tokenizer_object=tokenizer).save_pretrained(directory)
+
+def rate(count, action):
+    start = time.perf_counter()
+    action()
+    return count / (time.perf_counter() - start)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--prompts", type=int, default=20_000)
+    parser.add_argument("--tokenizer-dir")
+    args = parser.parse_args()
+
+    workdir = None
+    tokenizer_dir = args.tokenizer_dir
+    if tokenizer_dir is None:
+        workdir = tempfile.mkdtemp()
+        tokenizer_dir = os.path.join(workdir, "bpe-2k")
+        train_tokenizer(synthetic_prompts(2000), tokenizer_dir)
+    try:
+        start = time.perf_counter()
+        TokenCounter(tokenizer_dir)
+        print(f"tokenizer loaded in {time.perf_counter() - start:.2f}s")
+        print(f"{'prompts':<8} {'mode':<24} {'prompts/s':>12}")
+        for label, words in (("short", (5, 40)), ("long", (40, 400))):
+            prompts = list(synthetic_prompts(args.prompts, *words))
+            single = TokenCounter(tokenizer_dir, cache_size=len(prompts))
+            batched = TokenCounter(tokenizer_dir, cache_size=len(prompts))
+            for mode, action in (
+                ("single", lambda: [single.count(prompt) for prompt in prompts]),
+                ("batched", lambda: batched.count_batch(prompts)),
+                ("batched, cached", lambda: batched.count_batch(prompts)),
+                ("estimate (no tokenizer)", lambda: [estimate_tokens(prompt) for prompt in prompts]),
+            ):
+                print(f"{label:<8} {mode:<24} {rate(len(prompts), action):>12,.0f}")
+    finally:
+        if workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Measure usage-log analysis throughput and peak memory, streamed vs loaded whole.
+
+Writes a synthetic CSV or JSONL log, then prices it three ways: the streaming
+analyzer in-process, the streaming analyzer over a process pool, and a
+single pandas read of the whole file. Peak memory is the traced Python/NumPy
+peak of this process, so the pool workers' own memory is not included.
+
+    python -m benchmarks.bench_usage_logs [--rows 2000000] [--format csv] [--workers 4]
+"""
+import argparse
+import json
+import os
+import random
+import shutil
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+from config import MODEL_RATES, USAGE_LOG_BLOCK_BYTES
+from utils.usage_logs import analyze_log, log_format, parse_block, price, summarize_frame
+
+ENDPOINTS = ["/chat", "/summarize", "/classify", "/embed"]
+
+def write_log(path, rows, seed=5, batch=100_000):
+    rng = random.Random(seed)
+    models = list(MODEL_RATES)
+    with open(path, "w", encoding="utf-8") as f:
+        if log_format(path) == "csv":
+            f.write("timestamp,model,endpoint,prompt_tokens,completion_tokens\n")
+        for first in range(0, rows, batch):
+            lines = []
+            for i in range(first, min(first + batch, rows)):
+                record = (
+                    f"2025-{1 + i * 12 // rows:02d}-{1 + i % 28:02d}T{i % 24:02d}:00:00Z",
+                    rng.choice(models), rng.choice(ENDPOINTS), rng.randint(50, 4000), rng.randint(50, 2000),
+                )
+                if log_format(path) == "csv":
+                    lines.append(",".join(map(str, record)))
+                else:
+                    lines.append(json.dumps(dict(zip(
+                        ("timestamp", "model", "endpoint", "prompt_tokens", "completion_tokens"), record
+                    ))))
+            f.write("\n".join(lines) + "\n")
+
+def load_whole(path):
+    with open(path, "rb") as f:
+        summary, rows, _ = summarize_frame(parse_block(f.read(), log_format(path)))
+    return price(summary, MODEL_RATES), rows
+
+def traced(action):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = action()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak / 2**20
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--format", choices=["csv", "jsonl"], default="csv")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--block-mib", type=int, default=USAGE_LOG_BLOCK_BYTES // 2**20)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp()
+    path = os.path.join(workdir, f"usage.{args.format}")
+    try:
+        write_log(path, args.rows)
+        size = os.path.getsize(path) / 2**20
+        print(f"{args.rows:,} rows, {size:,.0f} MiB {args.format}, {args.block_mib} MiB blocks")
+        print(f"{'mode':<28} {'rows/s':>12} {'MiB/s':>8} {'peak MiB':>9} {'total $':>14}")
+        block_bytes = args.block_mib * 2**20
+        with ProcessPoolExecutor(args.workers) as pool:
+            pool.submit(int).result()  # start the workers before timing
+            for mode, action in (
+                ("streamed, in-process", lambda: analyze_log(path, MODEL_RATES, None, block_bytes)),
+                (f"streamed, {args.workers} workers", lambda: analyze_log(path, MODEL_RATES, pool, block_bytes)),
+                ("whole file in pandas", lambda: load_whole(path)),
+            ):
+                result, elapsed, peak = traced(action)
+                daily = result.daily if hasattr(result, "daily") else result[0]
+                print(f"{mode:<28} {args.rows / elapsed:>12,.0f} {size / elapsed:>8.1f} {peak:>9.0f} "
+                      f"{daily['cost'].sum():>14,.2f}")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Bytes the server sends over the websocket per page run and per rerun.
+
+Each page is rendered in an AppTest session and rerun repeatedly; every
+ForwardMsg the script run enqueues is serialised and counted, as the
+server would write it to the browser. Messages at or above Streamlit's
+`global.minCachedMessageSize` that the session has already received are
+counted as a cache reference, mirroring the server's message cache.
+
+    python -m benchmarks.bench_websocket [--pages Home Glossary] [--reruns 10]
+"""
+import argparse
+import hashlib
+import os
+import shutil
+import statistics
+import tempfile
+
+from streamlit import config as st_config
+from streamlit.runtime.forward_msg_queue import ForwardMsgQueue
+from streamlit.testing.v1 import AppTest
+
+from config import PAGE_MODULES
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CACHE_REFERENCE_BYTES = 64  # a cached message is re-sent as its hash
+
+class WireCounter:
+    """Counts serialised ForwardMsg bytes enqueued by script runs."""
+
+    def __init__(self):
+        self.bytes = 0
+        self.seen = set()
+        self.min_cached = st_config.get_option("global.minCachedMessageSize")
+        original = ForwardMsgQueue.enqueue
+
+        def enqueue(queue, msg):
+            payload = msg.SerializeToString()
+            if len(payload) >= self.min_cached:
+                digest = hashlib.sha1(payload).digest()
+                if digest in self.seen:
+                    self.bytes += CACHE_REFERENCE_BYTES
+                    return original(queue, msg)
+                self.seen.add(digest)
+            self.bytes += len(payload)
+            return original(queue, msg)
+
+        ForwardMsgQueue.enqueue = enqueue
+
+    def run(self, app) -> int:
+        start = self.bytes
+        app.run()
+        return self.bytes - start
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", nargs="+", default=list(PAGE_MODULES))
+    parser.add_argument("--reruns", type=int, default=10)
+    args = parser.parse_args()
+
+    counter = WireCounter()
+    workdir = tempfile.mkdtemp()
+    shutil.copy(os.path.join(REPO_ROOT, "style.css"), workdir)
+    os.chdir(workdir)
+    try:
+        print(f"{'page':<24} {'first run B':>12} {'bytes/rerun':>12}")
+        for page in args.pages:
+            counter.seen.clear()
+            app = AppTest.from_string(
+                f"import importlib; importlib.import_module({PAGE_MODULES[page]!r}).render()", default_timeout=120
+            )
+            app.secrets["ADMIN_PASSPHRASE"] = "benchmark"
+            first = counter.run(app)
+            rerun = statistics.median(counter.run(app) for _ in range(args.reruns))
+            print(f"{page:<24} {first:>12,} {rerun:>12,.0f}")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
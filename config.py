@@ -1,11 +1,79 @@
+import os
+
 PAGE_TITLES = [
     "Home", "Prompt Engineering", "Temperature & Sampling", "Hallucinations",
     "API Cost Optimization", "Ethics & Bias", "FAQs", "Glossary", "Feedback"
 ]
 
+# Page title -> section module, imported on first visit
+PAGE_MODULES = {
+    "Home": "sections.home",
+    "Prompt Engineering": "sections.prompt",
+    "Temperature & Sampling": "sections.temperature",
+    "Hallucinations": "sections.hallucinations",
+    "API Cost Optimization": "sections.api_cost",
+    "Ethics & Bias": "sections.ethics",
+    "FAQs": "sections.faq",
+    "Glossary": "sections.glossary",
+    "Feedback": "sections.feedback",
+}
+
 EXPAND_BUTTON_VISIBLE_PAGES = [
     "Home", "Prompt Engineering", "Temperature & Sampling", "Hallucinations",
     "API Cost Optimization", "Ethics & Bias", "FAQs", "Glossary"
 ]
 
 FEEDBACK_PATH = "feedback.csv"
+
+# Feedback storage backend: "csv" (append-only journal) or "sqlite"
+FEEDBACK_BACKEND = os.environ.get("FEEDBACK_BACKEND", "csv")
+FEEDBACK_DB_PATH = os.environ.get("FEEDBACK_DB_PATH", "feedback.db")
+FEEDBACK_ROLLUPS_PATH = "feedback_rollups.json"
+# Feedback entries the write queue gave up on, one JSON object per line
+FEEDBACK_DEAD_LETTER_PATH = "feedback_dead_letter.jsonl"
+
+# Feedback attachments (content-addressed blob store)
+ATTACHMENTS_DIR = "attachments"
+ATTACHMENT_MAX_BYTES = 10 * 1024 * 1024
+ATTACHMENTS_MAX_TOTAL_BYTES = 1024 * 1024 * 1024
+
+# Near-duplicate feedback detection (MinHash/LSH over comments)
+DUPLICATE_SIMILARITY_THRESHOLD = 0.8
+DUPLICATE_MIN_CHARS = 20
+
+# Per-user reading progress, sharded by hashed user id
+PROGRESS_DIR = os.environ.get("PROGRESS_DIR", "progress")
+# Progress changes are written this many seconds after the first unsaved one
+PROGRESS_SAVE_DELAY = 1.0
+# Cross-user reading-progress counters for the admin analytics view
+PROGRESS_COUNTERS_PATH = "progress_counters.json"
+
+# Custom stylesheet, minified and cached; edits are picked up by file mtime
+STYLESHEET_PATH = "style.css"
+
+# Milliseconds the expand/collapse-all buttons wait for further clicks before syncing the server
+EXPAND_COLLAPSE_SYNC_DELAY = 300
+
+# Local Hugging Face tokenizer directory for the API Cost token counter; estimated counts if missing
+TOKENIZER_DIR = os.environ.get("TOKENIZER_DIR", "tokenizer")
+# Token counts remembered per process, keyed by a hash of the text
+TOKEN_COUNT_CACHE_SIZE = 4096
+
+# API prices in dollars per 1K tokens, shared by every cost calculation on the API Cost page
+MODEL_RATES = {
+    "GPT-3.5 Turbo": {"in": 0.0015, "out": 0.002},
+    "GPT-4 Turbo": {"in": 0.01, "out": 0.03},
+    "GPT-4 (8K)": {"in": 0.03, "out": 0.06},
+}
+# Axes of the cost-scenario grid as (start, stop, step), matching the scenario sliders; the request
+# axis steps by 10, so it also holds every value of the estimator's requests slider (step 50)
+SCENARIO_TOKEN_AXIS = (100, 4000, 100)
+SCENARIO_REQUEST_AXIS = (10, 5000, 10)
+
+# Usage-log analyzer: server directory listed for analysis, bytes parsed per block, worker processes
+USAGE_LOG_DIR = os.environ.get("USAGE_LOG_DIR", "usage_logs")
+USAGE_LOG_BLOCK_BYTES = 32 * 1024 * 1024
+USAGE_LOG_WORKERS = os.cpu_count() or 1
+
+# Prefix-caching estimator: bytes its per-model prefix trees may hold before they stop growing
+PREFIX_TREE_MEMORY_BYTES = 256 * 1024 * 1024
@@ -1,11 +1,8 @@
+import importlib
 import streamlit as st
 from streamlit_option_menu import option_menu
-from config import PAGE_TITLES
+from config import PAGE_TITLES, PAGE_MODULES
 from utils.helpers import init_session_state
-from sections import (
-    home, prompt, temperature, hallucinations,
-    api_cost, ethics, faq, glossary, feedback
-)
 
 # Page setup
 st.set_page_config(page_title="LLM Guide for Startups", layout="wide")
@@ -33,20 +30,11 @@ with st.sidebar:
         }
     )
 
-# Route to correct page
-PAGE_RENDERERS = {
-    "Home": home,
-    "Prompt Engineering": prompt,
-    "Temperature & Sampling": temperature,
-    "Hallucinations": hallucinations,
-    "API Cost Optimization": api_cost,
-    "Ethics & Bias": ethics,
-    "FAQs": faq,
-    "Glossary": glossary,
-    "Feedback": feedback,
-}
-
-if selected_page in PAGE_RENDERERS:
-    PAGE_RENDERERS[selected_page].render()
+# Route to correct page; a section module is imported the first time its page is opened
+if selected_page in PAGE_MODULES:
+    importlib.import_module(PAGE_MODULES[selected_page]).render()
 else:
     st.error("⚠️ Page not found.")
+
+# Saves skipped because the page was unchanged or folded into a pending write
+st.sidebar.caption(f"Progress writes avoided this session: {st.session_state.get('progress_writes_avoided', 0)}")
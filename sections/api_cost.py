@@ -1,204 +1,357 @@
 import streamlit as st
-from datetime import datetime  # Import datetime for the footer
+from config import MODEL_RATES
+from utils.content_registry import register_page
 from utils.helpers import (
-    display_expand_collapse_controls,
-    expander_section,
-    reset_expansion_state,
-    reset_expand_collapse_triggers,
-    reset_progress,
-    save_progress,
-    load_progress, inject_custom_css
+    analyze_usage_log, estimate_prefix_caching, get_cost_grid, get_token_counter, list_usage_logs,
+    simulate_response_cache
 )
+from utils.section_page import SectionPage, render_section_page
+from utils.token_counter import split_prompts
 
-PROGRESS_FILE = "progress.json"
+# --- Define sections for progress tracking ---
+API_COST_SECTIONS = register_page("api_cost", {
+    "What Is API Cost?": (
+        "When you use a language model like GPT-3.5 or GPT-4 through an API, you’re charged based on how many tokens you send and receive.\n\n"
+        "A **token** is typically 3–4 characters or about 1 word. You are billed for both the prompt you send and the response the model generates.\n\n"
+        "Different models have different pricing structures:\n\n"
+        "| Model         | Input (per 1K tokens) | Output (per 1K tokens) |\n"
+        "|---------------|-----------------------|------------------------|\n"
+        "| GPT-3.5 Turbo | $0.0015               | $0.002                 |\n"
+        "| GPT-4 Turbo   | $0.01                 | $0.03                  |\n"
+        "| GPT-4 (8K)    | $0.03                 | $0.06                  |"
+    ),
+    "Why API Costs Matter": (
+        "Using large language models can get expensive quickly — especially if your product sends long prompts or handles frequent requests.\n\n"
+        "For example:\n"
+        "- Daily chat summaries for users\n"
+        "- Auto-generating blog content\n"
+        "- AI customer support\n\n"
+        "Managing cost ensures your startup scales **sustainably**."
+    ),
+    "What Drives Cost": (
+        "- **Token usage** – You pay per word/token (input + output combined).\n"
+        "- **Model selection** – GPT-4 is significantly more expensive than GPT-3.5.\n"
+        "- **Request frequency** – High-volume traffic means higher cost.\n"
+        "- **Prompt design** – Long prompts or unnecessary verbosity waste tokens."
+    ),
+    "Optimization Strategies": (
+        "1. **Shorten prompts**: Cut boilerplate or redundant phrasing.\n"
+        "2. **Use cheaper models**: GPT-3.5 for summaries, formatting, etc.\n"
+        "3. **Cache outputs**: Reuse LLM responses for repeated queries.\n"
+        "4. **Batch processing**: Combine inputs in a single request.\n"
+        "5. **Analyze usage logs**: Monitor which calls are most expensive."
+    ),
+    "Estimate Token Cost": (
+        "Estimate how much your startup might spend based on usage.\n\n"
+        "Paste your prompts to count their tokens, or use the sliders below, to calculate daily and monthly costs based on your API usage."
+    ),
+    "Compare Cost Scenarios": (
+        "See the daily cost of every combination of prompt length, response length and traffic at once, "
+        "and how many requests a pricier model can serve for the same spend."
+    ),
+    "Analyze Usage Logs": (
+        "Upload your API usage log (CSV or JSONL with `timestamp`, `model`, `prompt_tokens`, `completion_tokens` "
+        "and optionally `endpoint`) to see what it cost per day, month, model and endpoint at the rates above."
+    ),
+    "Simulate Response Caching": (
+        "Replay a request log (the usage-log columns plus the `prompt` text, in time order) through different response caches "
+        "to see how many calls, tokens and dollars each would have saved. Prompts are compared by hash, never stored."
+    ),
+    "Estimate Prefix Caching": (
+        "Many prompts start with the same long system prompt. Providers cache such shared prefixes and bill them "
+        "at a discount. Replay a request log's prompts (`model` and `prompt` columns, in time order) to see how much "
+        "of each prompt an earlier one already covered and what the discount is worth per model."
+    ),
+    "Test Your Knowledge: API Costs": None  # Placeholder for the quiz
+})
 
-def render():
-    inject_custom_css()
-    current_page = "API Cost Optimization"
-    st.title("API Cost Optimization")
-    display_expand_collapse_controls(current_page)
-
-    # --- Load progress from file ---
-    if "api_cost_read_sections" not in st.session_state:
-        progress_data = load_progress()
-        st.session_state["api_cost_read_sections"] = set(progress_data.get("api_cost_read_sections", []))
-        
-    # --- Define sections for progress tracking ---
-    api_sections = {
-        "What Is API Cost?": (
-            "When you use a language model like GPT-3.5 or GPT-4 through an API, you’re charged based on how many tokens you send and receive.\n\n"
-            "A **token** is typically 3–4 characters or about 1 word. You are billed for both the prompt you send and the response the model generates.\n\n"
-            "Different models have different pricing structures:\n\n"
-            "| Model         | Input (per 1K tokens) | Output (per 1K tokens) |\n"
-            "|---------------|-----------------------|------------------------|\n"
-            "| GPT-3.5 Turbo | $0.0015               | $0.002                 |\n"
-            "| GPT-4 Turbo   | $0.01                 | $0.03                  |\n"
-            "| GPT-4 (8K)    | $0.03                 | $0.06                  |"
-        ),
-        "Why API Costs Matter": (
-            "Using large language models can get expensive quickly — especially if your product sends long prompts or handles frequent requests.\n\n"
-            "For example:\n"
-            "- Daily chat summaries for users\n"
-            "- Auto-generating blog content\n"
-            "- AI customer support\n\n"
-            "Managing cost ensures your startup scales **sustainably**."
-        ),
-        "What Drives Cost": (
-            "- **Token usage** – You pay per word/token (input + output combined).\n"
-            "- **Model selection** – GPT-4 is significantly more expensive than GPT-3.5.\n"
-            "- **Request frequency** – High-volume traffic means higher cost.\n"
-            "- **Prompt design** – Long prompts or unnecessary verbosity waste tokens."
-        ),
-        "Optimization Strategies": (
-            "1. **Shorten prompts**: Cut boilerplate or redundant phrasing.\n"
-            "2. **Use cheaper models**: GPT-3.5 for summaries, formatting, etc.\n"
-            "3. **Cache outputs**: Reuse LLM responses for repeated queries.\n"
-            "4. **Batch processing**: Combine inputs in a single request.\n"
-            "5. **Analyze usage logs**: Monitor which calls are most expensive."
+def cost_estimator(content):
+    model_choice = st.selectbox(
+        "Choose your model",
+        list(MODEL_RATES)
+    )
+
+    pasted = st.text_area(
+        "Paste your prompt (optional)",
+        placeholder="Separate several prompts with a line containing only ---",
+    )
+    prompts = split_prompts(pasted)
+    if prompts:
+        counter = get_token_counter()
+        counts = counter.count_batch(prompts)
+        tokens_in = round(sum(counts) / len(counts))
+        source = f"tokenizer `{counter.name}`" if counter.exact else "an estimate (no local tokenizer found)"
+        st.caption(f"{len(prompts)} prompt(s), **{tokens_in:,}** tokens on average, counted with {source}.")
+    else:
+        tokens_in = st.slider("Prompt tokens per request", 100, 4000, step=100, value=500)
+    tokens_out = st.slider("Response tokens per request", 100, 4000, step=100, value=500)
+    requests_per_day = st.slider("Number of requests per day", 10, 5000, step=50, value=1000)
+
+    rate = MODEL_RATES[model_choice]
+    daily_cost = ((tokens_in * rate["in"] + tokens_out * rate["out"]) / 1000) * requests_per_day
+    monthly_cost = daily_cost * 30
+
+    st.info(f"**Estimated Daily Cost:** ${daily_cost:,.2f}")
+    st.success(f"**Estimated Monthly Cost:** ${monthly_cost:,.2f}")
+
+def cost_scenarios(content):
+    import altair as alt
+    import numpy as np
+    import pandas as pd
+
+    st.markdown(content)
+    grid = get_cost_grid()
+    col_model, col_requests = st.columns(2)
+    with col_model:
+        model = st.selectbox("Model", grid.models, key="scenario_model")
+    with col_requests:
+        requests_per_day = st.slider("Requests per day", 10, 5000, step=10, value=1000, key="scenario_requests")
+
+    # --- Heatmap: daily cost over prompt x response tokens ---
+    tokens_in, tokens_out = np.meshgrid(grid.tokens_in, grid.tokens_out, indexing="ij")
+    heatmap = pd.DataFrame({
+        "Prompt tokens": tokens_in.ravel(),
+        "Response tokens": tokens_out.ravel(),
+        "Daily cost ($)": grid.cost_map(model, requests_per_day).ravel(),
+    })
+    st.altair_chart(
+        alt.Chart(heatmap).mark_rect().encode(
+            x=alt.X("Prompt tokens:O", axis=alt.Axis(values=list(range(500, 4001, 500)))),
+            y=alt.Y("Response tokens:O", sort="descending", axis=alt.Axis(values=list(range(500, 4001, 500)))),
+            color=alt.Color("Daily cost ($):Q", scale=alt.Scale(scheme="viridis")),
+            tooltip=["Prompt tokens", "Response tokens", alt.Tooltip("Daily cost ($):Q", format="$,.2f")],
         ),
-        "Estimate Token Cost": (
-            "Estimate how much your startup might spend based on usage.\n\n"
-            "Use the sliders below to calculate daily and monthly costs based on your API usage."
+        width="stretch",
+    )
+
+    # --- Break-even: requests/day matching the chosen model's spend ---
+    tokens_out_fixed = st.slider("Response tokens for the break-even curves", 100, 4000, step=100, value=500, key="scenario_tokens_out")
+    volumes = grid.break_even_requests(model, tokens_out_fixed, requests_per_day)
+    curves = pd.DataFrame(volumes.T, columns=list(grid.models))
+    curves.insert(0, "Prompt tokens", grid.tokens_in)
+    curves = curves.melt("Prompt tokens", var_name="Model", value_name="Requests per day")
+    st.altair_chart(
+        alt.Chart(curves).mark_line().encode(
+            x="Prompt tokens:Q",
+            y=alt.Y("Requests per day:Q", scale=alt.Scale(type="log")),
+            color="Model:N",
+            tooltip=["Model", "Prompt tokens", alt.Tooltip("Requests per day:Q", format=",.0f")],
         ),
-        "Test Your Knowledge: API Costs": None  # Placeholder for the quiz
-    }
-
-    # --- Sub-topic selector ---
-    col_left, col_right = st.columns([3, 1])
-    with col_left:
-        st.markdown("### Build Smart, Spend Smarter")
-    with col_right:
-        cost_subtopic = st.selectbox(
-            "Sub-topic",
-            ["All"] + list(api_sections.keys()),
-            key="api_cost_subtopic"
+        width="stretch",
+    )
+    st.caption(
+        f"Each line is the traffic at which a model costs as much as **{model}** at "
+        f"{requests_per_day:,} requests/day. Grid: {grid.size:,} scenarios."
+    )
+
+def _log_source(key_prefix: str):
+    """Uploaded log, or the name of a log stored on the server, or None."""
+    uploaded = st.file_uploader("Upload a log", type=["csv", "jsonl", "ndjson", "json"], key=f"{key_prefix}_upload")
+    server_logs = list_usage_logs()
+    server_log = None
+    if server_logs:
+        server_log = st.selectbox("...or use a log stored on the server", ["--"] + server_logs, key=f"{key_prefix}_name")
+    return uploaded or (server_log if server_log not in (None, "--") else None)
+
+def usage_log_analyzer(content):
+    st.markdown(content)
+    source = _log_source("usage_log")
+    if st.button("Analyze log", key="usage_log_run", disabled=source is None):
+        bar = st.progress(0.0, text="Reading log...")
+        try:
+            st.session_state["usage_report"] = analyze_usage_log(
+                source, progress=lambda done: bar.progress(done, text=f"Reading log... {done:.0%}")
+            )
+        except Exception as e:
+            st.error(f"Error analyzing usage log: {e}")
+        bar.empty()
+
+    report = st.session_state.get("usage_report")
+    if report is None:
+        return
+    rows_col, speed_col, cost_col = st.columns(3)
+    rows_col.metric("Rows analyzed", f"{report.rows:,}")
+    speed_col.metric("Throughput", f"{report.rows_per_second:,.0f} rows/s")
+    cost_col.metric("Total cost", f"${report.daily['cost'].sum():,.2f}")
+    if report.skipped:
+        st.caption(f"{report.skipped:,} rows without a model or timestamp were skipped.")
+    if report.unpriced_models:
+        st.warning(f"No rate for: {', '.join(report.unpriced_models)}. Their cost is left blank.")
+
+    st.markdown("#### Daily cost per model")
+    st.line_chart(report.daily.pivot_table(index="day", columns="model", values="cost", aggfunc="sum"))
+    st.markdown("#### Monthly cost per model and endpoint")
+    st.dataframe(report.monthly(), width="stretch", hide_index=True)
+
+def cache_simulator(content):
+    from utils.cache_simulator import KEY_MODES, POLICIES, CacheSettings
+
+    st.markdown(content)
+    source = _log_source("cache_log")
+    col_policies, col_keys = st.columns(2)
+    with col_policies:
+        policies = st.multiselect("Cache policies", list(POLICIES), default=list(POLICIES), key="cache_policies")
+    with col_keys:
+        key_modes = st.multiselect("Match prompts", KEY_MODES, default=list(KEY_MODES), key="cache_keys",
+                                   help="Normalized ignores case, extra spaces and trailing punctuation.")
+    col_capacity, col_ttl, col_budget = st.columns(3)
+    with col_capacity:
+        capacity = st.number_input("Cached responses", 1, 10_000_000, CacheSettings().capacity, step=1000, key="cache_capacity")
+    with col_ttl:
+        ttl_hours = st.number_input("TTL (hours)", 0.1, 24.0 * 365, CacheSettings().ttl / 3600, key="cache_ttl")
+    with col_budget:
+        token_budget = st.number_input("Size bound (completion tokens)", 1000, 10**10, CacheSettings().token_budget,
+                                       step=100_000, key="cache_token_budget")
+
+    scenarios = [(policy, mode) for policy in policies for mode in key_modes]
+    if st.button("Simulate caching", key="cache_run", disabled=source is None or not scenarios):
+        bar = st.progress(0.0, text="Replaying requests...")
+        try:
+            st.session_state["cache_report"] = simulate_response_cache(
+                source, scenarios, CacheSettings(int(capacity), ttl_hours * 3600, int(token_budget)),
+                progress=lambda done: bar.progress(done, text=f"Replaying requests... {done:.0%}"),
+            )
+        except Exception as e:
+            st.error(f"Error simulating the response cache: {e}")
+        bar.empty()
+
+    report = st.session_state.get("cache_report")
+    if report is None:
+        return
+    st.caption(f"Replayed {report.requests:,} requests in {report.seconds:.1f}s ({report.requests_per_second:,.0f}/s).")
+    results = report.frame()
+    st.dataframe(
+        results,
+        width="stretch",
+        hide_index=True,
+        column_config={
+            "Hit rate": st.column_config.NumberColumn(format="percent"),
+            "Tokens saved": st.column_config.NumberColumn(format="localized"),
+            "Dollars saved": st.column_config.NumberColumn(format="dollar"),
+            "Share of spend": st.column_config.NumberColumn(format="percent"),
+        },
+    )
+    st.bar_chart(results.assign(Scenario=results["Policy"] + " / " + results["Key"]), x="Scenario", y="Dollars saved")
+
+def prefix_cache_estimator(content):
+    from utils.prefix_cache import PrefixRules
+
+    st.markdown(content)
+    source = _log_source("prefix_log")
+    col_min, col_step, col_discount = st.columns(3)
+    with col_min:
+        min_tokens = st.number_input("Minimum cached prefix (tokens)", 1, 1_000_000, PrefixRules().min_tokens,
+                                     step=128, key="prefix_min_tokens")
+    with col_step:
+        step = st.number_input("Cached in steps of (tokens)", 1, 100_000, PrefixRules().step, key="prefix_step")
+    with col_discount:
+        discount = st.slider("Discount on cached tokens", 0, 100, int(PrefixRules().discount * 100), format="%d%%",
+                             key="prefix_discount")
+
+    if st.button("Estimate prefix caching", key="prefix_run", disabled=source is None):
+        bar = st.progress(0.0, text="Matching prompts...")
+        try:
+            st.session_state["prefix_report"] = estimate_prefix_caching(
+                source, PrefixRules(int(min_tokens), int(step), discount / 100),
+                progress=lambda done: bar.progress(done, text=f"Matching prompts... {done:.0%}"),
+            )
+        except Exception as e:
+            st.error(f"Error estimating prefix caching: {e}")
+        bar.empty()
+
+    report = st.session_state.get("prefix_report")
+    if report is None:
+        return
+    counter = get_token_counter()
+    tokens = f"tokenizer `{counter.name}`" if counter.exact else "pre-tokenizer pieces (no local tokenizer found)"
+    st.caption(
+        f"Matched {report.prompts:,} prompts in {report.seconds:.1f}s ({report.prompts_per_second:,.0f}/s), "
+        f"tokens from {tokens}. Prefix trees: {report.nodes:,} nodes, "
+        f"{report.stored_tokens:,} tokens, {report.memory_bytes / 2**20:,.0f} MiB."
+    )
+    if report.skipped:
+        st.caption(f"{report.skipped:,} rows without a model or prompt were skipped.")
+    if report.truncated:
+        st.warning(
+            f"The prefix trees reached their memory budget: {report.truncated:,} later prompts were matched but not "
+            "added, so the savings are a lower bound."
         )
+    results = report.frame()
+    st.dataframe(
+        results,
+        width="stretch",
+        hide_index=True,
+        column_config={
+            "Prompt tokens": st.column_config.NumberColumn(format="localized"),
+            "Shared-prefix tokens": st.column_config.NumberColumn(format="localized"),
+            "Shared share": st.column_config.NumberColumn(format="percent"),
+            "Cached tokens": st.column_config.NumberColumn(format="localized"),
+            "Input cost": st.column_config.NumberColumn(format="dollar"),
+            "With prefix caching": st.column_config.NumberColumn(format="dollar"),
+            "Saved": st.column_config.NumberColumn(format="dollar"),
+        },
+    )
+    st.bar_chart(results, x="Model", y=["Input cost", "With prefix caching"], stack=False)
 
-    # --- Display sections with expanders ---
-    for title, content in api_sections.items():
-        if cost_subtopic == "All" or cost_subtopic == title:
-            with expander_section(title):
-                # Header with checkbox on the right
-                top_col_left, top_col_right = st.columns([5, 1])
-                with top_col_right:
-                    checkbox_key = f"read_checkbox_{title}"
-
-                    # Initialize checkbox state if not already set
-                    if checkbox_key not in st.session_state:
-                        st.session_state[checkbox_key] = title in st.session_state["api_cost_read_sections"]
-
-                    # Render the checkbox
-                    completed = st.checkbox("Mark as complete", key=checkbox_key, value=st.session_state[checkbox_key])
-
-                    # Sync read_sections with checkbox state
-                    if completed:
-                        st.session_state["api_cost_read_sections"].add(title)
-                    else:
-                        st.session_state["api_cost_read_sections"].discard(title)
-
-                if title == "Estimate Token Cost":
-                    model_choice = st.selectbox(
-                        "Choose your model",
-                        ["GPT-3.5 Turbo", "GPT-4 Turbo", "GPT-4 (8K)"]
-                    )
-
-                    tokens_in = st.slider("Prompt tokens per request", 100, 4000, step=100, value=500)
-                    tokens_out = st.slider("Response tokens per request", 100, 4000, step=100, value=500)
-                    requests_per_day = st.slider("Number of requests per day", 10, 5000, step=50, value=1000)
-
-                    # Define cost rates per model
-                    rates = {
-                        "GPT-3.5 Turbo": {"in": 0.0015, "out": 0.002},
-                        "GPT-4 Turbo": {"in": 0.01, "out": 0.03},
-                        "GPT-4 (8K)": {"in": 0.03, "out": 0.06}
-                    }
-
-                    rate = rates[model_choice]
-                    daily_cost = ((tokens_in * rate["in"] + tokens_out * rate["out"]) / 1000) * requests_per_day
-                    monthly_cost = daily_cost * 30
-
-                    st.info(f"**Estimated Daily Cost:** ${daily_cost:,.2f}")
-                    st.success(f"**Estimated Monthly Cost:** ${monthly_cost:,.2f}")
-
-                elif title == "Test Your Knowledge: API Costs":
-                    # Interactive Quiz
-                    st.markdown("#### Quick Check: Test Your Knowledge on API Costs")
-
-                    q1 = st.radio("1. What is a token?", [
-                        "-- Select an answer --",
-                        "A single character",
-                        "A word or part of a word",
-                        "A sentence"
-                    ])
-                    if q1 != "-- Select an answer --":
-                        if q1 == "A word or part of a word":
-                            st.success("Correct! A token is typically 3–4 characters or about 1 word.")
-                        else:
-                            st.error("Incorrect. Try again.")
-
-                    q2 = st.radio("2. Which model is the most cost-effective?", [
-                        "-- Select an answer --",
-                        "GPT-3.5 Turbo",
-                        "GPT-4 Turbo",
-                        "GPT-4 (8K)"
-                    ])
-                    if q2 != "-- Select an answer --":
-                        if q2 == "GPT-3.5 Turbo":
-                            st.success("Correct! GPT-3.5 Turbo is the cheapest option.")
-                        else:
-                            st.error("Incorrect. Try again.")
-
-                    q3 = st.radio("3. What’s a good strategy to reduce API costs?", [
-                        "-- Select an answer --",
-                        "Use longer prompts",
-                        "Batch process requests",
-                        "Always use GPT-4"
-                    ])
-                    if q3 != "-- Select an answer --":
-                        if q3 == "Batch process requests":
-                            st.success("Correct! Batch processing reduces the number of API calls.")
-                        else:
-                            st.error("Incorrect. Try again.")
-
-                else:
-                    st.markdown(content)
-
-    # --- Reading Progress ---
-    total_sections = len(api_sections)
-    completed = len(st.session_state["api_cost_read_sections"])
-    percent = int((completed / total_sections) * 100)
-
-    st.markdown("### Your Reading Progress")
-    st.progress(percent)
-    st.caption(f"You’ve completed **{completed} of {total_sections}** sections ({percent}%)")
-
-    # --- Reset Progress Button ---
-    if st.button("Reset Progress"):
-        reset_progress(api_sections, "api_cost_read_sections")
-        st.rerun()
-
-    # Save progress to file whenever it changes
-    save_progress("api_cost_read_sections")
-      # Display success message if reset was triggered
-    if st.session_state.get("reset_triggered", False):
-        st.success("Progress reset! All checkboxes have been cleared.")
-        # Clear the flag after displaying the message
-        st.session_state["reset_triggered"] = False
-        
-    reset_expand_collapse_triggers()
-
-    # --- Footer ---
-    st.markdown("---")
-    st.markdown(
-        """
-        <div style='text-align: center; font-size: 14px; line-height: 1.6;'>
-            <strong>LLM Guide for Startups</strong> — Practical insights for using language models responsibly and efficiently in startup settings.<br>
-            Built with by:<br>
-            • <strong>Vaishnavi Kandikonda - 24216940 </strong> — <a href="mailto:vaishnavi.kandikonda@ucdconnect.com">vaishnavi.kandikonda@ucdconnect.com</a><br>
-            • <strong>Shivani Singh - 24234516 </strong> — <a href="mailto:shivani.singh@ucdconnect.ie">shivani.singh@ucdconnect.ie</a><br>
-            • <strong>Kushal Pratap Singh - 24205476 </strong> — <a href="mailto:kushal.singh@ucdconnect.ie">kushal.singh@ucdconnect.ie</a><br><br>
-            © 2025 LLM Startup Guide • Last updated {last_updated} • Built with Streamlit • Guided by principles of transparency, fairness, and human-centered AI.
-        </div>
-        """.format(last_updated=datetime.now().strftime("%Y-%m-%d")),
-        unsafe_allow_html=True
-    )
\ No newline at end of file
+def quiz(content):
+    # Interactive Quiz
+    st.markdown("#### Quick Check: Test Your Knowledge on API Costs")
+
+    q1 = st.radio("1. What is a token?", [
+        "-- Select an answer --",
+        "A single character",
+        "A word or part of a word",
+        "A sentence"
+    ])
+    if q1 != "-- Select an answer --":
+        if q1 == "A word or part of a word":
+            st.success("Correct! A token is typically 3–4 characters or about 1 word.")
+        else:
+            st.error("Incorrect. Try again.")
+
+    q2 = st.radio("2. Which model is the most cost-effective?", [
+        "-- Select an answer --",
+        "GPT-3.5 Turbo",
+        "GPT-4 Turbo",
+        "GPT-4 (8K)"
+    ])
+    if q2 != "-- Select an answer --":
+        if q2 == "GPT-3.5 Turbo":
+            st.success("Correct! GPT-3.5 Turbo is the cheapest option.")
+        else:
+            st.error("Incorrect. Try again.")
+
+    q3 = st.radio("3. What’s a good strategy to reduce API costs?", [
+        "-- Select an answer --",
+        "Use longer prompts",
+        "Batch process requests",
+        "Always use GPT-4"
+    ])
+    if q3 != "-- Select an answer --":
+        if q3 == "Batch process requests":
+            st.success("Correct! Batch processing reduces the number of API calls.")
+        else:
+            st.error("Incorrect. Try again.")
+
+PAGE = SectionPage(
+    name="API Cost Optimization",
+    heading="API Cost Optimization",
+    tagline="### Build Smart, Spend Smarter",
+    sections=API_COST_SECTIONS,
+    progress_key="api_cost_read_sections",
+    subtopic_key="api_cost_subtopic",
+    widgets={
+        "Estimate Token Cost": cost_estimator,
+        "Compare Cost Scenarios": cost_scenarios,
+        "Analyze Usage Logs": usage_log_analyzer,
+        "Simulate Response Caching": cache_simulator,
+        "Estimate Prefix Caching": prefix_cache_estimator,
+        "Test Your Knowledge: API Costs": quiz,
+    },
+    untracked=frozenset({
+        "Compare Cost Scenarios", "Analyze Usage Logs", "Simulate Response Caching", "Estimate Prefix Caching"
+    }),
+)
+
+def render():
+    render_section_page(PAGE)
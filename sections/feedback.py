@@ -1,9 +1,31 @@
 import streamlit as st
 import pandas as pd
-import os
 import re
-from datetime import datetime
-from utils.helpers import display_expand_collapse_controls, reset_expansion_state, store_feedback, load_feedback,inject_custom_css
+from datetime import datetime, timedelta
+from utils.helpers import (
+    display_expand_collapse_controls,
+    reset_expansion_state,
+    store_feedback,
+    store_attachment,
+    finish_attachment,
+    is_duplicate_feedback,
+    index_feedback,
+    make_feedback_export,
+    count_feedback,
+    load_feedback_page,
+    load_feedback_rollups,
+    check_feedback_rollups,
+    load_progress_counters,
+    check_progress_counters,
+    search_feedback,
+    clear_feedback,
+    inject_custom_css
+)
+from utils.content_registry import footer_html
+from utils.feedback_export import EXPORT_FORMATS
+from utils.section_registry import READING_GROUPS, group_sections
+
+FEEDBACK_PAGE_SIZE = 50
 
 def render():
     inject_custom_css()
@@ -42,38 +64,38 @@ def render():
                 st.warning("Please enter your name to submit the form.")
             elif not email_valid:
                 st.error("Invalid email format. Please check and try again.")
+            elif is_duplicate_feedback({"Feedback": feedback.strip()}):
+                st.warning("This looks almost identical to feedback we already have, so it was not submitted.")
             else:
+                stored_attachment = store_attachment(attachment) if attachment else None
+                attachment_sha256 = stored_attachment[0] if stored_attachment else None
                 entry = {
                     "Name": name.strip(),
                     "Email": email.strip(),
                     "Rating": rating,
                     "Feedback": feedback.strip(),
                     "Suggested Topic": None if suggestion == "None" else suggestion,
-                    "Attachment Name": attachment.name if attachment else None
+                    "Attachment Name": attachment.name if attachment_sha256 else None,
+                    "Timestamp": datetime.now().isoformat(timespec="seconds"),
+                    "Attachment SHA256": attachment_sha256
                 }
-                store_feedback(entry)
-
-                # Update session state with the new feedback entry
-                if "feedback_entries" not in st.session_state:
-                    st.session_state["feedback_entries"] = []
-                st.session_state["feedback_entries"].append(entry)
-
-                st.success(f" Thank you, {name.strip()}! We truly appreciate your insights.")
-
-    # --- Load feedback entries on first render ---
-    if 'feedback_entries' not in st.session_state:
-        st.session_state['feedback_entries'] = load_feedback()
-
-    # --- Feedback Table ---
-    if st.session_state['feedback_entries']:
-        df = pd.DataFrame(st.session_state['feedback_entries'])
-        df = df[df["Name"].str.strip().str.lower() != "admin"]
-        df = df[df["Name"].str.strip() != ""]
-        df.index += 1
-        df.index.name = "No."
-
+                ack_id = store_feedback(entry) if attachment_sha256 or not attachment else None
+                if stored_attachment:
+                    finish_attachment(attachment, stored_attachment, accepted=bool(ack_id))
+
+                if ack_id:
+                    index_feedback(entry)
+                    st.success(f" Thank you, {name.strip()}! We truly appreciate your insights. (Reference: `{ack_id}`)")
+
+    # --- Feedback Table (one page at a time; SQLite pages with a query, CSV pages the shared snapshot) ---
+    total_entries = count_feedback()
+    if total_entries:
+        page_count = (total_entries + FEEDBACK_PAGE_SIZE - 1) // FEEDBACK_PAGE_SIZE
         st.markdown("### All Submitted Feedback")
-        st.dataframe(df, use_container_width=True)
+        page = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1, key="feedback_page")
+
+        st.dataframe(load_feedback_page(page, FEEDBACK_PAGE_SIZE), use_container_width=True)
+        st.caption(f"Page {page} of {page_count} • {total_entries} entries")
     else:
         st.info("No feedback submitted yet. Be the first to contribute!")
 
@@ -84,25 +106,39 @@ def render():
         confirm_clear = st.checkbox("I confirm this action is irreversible.")
 
         ADMIN_PASSPHRASE = st.secrets["ADMIN_PASSPHRASE"]
-        FEEDBACK_PATH = "feedback.csv"
 
-        # Download feedback CSV
-        if st.session_state.get("feedback_entries"):
-            export_df = pd.DataFrame(st.session_state["feedback_entries"])
-            csv_data = export_df.to_csv(index=False).encode("utf-8")
-            st.download_button("📥 Download Feedback CSV", csv_data, file_name="feedback_backup.csv", mime="text/csv")
+        # Download feedback (streamed in chunks, generated only when clicked)
+        if total_entries:
+            col1, col2 = st.columns(2)
+            with col1:
+                export_format = st.selectbox("Export Format", list(EXPORT_FORMATS), key="export_format")
+            with col2:
+                min_rating, max_rating = st.slider("Ratings to Export", 1, 5, (1, 5), key="export_ratings")
+            date_range = st.date_input("Submitted Between (optional)", value=(), key="export_dates")
+
+            filters = {}
+            if (min_rating, max_rating) != (1, 5):
+                filters.update(min_rating=min_rating, max_rating=max_rating)
+            if len(date_range) == 2:
+                filters.update(since=date_range[0].isoformat(), until=(date_range[1] + timedelta(days=1)).isoformat())
+
+            extension, mime = EXPORT_FORMATS[export_format]
+            st.download_button(
+                f"📥 Download Feedback {export_format}",
+                make_feedback_export(export_format, **filters),
+                file_name=f"feedback_backup.{extension}",
+                mime=mime
+            )
 
         # Clear feedback
         if st.button("Clear All Feedback"):
             if admin_key_input == ADMIN_PASSPHRASE and confirm_clear:
                 try:
-                    if os.path.exists(FEEDBACK_PATH):
-                        os.remove(FEEDBACK_PATH)
-                        st.success("feedback.csv file deleted from disk.")
+                    if clear_feedback():
+                        st.success("Stored feedback deleted from disk.")
                     else:
-                        st.info("feedback.csv file not found.")
+                        st.info("No stored feedback found.")
 
-                    st.session_state["feedback_entries"] = []
                     st.cache_data.clear()
                     st.success("Feedback data cleared from memory and cache.")
                     st.rerun()
@@ -112,20 +148,77 @@ def render():
             else:
                 st.error("Invalid passphrase or confirmation checkbox not selected.")
 
+        # --- Feedback Analytics (running aggregates, no full scan) ---
+        if admin_key_input == ADMIN_PASSPHRASE:
+            # --- Full-text search over names and comments ---
+            search_query = st.text_input("Search Feedback", placeholder="e.g. pricing examples", key="feedback_search")
+            if search_query.strip():
+                results = search_feedback(search_query)
+                if results is not None and not results.empty:
+                    st.dataframe(results, use_container_width=True)
+                else:
+                    st.info("No feedback matches your search.")
+
+            rollups = load_feedback_rollups()
+            st.markdown("#### Feedback Analytics")
+            if rollups.count:
+                col1, col2 = st.columns(2)
+                col1.metric("Entries", rollups.count)
+                col2.metric("Mean Rating", f"{rollups.mean_rating:.2f}")
+
+                st.markdown("**Rating Histogram**")
+                st.bar_chart(pd.Series(rollups.histogram, name="Entries").sort_index())
+
+                if rollups.daily:
+                    st.markdown("**Mean Rating Over Time**")
+                    st.line_chart(pd.Series(rollups.daily_means(), name="Mean Rating"))
+
+                if rollups.topics:
+                    st.markdown("**Suggested Topics**")
+                    st.bar_chart(pd.Series(rollups.topics, name="Requests"))
+            else:
+                st.info("No feedback to analyse yet.")
+
+            if st.button("Verify Analytics"):
+                if check_feedback_rollups():
+                    st.success("Analytics match a full rebuild from the stored feedback.")
+                else:
+                    st.warning("Analytics differ from a full rebuild. Run `python -m utils.feedback_rollups --write` to repair them.")
+
+            # --- Reading Progress Analytics (incremental counters, no record scan) ---
+            counters = load_progress_counters()
+            st.markdown("#### Reading Progress Analytics")
+            if counters.learners:
+                st.metric("Learners", counters.learners)
+
+                st.markdown("**Completion Rate by Page**")
+                completion = pd.DataFrame({
+                    "Page": list(READING_GROUPS.values()),
+                    "Completed (%)": [round(counters.completion_rate(group) * 100, 1) for group in READING_GROUPS],
+                })
+                st.bar_chart(completion, x="Page", y="Completed (%)", sort=False)
+
+                funnel_page = st.selectbox("Funnel for page", list(READING_GROUPS.values()), key="progress_funnel_page")
+                funnel_group = next(group for group, title in READING_GROUPS.items() if title == funnel_page)
+                started = counters.started.get(funnel_group, 0)
+                funnel = pd.DataFrame(
+                    [{"Section": title, "Learners": counters.sections[sid]} for sid, title in group_sections(funnel_group)]
+                )
+                funnel["% of Starters"] = (funnel["Learners"] / started * 100).round(1) if started else 0.0
+                funnel["Drop-off"] = (funnel["Learners"].shift(1, fill_value=started) - funnel["Learners"]).clip(lower=0)
+                st.bar_chart(funnel, x="Section", y="Learners", horizontal=True, sort=False)
+                st.dataframe(funnel, use_container_width=True, hide_index=True)
+            else:
+                st.info("No reading progress recorded yet.")
+
+            if st.button("Verify Progress Analytics"):
+                if check_progress_counters():
+                    st.success("Progress analytics match a full rebuild from the stored records.")
+                else:
+                    st.warning("Progress analytics differ from a full rebuild. Run `python -m utils.progress_analytics --write` to repair them.")
+
     reset_expansion_state()
 
     # --- Footer ---
     st.markdown("---")
-    st.markdown(
-        """
-        <div style='text-align: center; font-size: 14px; line-height: 1.6;'>
-            <strong>LLM Guide for Startups</strong> — Practical insights for using language models responsibly and efficiently in startup settings.<br>
-            Built with by:<br>
-            • <strong>Vaishnavi Kandikonda - 24216940 </strong> — <a href="mailto:vaishnavi.kandikonda@ucdconnect.com">vaishnavi.kandikonda@ucdconnect.com</a><br>
-            • <strong>Shivani Singh - 24234516 </strong> — <a href="mailto:shivani.singh@ucdconnect.ie">shivani.singh@ucdconnect.ie</a><br>
-            • <strong>Kushal Pratap Singh - 24205476 </strong> — <a href="mailto:kushal.singh@ucdconnect.ie">kushal.singh@ucdconnect.ie</a><br><br>
-            © 2025 LLM Startup Guide • Last updated {last_updated} • Built with Streamlit • Guided by principles of transparency, fairness, and human-centered AI.
-        </div>
-        """.format(last_updated=datetime.now().strftime("%Y-%m-%d")),
-        unsafe_allow_html=True
-    )
\ No newline at end of file
+    st.markdown(footer_html(), unsafe_allow_html=True)
\ No newline at end of file
@@ -0,0 +1,42 @@
+import csv
+
+import pytest
+
+from utils.cache_simulator import simulate_log
+from utils.prefix_cache import estimate_log
+from utils.usage_logs import iter_frames
+
+RATES = {"m": {"in": 1.0, "out": 2.0}}
+ROWS = 300
+
+@pytest.fixture
+def multiline_log(tmp_path):
+    """A CSV request log whose quoted prompts span lines and hold commas and quotes."""
+    path = tmp_path / "log.csv"
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["timestamp", "model", "prompt", "prompt_tokens", "completion_tokens"])
+        for i in range(ROWS):
+            writer.writerow([1700000000 + i, "m", f'line one {i % 10}\nline, two "q"', 10, 5])
+    return str(path)
+
+@pytest.mark.parametrize("block_bytes", [100, 777, 1 << 20])
+def test_iter_frames_keeps_multiline_prompts(multiline_log, block_bytes):
+    frames = list(iter_frames(multiline_log, ("model", "prompt"), block_bytes))
+    prompts = [p for frame, _ in frames for p in frame["prompt"]]
+    assert len(prompts) == ROWS
+    assert prompts[0] == 'line one 0\nline, two "q"'
+    assert frames[-1][1] == len(open(multiline_log, "rb").read())
+
+@pytest.mark.parametrize("block_bytes", [100, 1 << 20])
+def test_simulate_log_reads_multiline_prompts(multiline_log, block_bytes):
+    report = simulate_log(multiline_log, [("LRU", "exact")], RATES, block_bytes=block_bytes)
+    (stats,) = report.stats
+    assert stats.requests == ROWS
+    assert stats.hits == ROWS - 10  # ten distinct prompts, each missed once
+
+def test_estimate_log_reads_multiline_prompts(multiline_log):
+    encode = lambda texts: [[ord(c) for c in text] for text in texts]
+    report = estimate_log(multiline_log, RATES, encode, block_bytes=100)
+    assert report.prompts == ROWS
+    assert report.skipped == 0
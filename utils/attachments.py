@@ -0,0 +1,146 @@
+import hashlib
+import json
+import os
+import uuid
+
+from utils.feedback_store import file_lock
+
+CHUNK_BYTES = 64 * 1024
+THUMBNAIL_SIZE = (256, 256)
+TEXT_PREVIEW_CHARS = 20_000
+
+class AttachmentQuotaError(Exception):
+    """Raised when an upload exceeds the per-file or total size quota."""
+
+# -----------------------------------------------------------------------------
+# Content-Addressed Blob Store
+# -----------------------------------------------------------------------------
+class AttachmentStore:
+    """Feedback attachments stored once per SHA-256, under `root/blobs/ab/<hash>`.
+
+    Uploads are copied to a temp file in `CHUNK_BYTES` pieces while they are
+    hashed, so no second in-memory copy is made. Identical files are stored
+    once. The total size of stored blobs is tracked in `root/usage.json` under
+    a cross-process lock.
+    """
+
+    def __init__(self, root: str, max_file_bytes: int, max_total_bytes: int):
+        self.root = root
+        self.max_file_bytes = max_file_bytes
+        self.max_total_bytes = max_total_bytes
+        self.blob_dir = os.path.join(root, "blobs")
+        self.derived_dir = os.path.join(root, "derived")
+        self._tmp_dir = os.path.join(root, "tmp")
+        for directory in (self.blob_dir, self.derived_dir, self._tmp_dir):
+            os.makedirs(directory, exist_ok=True)
+
+    def blob_path(self, digest: str) -> str:
+        return os.path.join(self.blob_dir, digest[:2], digest)
+
+    def put(self, fileobj) -> tuple:
+        """Store a file-like object. Returns `(sha256, size, is_new)`."""
+        tmp_path = os.path.join(self._tmp_dir, uuid.uuid4().hex)
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            with open(tmp_path, "wb") as out:
+                while True:
+                    chunk = fileobj.read(CHUNK_BYTES)
+                    if not chunk:
+                        break
+                    size += len(chunk)
+                    if size > self.max_file_bytes:
+                        raise AttachmentQuotaError(
+                            f"Attachments are limited to {self.max_file_bytes // (1024 * 1024)} MB."
+                        )
+                    digest.update(chunk)
+                    out.write(chunk)
+
+            sha256 = digest.hexdigest()
+            final_path = self.blob_path(sha256)
+            with file_lock(os.path.join(self.root, "usage.json")):
+                if os.path.exists(final_path):
+                    return sha256, size, False
+                total = self._read_usage()
+                if total + size > self.max_total_bytes:
+                    raise AttachmentQuotaError("Attachment storage is full. Please submit without a file.")
+                os.makedirs(os.path.dirname(final_path), exist_ok=True)
+                os.replace(tmp_path, final_path)
+                self._write_usage(total + size)
+            return sha256, size, True
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def remove(self, sha256: str) -> None:
+        """Delete a blob and its derivatives, returning its bytes to the quota."""
+        final_path = self.blob_path(sha256)
+        with file_lock(os.path.join(self.root, "usage.json")):
+            if not os.path.exists(final_path):
+                return
+            total, size = self._read_usage(), os.path.getsize(final_path)
+            os.remove(final_path)
+            self._write_usage(max(total - size, 0))
+        for name in (f"{sha256}.thumb.png", f"{sha256}.txt"):
+            path = os.path.join(self.derived_dir, name)
+            if os.path.exists(path):
+                os.remove(path)
+
+    def total_bytes(self) -> int:
+        with file_lock(os.path.join(self.root, "usage.json")):
+            return self._read_usage()
+
+    def _read_usage(self) -> int:
+        path = os.path.join(self.root, "usage.json")
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)["bytes"]
+        # First use, or the counter was lost: measure what is on disk
+        return sum(
+            os.path.getsize(os.path.join(directory, name))
+            for directory, _, names in os.walk(self.blob_dir) for name in names
+        )
+
+    def _write_usage(self, total: int) -> None:
+        path = os.path.join(self.root, "usage.json")
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump({"bytes": total}, f)
+        os.replace(path + ".tmp", path)
+
+# -----------------------------------------------------------------------------
+# Derivatives (run in a worker process, never in the Streamlit script thread)
+# -----------------------------------------------------------------------------
+def build_derivatives(blob_path: str, derived_dir: str, extension: str) -> list:
+    """Write a thumbnail for images or extracted text for txt/pdf. Returns paths written."""
+    digest = os.path.basename(blob_path)
+    extension = extension.lower().lstrip(".")
+    written = []
+
+    if extension in ("png", "jpg", "jpeg"):
+        from PIL import Image
+        target = os.path.join(derived_dir, f"{digest}.thumb.png")
+        with Image.open(blob_path) as image:
+            image.thumbnail(THUMBNAIL_SIZE)
+            image.save(target, "PNG")
+        written.append(target)
+
+    elif extension in ("txt", "pdf"):
+        if extension == "txt":
+            with open(blob_path, "rb") as f:
+                text = f.read(TEXT_PREVIEW_CHARS * 4).decode("utf-8", errors="replace")
+        else:
+            try:
+                from pypdf import PdfReader
+            except ImportError:
+                return written  # PDF text extraction is optional
+            text = ""
+            for page in PdfReader(blob_path).pages:
+                text += (page.extract_text() or "") + "\n"
+                if len(text) >= TEXT_PREVIEW_CHARS:
+                    break
+        target = os.path.join(derived_dir, f"{digest}.txt")
+        with open(target, "w", encoding="utf-8") as f:
+            f.write(text[:TEXT_PREVIEW_CHARS])
+        written.append(target)
+
+    return written
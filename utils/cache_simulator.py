@@ -0,0 +1,285 @@
+import argparse
+import math
+import os
+import time
+from collections import OrderedDict, defaultdict
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from utils.usage_logs import iter_frames
+
+# Columns read from a request log; the prompt text is hashed, never kept
+REQUEST_COLUMNS = ("timestamp", "model", "prompt", "prompt_tokens", "completion_tokens")
+KEY_MODES = ("exact", "normalized")
+
+# -----------------------------------------------------------------------------
+# Cache Policies
+# -----------------------------------------------------------------------------
+# Each policy answers `access(key, now, size)`: True on a hit; on a miss the
+# response is stored. Keys are 64-bit prompt hashes, `now` is Unix seconds and
+# `size` the response's completion tokens.
+class LRUCache:
+    """Keep the `capacity` most recently used responses."""
+
+    def __init__(self, capacity: int):
+        self.capacity = max(capacity, 1)
+        self._entries = OrderedDict()
+
+    def access(self, key: int, now: float, size: int) -> bool:
+        entries = self._entries
+        if key in entries:
+            entries.move_to_end(key)
+            return True
+        entries[key] = None
+        if len(entries) > self.capacity:
+            entries.popitem(last=False)
+        return False
+
+class LFUCache:
+    """Keep the `capacity` most frequently used responses; ties go to the least recent.
+
+    O(1) per access: keys sit in one insertion-ordered bucket per use count.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = max(capacity, 1)
+        self._counts = {}
+        self._buckets = defaultdict(OrderedDict)
+        self._min_count = 0
+
+    def access(self, key: int, now: float, size: int) -> bool:
+        count = self._counts.get(key)
+        if count is not None:
+            bucket = self._buckets[count]
+            del bucket[key]
+            if not bucket:
+                del self._buckets[count]
+                if self._min_count == count:
+                    self._min_count = count + 1
+            self._counts[key] = count + 1
+            self._buckets[count + 1][key] = None
+            return True
+        if len(self._counts) >= self.capacity:
+            bucket = self._buckets[self._min_count]
+            victim, _ = bucket.popitem(last=False)
+            if not bucket:
+                del self._buckets[self._min_count]
+            del self._counts[victim]
+        self._counts[key] = 1
+        self._buckets[1][key] = None
+        self._min_count = 1
+        return False
+
+class TTLCache:
+    """Serve a response for `ttl` seconds after it was generated, keeping at most `capacity`.
+
+    Hits do not extend the lifetime, and requests without a time are
+    neither served nor stored. With one TTL for every entry, the oldest
+    stored response is also the first to expire, so it is the one evicted
+    when the cache is full.
+    """
+
+    def __init__(self, capacity: int, ttl: float):
+        self.capacity = max(capacity, 1)
+        self.ttl = ttl
+        self._expiry = OrderedDict()
+
+    def access(self, key: int, now: float, size: int) -> bool:
+        if math.isnan(now):  # no usable timestamp: neither served nor stored
+            return False
+        expiry = self._expiry.get(key)
+        if expiry is not None:
+            if now < expiry:
+                return True
+            del self._expiry[key]
+        self._expiry[key] = now + self.ttl
+        if len(self._expiry) > self.capacity:
+            self._expiry.popitem(last=False)
+        return False
+
+class SizeBoundedCache:
+    """LRU bounded by the total completion tokens stored rather than the entry count."""
+
+    def __init__(self, token_budget: int):
+        self.token_budget = token_budget
+        self._entries = OrderedDict()
+        self._used = 0
+
+    def access(self, key: int, now: float, size: int) -> bool:
+        entries = self._entries
+        if key in entries:
+            entries.move_to_end(key)
+            return True
+        if size > self.token_budget:
+            return False
+        entries[key] = size
+        self._used += size
+        while self._used > self.token_budget:
+            self._used -= entries.popitem(last=False)[1]
+        return False
+
+class CacheSettings(NamedTuple):
+    capacity: int = 10_000  # responses kept by LRU, LFU and TTL
+    ttl: float = 24 * 3600  # seconds a TTL entry stays valid
+    token_budget: int = 5_000_000  # completion tokens kept by the size-bounded cache
+
+# Policy name -> factory taking CacheSettings; add a policy here to offer it on the page
+POLICIES = {
+    "LRU": lambda settings: LRUCache(settings.capacity),
+    "LFU": lambda settings: LFUCache(settings.capacity),
+    "TTL": lambda settings: TTLCache(settings.capacity, settings.ttl),
+    "Size-bounded LRU": lambda settings: SizeBoundedCache(settings.token_budget),
+}
+
+# -----------------------------------------------------------------------------
+# Request Keys
+# -----------------------------------------------------------------------------
+def normalize_prompts(prompts: pd.Series) -> pd.Series:
+    """Lower-case, collapse whitespace and drop trailing punctuation."""
+    return (
+        prompts.str.lower()
+        .str.replace(r"\s+", " ", regex=True)
+        .str.replace(r"[\s.!?]+$", "", regex=True)
+        .str.strip()
+    )
+
+def request_keys(models: pd.Series, prompts: pd.Series) -> np.ndarray:
+    """64-bit hash of (model, prompt) per request, computed in C over the whole block.
+
+    A response is only reusable for the same model. Collisions are
+    negligible at log sizes (~3e-6 chance of any among 10M distinct prompts).
+    """
+    frame = pd.DataFrame({"model": models.astype("string"), "prompt": prompts.astype("string")})
+    return pd.util.hash_pandas_object(frame, index=False).to_numpy()
+
+def epoch_seconds(timestamps: pd.Series) -> np.ndarray:
+    """Unix seconds of each timestamp, NaN where unreadable.
+
+    As in `usage_logs.day_keys`, numbers and all-digit strings are Unix
+    seconds and other text is ISO 8601.
+    """
+    if pd.api.types.is_numeric_dtype(timestamps):
+        return timestamps.to_numpy(dtype=float, na_value=np.nan)
+    if not pd.api.types.is_datetime64_any_dtype(timestamps):
+        text = timestamps.astype("string")
+        seconds = pd.to_numeric(text, errors="coerce").astype(float)
+        dated = seconds.isna() & text.notna()
+        if dated.any():
+            seconds[dated] = epoch_seconds(pd.to_datetime(text[dated], utc=True, errors="coerce", format="ISO8601"))
+        return seconds.to_numpy(dtype=float, na_value=np.nan)
+    stamps = timestamps if timestamps.dt.tz is not None else timestamps.dt.tz_localize("UTC")
+    return ((stamps - pd.Timestamp(0, tz="UTC")) / pd.Timedelta(seconds=1)).to_numpy(dtype=float, na_value=np.nan)
+
+# -----------------------------------------------------------------------------
+# Replay
+# -----------------------------------------------------------------------------
+class CacheStats(NamedTuple):
+    policy: str
+    key: str
+    requests: int
+    hits: int
+    tokens_saved: int
+    dollars_saved: float
+    spend: float  # cost of every request without a cache
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.requests if self.requests else 0.0
+
+class CacheReport(NamedTuple):
+    stats: list
+    requests: int
+    seconds: float
+
+    @property
+    def requests_per_second(self) -> float:
+        return self.requests / self.seconds if self.seconds else 0.0
+
+    def frame(self) -> pd.DataFrame:
+        return pd.DataFrame([
+            {
+                "Policy": s.policy, "Key": s.key, "Hit rate": s.hit_rate, "Tokens saved": s.tokens_saved,
+                "Dollars saved": s.dollars_saved, "Share of spend": s.dollars_saved / s.spend if s.spend else 0.0,
+            }
+            for s in self.stats
+        ])
+
+def simulate_log(path: str, scenarios, rates: dict, settings: CacheSettings = CacheSettings(),
+                 block_bytes: int = 32 * 1024 * 1024, progress=None) -> CacheReport:
+    """Replay a CSV/JSONL request log through each `(policy, key mode)` scenario.
+
+    The log is read in blocks and replayed in file order, so it must be
+    sorted by time for TTL results to be meaningful. Per block, keys, costs
+    and sizes are computed column-wise; the only per-request Python work is
+    one `access` call per scenario. Rows without a model or prompt count as
+    uncacheable misses, as do rows without a readable time under TTL.
+    """
+    start = time.perf_counter()
+    scenarios = [tuple(s) for s in scenarios]
+    caches = {s: POLICIES[s[0]](settings) for s in scenarios}
+    totals = {s: np.zeros(3) for s in scenarios}  # hits, tokens saved, dollars saved
+    modes = {mode for _, mode in scenarios}
+    size = os.path.getsize(path)
+    requests, spend = 0, 0.0
+    rate_in = {model: rate["in"] / 1000 for model, rate in rates.items()}
+    rate_out = {model: rate["out"] / 1000 for model, rate in rates.items()}
+
+    for frame, done_bytes in iter_frames(path, REQUEST_COLUMNS, block_bytes):
+        requests += len(frame)
+        models = frame["model"].astype("string") if "model" in frame else pd.Series(pd.NA, index=frame.index, dtype="string")
+        prompts = frame["prompt"].astype("string") if "prompt" in frame else pd.Series(pd.NA, index=frame.index, dtype="string")
+        prompt_tokens = pd.to_numeric(frame.get("prompt_tokens", 0), errors="coerce").fillna(0).to_numpy()
+        completion_tokens = pd.to_numeric(frame.get("completion_tokens", 0), errors="coerce").fillna(0).to_numpy()
+        cost = (
+            prompt_tokens * models.map(rate_in).astype(float).fillna(0).to_numpy()
+            + completion_tokens * models.map(rate_out).astype(float).fillna(0).to_numpy()
+        )
+        spend += cost.sum()
+
+        cacheable = (models.notna() & prompts.notna()).to_numpy()
+        times = epoch_seconds(frame["timestamp"])[cacheable].tolist() if "timestamp" in frame else [math.nan] * int(cacheable.sum())
+        sizes = completion_tokens[cacheable].astype(np.int64).tolist()
+        tokens = (prompt_tokens + completion_tokens)[cacheable]
+        cost = cost[cacheable]
+        keys = {}
+        if "exact" in modes:
+            keys["exact"] = request_keys(models[cacheable], prompts[cacheable]).tolist()
+        if "normalized" in modes:
+            keys["normalized"] = request_keys(models[cacheable], normalize_prompts(prompts[cacheable])).tolist()
+
+        for scenario in scenarios:
+            access = caches[scenario].access
+            hits = np.fromiter(map(access, keys[scenario[1]], times, sizes), dtype=bool, count=len(sizes))
+            totals[scenario] += (hits.sum(), tokens[hits].sum(), cost[hits].sum())
+        if progress:
+            progress(min(done_bytes / size, 1.0))
+
+    stats = [
+        CacheStats(policy, mode, requests, int(hits), int(tokens_saved), float(dollars), float(spend))
+        for (policy, mode), (hits, tokens_saved, dollars) in totals.items()
+    ]
+    return CacheReport(stats, requests, time.perf_counter() - start)
+
+# -----------------------------------------------------------------------------
+# Command Line: cache savings of a request log
+# -----------------------------------------------------------------------------
+if __name__ == "__main__":
+    from config import MODEL_RATES, USAGE_LOG_BLOCK_BYTES
+
+    parser = argparse.ArgumentParser(description="Replay a request log through response-cache policies.")
+    parser.add_argument("path")
+    parser.add_argument("--policies", nargs="+", default=list(POLICIES), choices=list(POLICIES))
+    parser.add_argument("--keys", nargs="+", default=list(KEY_MODES), choices=KEY_MODES)
+    parser.add_argument("--capacity", type=int, default=CacheSettings().capacity)
+    parser.add_argument("--ttl", type=float, default=CacheSettings().ttl)
+    parser.add_argument("--token-budget", type=int, default=CacheSettings().token_budget)
+    args = parser.parse_args()
+
+    report = simulate_log(
+        args.path, [(p, k) for p in args.policies for k in args.keys], MODEL_RATES,
+        CacheSettings(args.capacity, args.ttl, args.token_budget), USAGE_LOG_BLOCK_BYTES,
+    )
+    print(report.frame().to_string(index=False))
+    print(f"{report.requests:,} requests in {report.seconds:.1f}s ({report.requests_per_second:,.0f}/s)")
@@ -0,0 +1,104 @@
+import hashlib
+import textwrap
+import threading
+from collections.abc import Mapping
+from datetime import date
+from functools import lru_cache
+from typing import NamedTuple
+
+class Fragment(NamedTuple):
+    """One section's text, normalised once; `key` is the SHA-256 of the body."""
+    key: str
+    body: str
+
+# -----------------------------------------------------------------------------
+# Page Content
+# -----------------------------------------------------------------------------
+class PageContent(Mapping):
+    """A page's sections in display order, read-only: title -> markdown body.
+
+    Behaves like the dict literals the pages used to build on every render,
+    so `items()`, `keys()` and `len()` work unchanged, and also exposes the
+    sub-topic selector options. Interactive sections the page draws itself
+    map to None.
+    """
+
+    def __init__(self, page: str, fragments: dict):
+        self.page = page
+        self.titles = tuple(fragments)
+        self.subtopic_options = ("All",) + self.titles
+        self._fragments = fragments
+
+    def __getitem__(self, title: str) -> str:
+        fragment = self._fragments[title]
+        return None if fragment is None else fragment.body
+
+    def __iter__(self):
+        return iter(self.titles)
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+# -----------------------------------------------------------------------------
+# Content Registry
+# -----------------------------------------------------------------------------
+class ContentRegistry:
+    """Section text for every page, built once per process and shared by all sessions.
+
+    Pages register their sections when their module is first imported. Each
+    body is normalised once (dedented, trailing whitespace stripped) and
+    interned by its SHA-256, so text repeated across pages is held once and
+    reruns only look fragments up.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._fragments = {}  # content hash -> Fragment
+        self._pages = {}  # page -> PageContent
+
+    def register(self, page: str, sections: dict) -> PageContent:
+        with self._lock:
+            fragments = {}
+            for title, body in sections.items():
+                if body is None:  # interactive section, rendered by the page itself
+                    fragments[title] = None
+                    continue
+                body = textwrap.dedent(body).strip()
+                key = hashlib.sha256(body.encode("utf-8")).hexdigest()
+                fragments[title] = self._fragments.setdefault(key, Fragment(key, body))
+            content = self._pages[page] = PageContent(page, fragments)
+            return content
+
+    def page(self, page: str) -> PageContent:
+        return self._pages[page]
+
+    def __len__(self) -> int:
+        return len(self._fragments)
+
+REGISTRY = ContentRegistry()
+
+def register_page(page: str, sections: dict) -> PageContent:
+    """Register a page's sections with the process-wide registry."""
+    return REGISTRY.register(page, sections)
+
+# -----------------------------------------------------------------------------
+# Shared Fragments
+# -----------------------------------------------------------------------------
+FOOTER_TEMPLATE = textwrap.dedent("""\
+    <div style='text-align: center; font-size: 14px; line-height: 1.6;'>
+        <strong>LLM Guide for Startups</strong> — Practical insights for using language models responsibly and efficiently in startup settings.<br>
+        Built with by:<br>
+        • <strong>Vaishnavi Kandikonda - 24216940 </strong> — <a href="mailto:vaishnavi.kandikonda@ucdconnect.com">vaishnavi.kandikonda@ucdconnect.com</a><br>
+        • <strong>Shivani Singh - 24234516 </strong> — <a href="mailto:shivani.singh@ucdconnect.ie">shivani.singh@ucdconnect.ie</a><br>
+        • <strong>Kushal Pratap Singh - 24205476 </strong> — <a href="mailto:kushal.singh@ucdconnect.ie">kushal.singh@ucdconnect.ie</a><br><br>
+        © 2025 LLM Startup Guide • Last updated {last_updated} • Built with Streamlit • Guided by principles of transparency, fairness, and human-centered AI.
+    </div>
+""")
+
+@lru_cache(maxsize=2)
+def _footer_for(day: str) -> str:
+    return FOOTER_TEMPLATE.format(last_updated=day)
+
+def footer_html() -> str:
+    """The page footer, rendered once per day and shared by every page."""
+    return _footer_for(date.today().isoformat())
@@ -0,0 +1,79 @@
+import argparse
+from typing import NamedTuple
+
+import numpy as np
+
+def axis(start: int, stop: int, step: int) -> np.ndarray:
+    """Values of an inclusive slider range."""
+    return np.arange(start, stop + 1, step, dtype=np.float64)
+
+# -----------------------------------------------------------------------------
+# Scenario Grid
+# -----------------------------------------------------------------------------
+class ScenarioGrid(NamedTuple):
+    """Daily API cost for every model × prompt tokens × response tokens × requests/day."""
+    models: tuple
+    tokens_in: np.ndarray
+    tokens_out: np.ndarray
+    requests: np.ndarray
+    per_request: np.ndarray  # (model, tokens_in, tokens_out) dollars per request
+    daily: np.ndarray  # (model, tokens_in, tokens_out, requests) dollars per day
+
+    @property
+    def size(self) -> int:
+        return self.daily.size
+
+    def nearest(self, values: np.ndarray, value: float) -> int:
+        """Index of the axis value closest to `value`."""
+        return int(np.abs(values - value).argmin())
+
+    def cost_map(self, model: str, requests_per_day: float) -> np.ndarray:
+        """Daily cost over (tokens_in, tokens_out) for one model and request volume."""
+        return self.daily[self.models.index(model), :, :, self.nearest(self.requests, requests_per_day)]
+
+    def break_even_requests(self, base_model: str, tokens_out: float, requests_per_day: float) -> np.ndarray:
+        """Requests/day each model can serve for the base model's spend, over tokens_in.
+
+        Row `m` is where model `m`'s daily cost meets the base model's at
+        `requests_per_day`: below that volume it is cheaper, above it dearer.
+        """
+        j = self.nearest(self.tokens_out, tokens_out)
+        spend = self.per_request[self.models.index(base_model), :, j] * requests_per_day
+        return spend[None, :] / self.per_request[:, :, j]
+
+def build_grid(rates: dict, tokens_in, tokens_out, requests) -> ScenarioGrid:
+    """Evaluate the cost formula over the full grid in one broadcast.
+
+    `rates` maps model -> {"in", "out"} dollars per 1K tokens. The daily
+    array is the outer product of per-request cost and request volume, so
+    no Python loop runs per cell.
+    """
+    models = tuple(rates)
+    rate_in = np.array([rates[m]["in"] for m in models]) / 1000
+    rate_out = np.array([rates[m]["out"] for m in models]) / 1000
+    tokens_in, tokens_out, requests = (np.asarray(a, dtype=np.float64) for a in (tokens_in, tokens_out, requests))
+    per_request = (
+        rate_in[:, None, None] * tokens_in[None, :, None]
+        + rate_out[:, None, None] * tokens_out[None, None, :]
+    )
+    daily = per_request[..., None] * requests
+    return ScenarioGrid(models, tokens_in, tokens_out, requests, per_request, daily)
+
+# -----------------------------------------------------------------------------
+# Command Line: cheapest model per scenario
+# -----------------------------------------------------------------------------
+if __name__ == "__main__":
+    from config import MODEL_RATES, SCENARIO_REQUEST_AXIS, SCENARIO_TOKEN_AXIS
+
+    parser = argparse.ArgumentParser(description="Print the monthly cost of each model for one scenario.")
+    parser.add_argument("--tokens-in", type=float, default=500)
+    parser.add_argument("--tokens-out", type=float, default=500)
+    parser.add_argument("--requests", type=float, default=1000)
+    args = parser.parse_args()
+
+    grid = build_grid(MODEL_RATES, axis(*SCENARIO_TOKEN_AXIS), axis(*SCENARIO_TOKEN_AXIS), axis(*SCENARIO_REQUEST_AXIS))
+    i, j, k = (grid.nearest(values, value) for values, value in (
+        (grid.tokens_in, args.tokens_in), (grid.tokens_out, args.tokens_out), (grid.requests, args.requests)
+    ))
+    for m, model in enumerate(grid.models):
+        print(f"{model:<16} ${grid.daily[m, i, j, k] * 30:>12,.2f} / month")
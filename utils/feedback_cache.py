@@ -0,0 +1,85 @@
+import os
+import threading
+
+import pandas as pd
+
+# -----------------------------------------------------------------------------
+# Shared Feedback Snapshot
+# -----------------------------------------------------------------------------
+class FeedbackSnapshot:
+    """Versioned view of the visible feedback, shared by every session.
+
+    The admin/blank-name filter, numeric ratings and the 1-based "No." index
+    are computed once when the snapshot is built. Sessions only hold a
+    reference; pandas copy-on-write keeps the shared frame read-only even if a
+    caller modifies a page it was handed.
+    """
+
+    __slots__ = ("version", "frame")
+
+    def __init__(self, version, frame: pd.DataFrame):
+        self.version = version
+        self.frame = frame
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    def page(self, page: int, page_size: int) -> pd.DataFrame:
+        """Return one page (1-based) of the view without copying it."""
+        start = max(page - 1, 0) * page_size
+        return self.frame.iloc[start:start + page_size]
+
+def build_frame(rows, first: int = 1) -> pd.DataFrame:
+    """Apply the table's filter and formatting to raw feedback rows; `first` is the first "No."."""
+    df = pd.DataFrame(list(rows))
+    if df.empty:
+        return df
+    names = df["Name"].fillna("").astype(str).str.strip()
+    df = df[(names != "") & (names.str.lower() != "admin")].reset_index(drop=True)
+    df["Rating"] = pd.to_numeric(df["Rating"], errors="coerce")
+    df.index += first
+    df.index.name = "No."
+    return df
+
+def file_stamp(*paths) -> tuple:
+    """Cheap change marker for files another process may write to."""
+    stamp = []
+    for path in paths:
+        try:
+            info = os.stat(path)
+            stamp.append((info.st_ino, info.st_size, info.st_mtime_ns))
+        except FileNotFoundError:
+            stamp.append(None)
+    return tuple(stamp)
+
+class FeedbackSnapshotCache:
+    """Hold the current `FeedbackSnapshot` and rebuild it only when the version moves.
+
+    The version combines a counter bumped by writes in this process with a
+    stamp of the backing files, so writes from other processes are noticed
+    too. Concurrent sessions that find a stale snapshot wait for a single
+    rebuild instead of each loading the store.
+    """
+
+    def __init__(self, load_rows, stamp):
+        self._load_rows = load_rows
+        self._stamp = stamp
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._snapshot = None
+
+    def bump_version(self) -> None:
+        """Mark the snapshot stale after a write or delete."""
+        with self._lock:
+            self._writes += 1
+
+    def get(self) -> FeedbackSnapshot:
+        snapshot = self._snapshot
+        version = (self._writes, self._stamp())
+        if snapshot is not None and snapshot.version == version:
+            return snapshot
+        with self._lock:
+            version = (self._writes, self._stamp())
+            if self._snapshot is None or self._snapshot.version != version:
+                self._snapshot = FeedbackSnapshot(version, build_frame(self._load_rows()))
+            return self._snapshot
@@ -0,0 +1,209 @@
+import argparse
+import csv
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+# Feedback CSV column -> SQLite column
+COLUMNS = {
+    "Name": "name",
+    "Email": "email",
+    "Rating": "rating",
+    "Feedback": "feedback",
+    "Suggested Topic": "suggested_topic",
+    "Attachment Name": "attachment_name",
+    "Timestamp": "created_at",
+    "Attachment SHA256": "attachment_sha256",
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS feedback (
+    id              INTEGER PRIMARY KEY AUTOINCREMENT,
+    name            TEXT NOT NULL,
+    email           TEXT,
+    rating          INTEGER,
+    feedback        TEXT,
+    suggested_topic TEXT,
+    attachment_name TEXT,
+    created_at      TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%S', 'now', 'localtime')),
+    attachment_sha256 TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_feedback_rating ON feedback(rating);
+CREATE INDEX IF NOT EXISTS idx_feedback_topic ON feedback(suggested_topic);
+CREATE INDEX IF NOT EXISTS idx_feedback_created_at ON feedback(created_at);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+# Rows from the "admin" account or without a name are hidden from the table
+VISIBLE_CLAUSE = "lower(trim(name)) != 'admin' AND trim(name) != ''"
+
+def _to_row(entry: dict, default_timestamp: str = None) -> tuple:
+    values = []
+    for column in COLUMNS:
+        value = entry.get(column)
+        if column == "Name":
+            value = value or ""
+        elif value == "":
+            value = None
+        if column == "Rating" and value is not None:
+            try:
+                value = int(float(value))
+            except (TypeError, ValueError, OverflowError):
+                value = None  # unreadable legacy ratings are stored as NULL
+        if column == "Timestamp" and value is None:
+            value = default_timestamp or datetime.now().isoformat(timespec="seconds")
+        values.append(value)
+    return tuple(values)
+
+def _where(visible_only=True, min_rating=None, max_rating=None, topic=None, since=None, until=None):
+    """Build a WHERE clause and its parameters from the supported filters."""
+    clauses, params = [], []
+    if visible_only:
+        clauses.append(VISIBLE_CLAUSE)
+    if min_rating is not None:
+        clauses.append("rating >= ?")
+        params.append(min_rating)
+    if max_rating is not None:
+        clauses.append("rating <= ?")
+        params.append(max_rating)
+    if topic is not None:
+        clauses.append("suggested_topic = ?")
+        params.append(topic)
+    if since is not None:
+        clauses.append("created_at >= ?")
+        params.append(str(since))
+    if until is not None:
+        clauses.append("created_at < ?")
+        params.append(str(until))
+    return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+# -----------------------------------------------------------------------------
+# SQLite Feedback Store
+# -----------------------------------------------------------------------------
+class FeedbackDB:
+    """SQLite feedback store in WAL mode with indexed, paginated queries.
+
+    Each thread gets its own connection; WAL lets readers run alongside the
+    single writer, and the connection timeout makes concurrent writers wait
+    for the lock instead of failing.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        self._columns = ", ".join(f'{col} AS "{name}"' for name, col in COLUMNS.items())
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(SCHEMA)
+            # Databases created by older versions lack the newer columns
+            existing = {row["name"] for row in conn.execute("PRAGMA table_info(feedback)")}
+            for column in COLUMNS.values():
+                if column not in existing:
+                    conn.execute(f"ALTER TABLE feedback ADD COLUMN {column} TEXT")
+            self._local.conn = conn
+        return conn
+
+    def insert(self, entry: dict) -> None:
+        """Insert a single feedback entry."""
+        self.insert_many([entry])
+
+    def insert_many(self, entries: list) -> None:
+        """Insert several feedback entries in one transaction."""
+        conn = self._connection()
+        with conn:
+            self._insert(conn, entries)
+
+    def count(self, **filters) -> int:
+        """Number of rows matching the filters (see `_where`)."""
+        where, params = _where(**filters)
+        return self._connection().execute(f"SELECT COUNT(*) FROM feedback{where}", params).fetchone()[0]
+
+    def query_page(self, page: int = 1, page_size: int = 50, **filters) -> list:
+        """Return one page (1-based) of feedback rows, oldest first, walking the primary key."""
+        where, params = _where(**filters)
+        offset = max(page - 1, 0) * page_size
+        rows = self._connection().execute(
+            f"SELECT {self._columns} FROM feedback{where} ORDER BY id LIMIT ? OFFSET ?", params + [page_size, offset]
+        )
+        return [dict(row) for row in rows]
+
+    def iter_rows(self, chunk_size: int = 5000, **filters):
+        """Yield every matching row, fetching `chunk_size` rows at a time."""
+        where, params = _where(**filters)
+        last_id = 0
+        id_clause = " AND id > ?" if where else " WHERE id > ?"
+        while True:
+            rows = self._connection().execute(
+                f"SELECT id, {self._columns} FROM feedback{where}{id_clause} ORDER BY id LIMIT ?",
+                params + [last_id, chunk_size],
+            ).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                record = dict(row)
+                last_id = record.pop("id")
+                yield record
+
+    def clear(self) -> int:
+        """Delete every feedback row. Returns the number of rows removed."""
+        conn = self._connection()
+        with conn:
+            return conn.execute("DELETE FROM feedback").rowcount
+
+    def migrate_from_csv(self, csv_path: str) -> int:
+        """One-shot import of an existing feedback CSV. Returns rows imported."""
+        marker = f"csv_migrated:{os.path.abspath(csv_path)}"
+        conn = self._connection()
+        if conn.execute("SELECT 1 FROM meta WHERE key = ?", (marker,)).fetchone():
+            return 0
+        if not os.path.exists(csv_path):
+            return 0
+
+        # Legacy rows carry no timestamp; the file's last change is the best guess
+        legacy_timestamp = datetime.fromtimestamp(os.path.getmtime(csv_path)).isoformat(timespec="seconds")
+        imported = 0
+        with open(csv_path, newline="", encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+            batch = []
+            with conn:
+                # Take the write lock first, so a process migrating at the same time waits and then finds the marker
+                conn.execute("BEGIN IMMEDIATE")
+                if conn.execute("SELECT 1 FROM meta WHERE key = ?", (marker,)).fetchone():
+                    return 0
+                for entry in reader:
+                    batch.append(entry)
+                    if len(batch) >= 5000:
+                        self._insert(conn, batch, legacy_timestamp)
+                        imported += len(batch)
+                        batch = []
+                if batch:
+                    self._insert(conn, batch, legacy_timestamp)
+                    imported += len(batch)
+                conn.execute("INSERT INTO meta (key, value) VALUES (?, ?)", (marker, str(imported)))
+        return imported
+
+    def _insert(self, conn, entries, default_timestamp=None):
+        columns = ", ".join(COLUMNS.values())
+        placeholders = ", ".join("?" for _ in COLUMNS)
+        conn.executemany(
+            f"INSERT INTO feedback ({columns}) VALUES ({placeholders})",
+            [_to_row(entry, default_timestamp) for entry in entries],
+        )
+
+# -----------------------------------------------------------------------------
+# Command Line: one-shot CSV migration
+# -----------------------------------------------------------------------------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Import feedback.csv into the SQLite feedback store.")
+    parser.add_argument("csv_path", nargs="?", default="feedback.csv")
+    parser.add_argument("db_path", nargs="?", default="feedback.db")
+    args = parser.parse_args()
+    count = FeedbackDB(args.db_path).migrate_from_csv(args.csv_path)
+    print(f"Imported {count} rows from {args.csv_path} into {args.db_path}.")
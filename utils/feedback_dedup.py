@@ -0,0 +1,156 @@
+import argparse
+import hashlib
+import re
+import threading
+import time
+
+import numpy as np
+
+# Mersenne prime for the universal hash family; a * x + b stays below 2**63
+_PRIME = (1 << 31) - 1
+_WHITESPACE = re.compile(r"\s+")
+
+def shingles(text: str, size: int = 5) -> set:
+    """Character shingles of the normalised text (case and spacing ignored)."""
+    text = _WHITESPACE.sub(" ", (text or "").lower()).strip()
+    if len(text) <= size:
+        return {text} if text else set()
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+def jaccard(a: set, b: set) -> float:
+    return len(a & b) / len(a | b) if a or b else 1.0
+
+# -----------------------------------------------------------------------------
+# MinHash Signatures
+# -----------------------------------------------------------------------------
+class MinHasher:
+    """MinHash over character shingles using `num_perm` universal hash functions."""
+
+    def __init__(self, num_perm: int = 64, shingle_size: int = 5, seed: int = 1):
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self._a = rng.integers(1, _PRIME, num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, _PRIME, num_perm, dtype=np.uint64)
+
+    def signature(self, text: str) -> np.ndarray:
+        tokens = shingles(text, self.shingle_size)
+        if not tokens:
+            return np.full(self.num_perm, _PRIME, dtype=np.uint32)
+        hashes = np.fromiter(
+            (int.from_bytes(hashlib.blake2b(t.encode("utf-8"), digest_size=4).digest(), "little") for t in tokens),
+            dtype=np.uint64, count=len(tokens),
+        )
+        hashes %= np.uint64(_PRIME)
+        permuted = (hashes[:, None] * self._a[None, :] + self._b[None, :]) % np.uint64(_PRIME)
+        return permuted.min(axis=0).astype(np.uint32)
+
+# -----------------------------------------------------------------------------
+# LSH Index
+# -----------------------------------------------------------------------------
+class NearDuplicateIndex:
+    """Banded LSH over MinHash signatures for sub-linear near-duplicate lookup.
+
+    A signature is split into `bands` bands; two texts become candidates when
+    any band matches exactly. Candidates are confirmed by the fraction of
+    equal signature slots, which estimates their Jaccard similarity.
+    """
+
+    def __init__(self, threshold: float = 0.8, num_perm: int = 64, bands: int = 16):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.hasher = MinHasher(num_perm)
+        self.lock = threading.RLock()
+        self._buckets = [{} for _ in range(bands)]
+        self._signatures = np.empty((0, num_perm), dtype=np.uint32)
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _band_keys(self, signature: np.ndarray) -> list:
+        return [signature[i * self.rows:(i + 1) * self.rows].tobytes() for i in range(self.bands)]
+
+    def query(self, text: str, signature: np.ndarray = None) -> tuple:
+        """Return `(doc_id, estimated_similarity)` of the closest match, or None."""
+        signature = self.hasher.signature(text) if signature is None else signature
+        with self.lock:
+            candidates = set()
+            for bucket, key in zip(self._buckets, self._band_keys(signature)):
+                candidates.update(bucket.get(key, ()))
+            if not candidates:
+                return None
+            ids = np.fromiter(candidates, dtype=np.int64, count=len(candidates))
+            similarity = (self._signatures[ids] == signature).mean(axis=1)
+        top = int(np.argmax(similarity))
+        return (int(ids[top]), float(similarity[top])) if similarity[top] >= self.threshold else None
+
+    def add(self, text: str, signature: np.ndarray = None) -> int:
+        signature = self.hasher.signature(text) if signature is None else signature
+        with self.lock:
+            doc_id = self._count
+            if doc_id == len(self._signatures):
+                # Grow the signature matrix geometrically so appends stay amortised O(1)
+                grown = np.empty((max(1024, 2 * doc_id), self.hasher.num_perm), dtype=np.uint32)
+                grown[:doc_id] = self._signatures[:doc_id]
+                self._signatures = grown
+            self._signatures[doc_id] = signature
+            self._count += 1
+            for bucket, key in zip(self._buckets, self._band_keys(signature)):
+                bucket.setdefault(key, []).append(doc_id)
+        return doc_id
+
+    def check_and_add(self, text: str) -> tuple:
+        """Look for a near duplicate, then index `text`. Returns the match or None."""
+        signature = self.hasher.signature(text)
+        with self.lock:
+            match = self.query(text, signature)
+            self.add(text, signature)
+        return match
+
+    def clear(self) -> None:
+        with self.lock:
+            self._buckets = [{} for _ in range(self.bands)]
+            self._signatures = np.empty((0, self.hasher.num_perm), dtype=np.uint32)
+            self._count = 0
+
+def dedup_text(entry: dict) -> str:
+    """The part of a submission compared for duplicates."""
+    comment = entry.get("Feedback")
+    return comment if isinstance(comment, str) else ""
+
+# -----------------------------------------------------------------------------
+# Command Line: backfill over an existing feedback CSV
+# -----------------------------------------------------------------------------
+if __name__ == "__main__":
+    from utils.feedback_store import iter_rows
+
+    parser = argparse.ArgumentParser(description="Flag near-duplicate feedback in an existing CSV.")
+    parser.add_argument("csv_path", nargs="?", default="feedback.csv")
+    parser.add_argument("--threshold", type=float, default=0.8)
+    parser.add_argument("--min-chars", type=int, default=20, help="ignore shorter comments")
+    args = parser.parse_args()
+
+    index = NearDuplicateIndex(args.threshold)
+    texts, indexed_rows, flagged = [], [], []
+    start = time.perf_counter()
+    for row in iter_rows(args.csv_path, visible_only=False):
+        text = dedup_text(row)
+        texts.append(text)
+        if len(text.strip()) < args.min_chars:
+            continue
+        match = index.check_and_add(text)
+        indexed_rows.append(len(texts) - 1)
+        if match is not None:
+            flagged.append((len(texts) - 1, indexed_rows[match[0]]))
+    elapsed = time.perf_counter() - start
+
+    # Precision: flagged pairs whose exact shingle Jaccard really meets the threshold
+    confirmed = sum(
+        jaccard(shingles(texts[i]), shingles(texts[j])) >= args.threshold for i, j in flagged
+    )
+    print(f"checked {len(texts)} submissions in {elapsed:.2f}s ({len(texts) / max(elapsed, 1e-9):,.0f}/s)")
+    print(f"flagged {len(flagged)} near duplicates; precision {confirmed / len(flagged) if flagged else 1:.3f}")
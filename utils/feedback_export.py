@@ -0,0 +1,91 @@
+import csv
+import io
+import itertools
+import json
+import tempfile
+
+from utils.feedback_store import FEEDBACK_FIELDS
+
+# Display name -> (file extension, MIME type)
+EXPORT_FORMATS = {
+    "CSV": ("csv", "text/csv"),
+    "JSONL": ("jsonl", "application/x-ndjson"),
+    "Parquet": ("parquet", "application/vnd.apache.parquet"),
+}
+
+# Exports stay in memory up to this size and spill to a temp file beyond it
+SPOOL_MAX_BYTES = 8 * 1024 * 1024
+
+def chunked(rows, size: int):
+    """Yield lists of at most `size` rows from any iterable."""
+    iterator = iter(rows)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+def _rating(value):
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return None
+
+# -----------------------------------------------------------------------------
+# Format Writers (each holds one chunk in memory at a time)
+# -----------------------------------------------------------------------------
+def _write_csv(chunks, out) -> int:
+    text = io.TextIOWrapper(out, encoding="utf-8", newline="", write_through=True)
+    writer = csv.DictWriter(text, fieldnames=FEEDBACK_FIELDS, extrasaction="ignore", lineterminator="\n")
+    writer.writeheader()
+    written = 0
+    for chunk in chunks:
+        writer.writerows(chunk)
+        written += len(chunk)
+    text.detach()
+    return written
+
+def _write_jsonl(chunks, out) -> int:
+    written = 0
+    for chunk in chunks:
+        out.write("".join(
+            json.dumps({field: row.get(field) for field in FEEDBACK_FIELDS}, ensure_ascii=False) + "\n"
+            for row in chunk
+        ).encode("utf-8"))
+        written += len(chunk)
+    return written
+
+def _write_parquet(chunks, out) -> int:
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise RuntimeError("Parquet export requires the 'pyarrow' package.") from e
+
+    schema = pa.schema([(field, pa.int64() if field == "Rating" else pa.string()) for field in FEEDBACK_FIELDS])
+    written = 0
+    with pq.ParquetWriter(out, schema, compression="zstd") as writer:
+        for chunk in chunks:
+            columns = {
+                field: [_rating(row.get(field)) if field == "Rating" else (row.get(field) or None) for row in chunk]
+                for field in FEEDBACK_FIELDS
+            }
+            writer.write_table(pa.Table.from_pydict(columns, schema=schema))
+            written += len(chunk)
+    return written
+
+WRITERS = {"CSV": _write_csv, "JSONL": _write_jsonl, "Parquet": _write_parquet}
+
+# -----------------------------------------------------------------------------
+# Streaming Export
+# -----------------------------------------------------------------------------
+def export_feedback(rows, fmt: str, out, chunk_size: int = 5000) -> int:
+    """Stream `rows` to the binary file `out` in `fmt`. Returns rows written."""
+    return WRITERS[fmt](chunked(rows, chunk_size), out)
+
+def export_to_buffer(rows, fmt: str, chunk_size: int = 5000):
+    """Export into a temp-file-backed buffer rewound to the start."""
+    buffer = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+    export_feedback(rows, fmt, buffer, chunk_size)
+    buffer.seek(0)
+    return buffer
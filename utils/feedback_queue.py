@@ -0,0 +1,162 @@
+import json
+import logging
+import queue
+import threading
+import time
+import uuid
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+# -----------------------------------------------------------------------------
+# Write-Behind Feedback Queue
+# -----------------------------------------------------------------------------
+class FeedbackWriteQueue:
+    """Bounded in-memory queue that persists feedback on a background thread.
+
+    `submit` only enqueues the entry and returns an acknowledgement id, so the
+    form never waits on disk. The worker hands entries to `sink` in batches of
+    up to `batch_size`, or whatever has arrived after `flush_interval` seconds.
+    When `max_pending` entries are waiting, `submit` blocks for at most
+    `put_timeout` seconds and then raises `queue.Full` so callers can ask the
+    user to retry.
+
+    A failed batch is retried up to `max_attempts` times, then each entry is
+    tried alone so one bad entry cannot hold up the rest; entries that still
+    fail are appended to the `dead_letter` JSONL file. Once `sink` has
+    written a batch, each of the `after` steps (derived data such as
+    rollups) runs with its own retries, so a failing step never writes the
+    rows again.
+    """
+
+    def __init__(self, sink, after=(), max_pending: int = 1000, batch_size: int = 64,
+                 flush_interval: float = 0.5, put_timeout: float = 0.2, max_attempts: int = 5,
+                 dead_letter: str = None):
+        self._sink = sink
+        self._after = tuple(after)
+        self.max_attempts = max_attempts
+        self.dead_letter = dead_letter
+        self.dead = 0
+        self._queue = queue.Queue(maxsize=max_pending)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.put_timeout = put_timeout
+        self.written = 0
+        self.last_error = None
+        self._closed = False
+        self._worker = threading.Thread(target=self._run, name="feedback-writer", daemon=True)
+        self._worker.start()
+
+    def submit(self, entry: dict) -> str:
+        """Queue an entry for writing and return its acknowledgement id."""
+        if self._closed:
+            raise RuntimeError("Feedback queue is shut down.")
+        ack_id = uuid.uuid4().hex[:12]
+        self._queue.put((ack_id, entry), timeout=self.put_timeout)
+        return ack_id
+
+    def pending(self) -> int:
+        """Approximate number of entries waiting to be written."""
+        return self._queue.qsize()
+
+    def drain(self, timeout: float = 10.0) -> None:
+        """Stop accepting entries and write everything still queued."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            logger.error("Feedback queue did not drain; %d entries not written.", self.pending())
+            return
+        self._worker.join(timeout)
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+            batch = [item]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            self._write(batch, stopping)
+
+        # Drain whatever arrived before the stop marker
+        leftover = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _STOP:
+                leftover.append(item)
+        for start in range(0, len(leftover), self.batch_size):
+            self._write(leftover[start:start + self.batch_size], True)
+
+    def _write(self, batch: list, stopping: bool) -> None:
+        # At shutdown there is no time to back off: one attempt, then the dead-letter file
+        attempts = 1 if stopping else self.max_attempts
+        ack_ids = ", ".join(ack_id for ack_id, _ in batch)
+        entries = [entry for _, entry in batch]
+        if self._attempt(self._sink, entries, attempts, f"feedback write {ack_ids}"):
+            self.written += len(batch)
+            self._run_after(entries, attempts)
+            return
+        if len(batch) == 1:
+            self._bury(*batch[0])
+            return
+        # Isolate the entries that fail on their own
+        for ack_id, entry in batch:
+            if self._attempt(self._sink, [entry], 1, f"feedback write {ack_id}"):
+                self.written += 1
+                self._run_after([entry], attempts)
+            else:
+                self._bury(ack_id, entry)
+
+    def _run_after(self, entries: list, attempts: int) -> None:
+        for step in self._after:
+            label = getattr(step, "__qualname__", "post-write step")
+            if not self._attempt(step, entries, attempts, label):
+                logger.error("Gave up on %s for %d written entries; rebuild it from the store.", label, len(entries))
+
+    def _attempt(self, action, entries: list, attempts: int, label: str) -> bool:
+        """Run `action(entries)` up to `attempts` times with exponential backoff."""
+        delay = 0.1
+        for attempt in range(1, attempts + 1):
+            try:
+                action(entries)
+                return True
+            except Exception as e:
+                self.last_error = e
+                logger.warning("Attempt %d/%d of %s failed: %s", attempt, attempts, label, e)
+                if attempt < attempts:
+                    time.sleep(delay)
+                    delay = min(delay * 2, 5.0)
+        return False
+
+    def _bury(self, ack_id: str, entry: dict) -> None:
+        """Record an entry that could not be written, so it can be replayed by hand."""
+        self.dead += 1
+        if self.dead_letter is None:
+            logger.error("Dropping feedback %s: %r", ack_id, entry)
+            return
+        try:
+            with open(self.dead_letter, "a", encoding="utf-8") as f:
+                record = {"ack_id": ack_id, "error": repr(self.last_error), "entry": entry}
+                f.write(json.dumps(record, default=str) + "\n")
+            logger.error("Feedback %s could not be written; saved to %s.", ack_id, self.dead_letter)
+        except OSError as e:
+            logger.error("Dropping feedback %s (dead-letter file unavailable: %s): %r", ack_id, e, entry)
@@ -0,0 +1,156 @@
+import argparse
+import json
+import os
+import threading
+
+from utils.feedback_store import file_lock, is_visible
+
+# -----------------------------------------------------------------------------
+# Running Feedback Aggregates
+# -----------------------------------------------------------------------------
+class FeedbackRollups:
+    """Rating histogram, per-day rating totals and per-topic counts.
+
+    Every field is updated in O(1) per entry, so the analytics panel never has
+    to scan the feedback store. Only rows shown in the feedback table (not
+    "admin", not blank) are counted.
+    """
+
+    def __init__(self, data: dict = None):
+        data = data or {}
+        self.count = data.get("count", 0)
+        self.rating_count = data.get("rating_count", 0)
+        self.rating_sum = data.get("rating_sum", 0)
+        self.histogram = data.get("histogram", {str(r): 0 for r in range(1, 6)})
+        self.daily = data.get("daily", {})  # "YYYY-MM-DD" -> [ratings, rating sum]
+        self.topics = data.get("topics", {})
+
+    def add(self, entry: dict) -> None:
+        """Fold a single feedback entry into the aggregates."""
+        if not is_visible(entry):
+            return
+        self.count += 1
+        topic = entry.get("Suggested Topic")
+        if topic:
+            self.topics[topic] = self.topics.get(topic, 0) + 1
+        try:
+            rating = int(float(entry.get("Rating")))
+        except (TypeError, ValueError):
+            return
+        self.rating_count += 1
+        self.rating_sum += rating
+        self.histogram[str(rating)] = self.histogram.get(str(rating), 0) + 1
+        day = (entry.get("Timestamp") or "")[:10]
+        if day:
+            totals = self.daily.setdefault(day, [0, 0])
+            totals[0] += 1
+            totals[1] += rating
+
+    def add_many(self, entries) -> None:
+        for entry in entries:
+            self.add(entry)
+
+    @property
+    def mean_rating(self) -> float:
+        return self.rating_sum / self.rating_count if self.rating_count else 0.0
+
+    def daily_means(self) -> dict:
+        """Mean rating per day, oldest first."""
+        return {day: total / count for day, (count, total) in sorted(self.daily.items())}
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "rating_count": self.rating_count,
+            "rating_sum": self.rating_sum,
+            "histogram": self.histogram,
+            "daily": self.daily,
+            "topics": self.topics,
+        }
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, FeedbackRollups) and self.to_dict() == other.to_dict()
+
+def rebuild_rollups(rows) -> FeedbackRollups:
+    """Recompute the aggregates from scratch over every stored row."""
+    rollups = FeedbackRollups()
+    rollups.add_many(rows)
+    return rollups
+
+# -----------------------------------------------------------------------------
+# Persisted Rollups
+# -----------------------------------------------------------------------------
+class RollupStore:
+    """JSON sidecar holding `FeedbackRollups`, shared by every process.
+
+    Writers fold a batch in under the cross-process file lock and replace the
+    file atomically. Readers reuse the last parsed copy until the file changes.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._cached = (None, FeedbackRollups())
+
+    def load(self) -> FeedbackRollups:
+        try:
+            info = os.stat(self.path)
+            stamp = (info.st_ino, info.st_size, info.st_mtime_ns)
+        except FileNotFoundError:
+            return FeedbackRollups()
+        with self._lock:
+            if self._cached[0] != stamp:
+                with open(self.path, encoding="utf-8") as f:
+                    self._cached = (stamp, FeedbackRollups(json.load(f)))
+            return self._cached[1]
+
+    def apply(self, entries) -> None:
+        """Fold newly written entries into the persisted aggregates."""
+        with file_lock(self.path):
+            rollups = self._read()
+            rollups.add_many(entries)
+            self._write(rollups)
+
+    def replace(self, rollups: FeedbackRollups) -> None:
+        """Overwrite the persisted aggregates, e.g. after a rebuild or a clear."""
+        with file_lock(self.path):
+            self._write(rollups)
+
+    def _read(self) -> FeedbackRollups:
+        if not os.path.exists(self.path):
+            return FeedbackRollups()
+        with open(self.path, encoding="utf-8") as f:
+            return FeedbackRollups(json.load(f))
+
+    def _write(self, rollups: FeedbackRollups) -> None:
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(rollups.to_dict(), f)
+        os.replace(tmp_path, self.path)
+
+# -----------------------------------------------------------------------------
+# Command Line: rebuild and consistency check
+# -----------------------------------------------------------------------------
+if __name__ == "__main__":
+    from config import FEEDBACK_BACKEND, FEEDBACK_DB_PATH, FEEDBACK_PATH, FEEDBACK_ROLLUPS_PATH
+
+    parser = argparse.ArgumentParser(description="Rebuild feedback rollups from scratch and compare them.")
+    parser.add_argument("--write", action="store_true", help="replace the stored rollups with the rebuilt ones")
+    args = parser.parse_args()
+
+    if FEEDBACK_BACKEND == "sqlite":
+        from utils.feedback_db import FeedbackDB
+        rows = FeedbackDB(FEEDBACK_DB_PATH).iter_rows(visible_only=False)
+    else:
+        from utils.feedback_store import iter_rows
+        rows = iter_rows(FEEDBACK_PATH, visible_only=False)
+
+    store = RollupStore(FEEDBACK_ROLLUPS_PATH)
+    rebuilt = rebuild_rollups(rows)
+    consistent = rebuilt == store.load()
+    print(f"Rebuilt rollups over {rebuilt.count} entries: {'consistent' if consistent else 'MISMATCH'}")
+    if args.write:
+        store.replace(rebuilt)
+        print(f"Wrote {FEEDBACK_ROLLUPS_PATH}.")
+    elif not consistent:
+        raise SystemExit(1)
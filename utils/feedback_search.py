@@ -0,0 +1,192 @@
+import math
+import re
+import threading
+from array import array
+
+import numpy as np
+import pandas as pd
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+STOPWORDS = frozenset(
+    "a an and are as at be but by for from has have i in is it its me my of on or so "
+    "that the this to was we were what with you your".split()
+)
+
+# (suffix, replacement, minimum stem length) tried longest first
+SUFFIX_RULES = [
+    ("ational", "ate", 2), ("ization", "ize", 2), ("fulness", "ful", 2), ("iveness", "ive", 2),
+    ("ousness", "ous", 2), ("tional", "tion", 2), ("biliti", "ble", 2), ("ements", "", 3),
+    ("ement", "", 3), ("ments", "", 3), ("ment", "", 3), ("ness", "", 3), ("ingly", "", 3),
+    ("edly", "", 3), ("ing", "", 3), ("ies", "y", 2), ("ied", "y", 2), ("sses", "ss", 2),
+    ("ful", "", 3), ("ly", "", 3), ("ed", "", 3), ("es", "", 3), ("s", "", 3),
+]
+
+def stem(word: str) -> str:
+    """Light suffix-stripping stemmer (Porter step 1 plus common derivations)."""
+    if len(word) <= 3 or word.isdigit():
+        return word
+    for suffix, replacement, min_stem in SUFFIX_RULES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= min_stem:
+            if suffix == "s" and word.endswith(("ss", "us", "is")):
+                break
+            word = word[:-len(suffix)] + replacement
+            # "hopping" -> "hopp" -> "hop"
+            if suffix in ("ing", "ed") and len(word) > 3 and word[-1] == word[-2] and word[-1] not in "lsz":
+                word = word[:-1]
+            break
+    # "price"/"pricing" and "guide"/"guides" meet at "pric" and "guid"
+    if len(word) > 4 and word.endswith("e") and not word.endswith("ee"):
+        word = word[:-1]
+    return word
+
+def tokenize(text: str) -> list:
+    """Lower-case, split on non-alphanumerics, drop stopwords and stem."""
+    return [stem(token) for token in TOKEN_PATTERN.findall((text or "").lower()) if token not in STOPWORDS]
+
+def _text(value) -> str:
+    return value if isinstance(value, str) else ""
+
+# Columns that identify a snapshot row for the index
+ROW_KEY_COLUMNS = ["Name", "Feedback", "Timestamp"]
+
+def row_keys(frame: pd.DataFrame) -> np.ndarray:
+    """64-bit content key of each snapshot row, used to check the index still lines up with it."""
+    if frame.empty:
+        return np.empty(0, dtype=np.uint64)
+    return pd.util.hash_pandas_object(frame.reindex(columns=ROW_KEY_COLUMNS), index=False).to_numpy()
+
+# -----------------------------------------------------------------------------
+# Incremental BM25 Index
+# -----------------------------------------------------------------------------
+class FeedbackSearchIndex:
+    """Inverted index over feedback names and comments, ranked with BM25.
+
+    Documents are numbered in the order they are added. `sync` keeps them
+    equal to the row positions of the shared feedback snapshot: it keeps a
+    content key per document and only appends the snapshot's new rows while
+    every earlier key still matches. Rows this process writes are added by
+    `append` as they are written, so `sync` only has to check their keys
+    against the snapshot's tail. If another process's writes interleaved
+    rows, the keys diverge and the index is rebuilt. Postings
+    are compact `array` buffers; queries view them as NumPy arrays without
+    copying and score every matching document at once.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.lock = threading.RLock()
+        self.version = None  # snapshot version the index was last synced with
+        self._keys = np.empty(0, dtype=np.uint64)
+        self._checked = 0  # documents whose keys were compared with a snapshot
+        self._postings = {}  # term -> (doc ids, term frequencies)
+        self._doc_lengths = array("I")
+        self._total_length = 0
+        self._norm_cache = (0, None)
+
+    def __len__(self) -> int:
+        return len(self._doc_lengths)
+
+    def add(self, entry: dict) -> None:
+        self.add_many([entry])
+
+    def add_many(self, entries) -> None:
+        """Index entries as the next documents, in order."""
+        with self.lock:
+            for entry in entries:
+                doc_id = len(self._doc_lengths)
+                terms = tokenize(f"{_text(entry.get('Name'))} {_text(entry.get('Feedback'))}")
+                counts = {}
+                for term in terms:
+                    counts[term] = counts.get(term, 0) + 1
+                for term, tf in counts.items():
+                    postings = self._postings.get(term)
+                    if postings is None:
+                        postings = self._postings[term] = (array("I"), array("I"))
+                    postings[0].append(doc_id)
+                    postings[1].append(tf)
+                self._doc_lengths.append(len(terms))
+                self._total_length += len(terms)
+
+    def append(self, entries) -> None:
+        """Index rows just written by this process, before a snapshot holds them.
+
+        Skipped until the first `sync`, and when the entries are already the
+        last documents (a search synced them first).
+        """
+        entries = list(entries)
+        if not entries:
+            return
+        keys = row_keys(pd.DataFrame(entries))
+        with self.lock:
+            if self.version is None or np.array_equal(self._keys[-len(keys):], keys):
+                return
+            self.add_many(entries)
+            self._keys = np.concatenate([self._keys, keys])
+
+    def sync(self, frame: pd.DataFrame, version=None) -> None:
+        """Make documents match the rows of a snapshot frame, indexing only rows not seen before."""
+        with self.lock:
+            indexed, checked = len(self._doc_lengths), self._checked
+            # Common case: the only new rows are ones `append` indexed; hash just those
+            tail = frame.iloc[checked:] if checked < indexed == len(frame) else None
+            if tail is not None and np.array_equal(self._keys[checked:], row_keys(tail)):
+                self._checked = indexed
+                self.version = version
+                return
+            keys = row_keys(frame)
+            if indexed > len(keys) or len(self._keys) != indexed or not np.array_equal(self._keys, keys[:indexed]):
+                self.clear()
+                indexed = 0
+            self.add_many(frame.iloc[indexed:].reindex(columns=["Name", "Feedback"]).to_dict("records"))
+            self._keys = keys
+            self._checked = len(keys)
+            self.version = version
+
+    def clear(self) -> None:
+        with self.lock:
+            self.version = None
+            self._keys = np.empty(0, dtype=np.uint64)
+            self._checked = 0
+            self._postings = {}
+            self._doc_lengths = array("I")
+            self._total_length = 0
+            self._norm_cache = (0, None)
+
+    def search(self, query: str, limit: int = 20) -> list:
+        """Return `(doc_id, score)` pairs for the best matches, best first."""
+        terms = set(tokenize(query))
+        with self.lock:
+            scores = self._score(terms) if terms and len(self._doc_lengths) else None
+        if scores is None:
+            return []
+
+        matched = np.flatnonzero(scores)
+        if len(matched) > limit:
+            matched = matched[np.argpartition(scores[matched], -limit)[-limit:]]
+        best = matched[np.argsort(-scores[matched], kind="stable")]
+        return [(int(doc_id), float(scores[doc_id])) for doc_id in best]
+
+    def _score(self, terms):
+        # The NumPy views must not outlive this call: an `array` cannot grow
+        # while a buffer over it is still exported.
+        doc_count = len(self._doc_lengths)
+        cached_count, length_norm = self._norm_cache
+        if cached_count != doc_count:
+            lengths = np.frombuffer(self._doc_lengths, dtype=np.uint32).astype(np.float32)
+            length_norm = self.k1 * (1 - self.b + self.b * lengths / np.float32(self._total_length / doc_count))
+            self._norm_cache = (doc_count, length_norm)
+            del lengths
+        scores = None
+        for term in terms:
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            ids = np.frombuffer(postings[0], dtype=np.uint32)
+            tfs = np.frombuffer(postings[1], dtype=np.uint32).astype(np.float32)
+            idf = np.float32(math.log(1 + (doc_count - len(ids) + 0.5) / (len(ids) + 0.5)))
+            if scores is None:
+                scores = np.zeros(doc_count, dtype=np.float32)
+            scores[ids] += idf * (self.k1 + 1) * tfs / (tfs + length_norm[ids])
+        return scores
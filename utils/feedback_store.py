@@ -0,0 +1,234 @@
+import csv
+import io
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# Column order used when a new feedback file is created
+FEEDBACK_FIELDS = ["Name", "Email", "Rating", "Feedback", "Suggested Topic", "Attachment Name", "Timestamp",
+                   "Attachment SHA256"]
+
+# -----------------------------------------------------------------------------
+# Cross-Process File Lock
+# -----------------------------------------------------------------------------
+@contextmanager
+def file_lock(path: str):
+    """Hold an exclusive lock on `<path>.lock` shared by every process."""
+    with open(path + ".lock", "a+b") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        else:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+# -----------------------------------------------------------------------------
+# Append-Only Feedback Journal
+# -----------------------------------------------------------------------------
+class FeedbackJournal:
+    """Append-only CSV journal for feedback entries.
+
+    Each submission is appended as a single CSV row under a cross-process file
+    lock, so the cost of a write does not depend on how many rows already
+    exist. Rows are flushed to the OS immediately and fsync'ed in batches of
+    `fsync_every` rows or every `fsync_interval` seconds, whichever comes first.
+    Torn rows left behind by a crash are removed by a background compaction.
+    """
+
+    def __init__(self, path: str, fsync_every: int = 32, fsync_interval: float = 1.0):
+        self.path = path
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+        self._lock = threading.Lock()
+        self._handle = None
+        self._header = None
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self._compactor = None
+
+    def append(self, entry: dict) -> None:
+        """Append a single feedback entry."""
+        self.append_many([entry])
+
+    def append_many(self, entries: list) -> None:
+        """Append several feedback entries with a single locked write."""
+        if not entries:
+            return
+        with self._lock, file_lock(self.path):
+            self._open()
+            new_fields = [key for entry in entries for key in entry if key not in self._header]
+            if new_fields:
+                # The schema grew: widen the header once, then keep appending
+                self._compact_locked(self._header + list(dict.fromkeys(new_fields)))
+                self._open()
+
+            buffer = io.StringIO()
+            writer = csv.DictWriter(buffer, fieldnames=self._header, lineterminator="\n")
+            writer.writerows(entries)
+            self._handle.write(buffer.getvalue())
+            self._handle.flush()
+
+            self._unsynced += len(entries)
+            if (self._unsynced >= self.fsync_every
+                    or time.monotonic() - self._last_sync >= self.fsync_interval):
+                self._sync()
+
+    def sync(self) -> None:
+        """Force any unsynced rows to stable storage."""
+        with self._lock:
+            if self._handle is not None and self._unsynced:
+                self._sync()
+
+    def close(self) -> None:
+        """Sync and release the journal file handle."""
+        with self._lock:
+            if self._handle is not None:
+                if self._unsynced:
+                    self._sync()
+                self._handle.close()
+                self._handle = None
+
+    def clear(self) -> bool:
+        """Delete the journal. Returns False if there was nothing to delete."""
+        with self._lock, file_lock(self.path):
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+                self._unsynced = 0
+            if not os.path.exists(self.path):
+                return False
+            os.remove(self.path)
+            return True
+
+    def compact(self) -> int:
+        """Rewrite the journal without torn or malformed rows. Returns rows kept."""
+        with self._lock, file_lock(self.path):
+            if not os.path.exists(self.path):
+                return 0
+            self._open()
+            return self._compact_locked(self._header)
+
+    def compact_in_background(self) -> None:
+        """Run `compact()` on a daemon thread unless one is already running."""
+        if self._compactor is not None and self._compactor.is_alive():
+            return
+        self._compactor = threading.Thread(target=self.compact, name="feedback-compactor", daemon=True)
+        self._compactor.start()
+
+    # -------------------------------------------------------------------------
+    # Internals (callers hold both the thread lock and the file lock)
+    # -------------------------------------------------------------------------
+    def _sync(self) -> None:
+        os.fsync(self._handle.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def _open(self) -> None:
+        """(Re)open the journal if it was deleted or replaced by another process."""
+        try:
+            current = os.stat(self.path)
+        except FileNotFoundError:
+            current = None
+
+        if self._handle is not None:
+            if current is not None and os.fstat(self._handle.fileno()).st_ino == current.st_ino:
+                return
+            self._handle.close()
+            self._handle = None
+
+        torn = False
+        if current is None or current.st_size == 0:
+            self._header = list(FEEDBACK_FIELDS)
+        else:
+            with open(self.path, newline="", encoding="utf-8") as f:
+                self._header = next(csv.reader(f), None) or list(FEEDBACK_FIELDS)
+            with open(self.path, "rb") as f:
+                f.seek(-1, os.SEEK_END)
+                torn = f.read(1) != b"\n"
+
+        self._handle = open(self.path, "a", newline="", encoding="utf-8")
+        if current is None or current.st_size == 0:
+            csv.writer(self._handle, lineterminator="\n").writerow(self._header)
+        elif torn:
+            # Terminate the partial row so new rows start on a fresh line
+            self._handle.write("\n")
+            self.compact_in_background()
+        self._handle.flush()
+
+    def _compact_locked(self, header: list) -> int:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        tmp_path = os.path.join(directory, f".{os.path.basename(self.path)}.{os.getpid()}.tmp")
+        kept = 0
+        with open(self.path, newline="", encoding="utf-8") as src, \
+                open(tmp_path, "w", newline="", encoding="utf-8") as dst:
+            reader = csv.reader(src)
+            old_header = next(reader, None) or header
+            writer = csv.writer(dst, lineterminator="\n")
+            writer.writerow(header)
+            positions = [old_header.index(name) if name in old_header else None for name in header]
+            for row in reader:
+                if len(row) != len(old_header):
+                    continue  # torn or blank line
+                writer.writerow(["" if pos is None else row[pos] for pos in positions])
+                kept += 1
+            dst.flush()
+            os.fsync(dst.fileno())
+        os.replace(tmp_path, self.path)
+
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+        self._header = list(header)
+        return kept
+
+# -----------------------------------------------------------------------------
+# Streaming Reads
+# -----------------------------------------------------------------------------
+def is_visible(row: dict) -> bool:
+    """Hide rows from the "admin" account or without a name."""
+    name = (row.get("Name") or "").strip()
+    return bool(name) and name.lower() != "admin"
+
+def matches(row: dict, visible_only=True, min_rating=None, max_rating=None,
+            topic=None, since=None, until=None) -> bool:
+    """CSV counterpart of the SQLite backend's WHERE clause."""
+    if visible_only and not is_visible(row):
+        return False
+    if min_rating is not None or max_rating is not None:
+        try:
+            rating = float(row.get("Rating"))
+        except (TypeError, ValueError):
+            return False
+        if (min_rating is not None and rating < min_rating) or (max_rating is not None and rating > max_rating):
+            return False
+    if topic is not None and row.get("Suggested Topic") != topic:
+        return False
+    timestamp = row.get("Timestamp") or ""
+    if since is not None and timestamp < str(since):
+        return False
+    if until is not None and timestamp >= str(until):
+        return False
+    return True
+
+def iter_rows(path: str, **filters):
+    """Stream rows matching `filters` from the journal without loading it whole."""
+    if not os.path.exists(path):
+        return
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            if matches(row, **filters):
+                yield row
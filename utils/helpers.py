@@ -1,24 +1,100 @@
 import os
 import re
-import pandas as pd
-import streamlit as st
+import atexit
 import json
+import logging
+import queue
+import uuid
+import streamlit as st
 from contextlib import contextmanager
+from config import (
+    FEEDBACK_BACKEND, FEEDBACK_DB_PATH, FEEDBACK_ROLLUPS_PATH, FEEDBACK_DEAD_LETTER_PATH,
+    ATTACHMENTS_DIR, ATTACHMENT_MAX_BYTES, ATTACHMENTS_MAX_TOTAL_BYTES,
+    DUPLICATE_SIMILARITY_THRESHOLD, DUPLICATE_MIN_CHARS, PROGRESS_DIR, PROGRESS_SAVE_DELAY,
+    PROGRESS_COUNTERS_PATH, STYLESHEET_PATH, EXPAND_COLLAPSE_SYNC_DELAY,
+    TOKENIZER_DIR, TOKEN_COUNT_CACHE_SIZE, MODEL_RATES, SCENARIO_TOKEN_AXIS, SCENARIO_REQUEST_AXIS,
+    USAGE_LOG_DIR, USAGE_LOG_BLOCK_BYTES, USAGE_LOG_WORKERS, PREFIX_TREE_MEMORY_BYTES
+)
+from utils import feedback_store
+from utils.attachments import AttachmentQuotaError, AttachmentStore, build_derivatives
+from utils.feedback_db import FeedbackDB
+from utils.feedback_export import export_to_buffer
+from utils.feedback_queue import FeedbackWriteQueue
+from utils.feedback_rollups import FeedbackRollups, RollupStore, rebuild_rollups
+from utils.feedback_store import FeedbackJournal
+from utils.progress_analytics import CounterStore, ProgressCounters, rebuild_counters
+from utils.progress_store import DebouncedProgressWriter, ProgressStore
+from utils.section_registry import SectionSet, section_id
+from utils.stylesheet import Stylesheet
 
-# File paths for feedback and progress tracking
+# File path for feedback
 FEEDBACK_PATH = "feedback.csv"
-PROGRESS_FILE = "progress.json"
+
+# Installs (or replaces) the app stylesheet in the document <head>
+STYLE_INSTALLER = """<script>
+(() => {{
+    let style = document.getElementById("llm-guide-style");
+    if (!style) {{
+        style = document.createElement("style");
+        style.id = "llm-guide-style";
+        document.head.appendChild(style);
+    }}
+    style.textContent = {css};
+}})();
+</script>"""
+
+# Expand/collapse-all buttons; toggled in the browser, synced to the server once clicks settle
+EXPAND_COLLAPSE_HTML = """<div class="expand-collapse-container">
+    <button class="expand-collapse-btn" data-action="expand" title="Expand all">➕</button>
+    <button class="expand-collapse-btn" data-action="collapse" title="Collapse all">➖</button>
+</div>"""
+
+EXPAND_COLLAPSE_JS = """export default function ({ data, parentElement, setTriggerValue }) {
+    let pending = null;
+    let timer = null;
+    const onClick = (event) => {
+        const button = event.target.closest("[data-action]");
+        if (!button) return;
+        pending = button.dataset.action;
+        const open = pending === "expand";
+        document.querySelectorAll('[data-testid="stExpander"] details').forEach((details) => {
+            details.open = open;
+        });
+        clearTimeout(timer);
+        timer = setTimeout(() => setTriggerValue("toggle", pending), data.delay);
+    };
+    parentElement.addEventListener("click", onClick);
+    return () => {
+        parentElement.removeEventListener("click", onClick);
+        clearTimeout(timer);
+    };
+}"""
 
 # -----------------------------------------------------------------------------
 # Custom CSS Injection
 # -----------------------------------------------------------------------------
+@st.cache_resource
+def get_stylesheet() -> Stylesheet:
+    """Process-wide minified copy of style.css, reloaded when the file changes."""
+    return Stylesheet(STYLESHEET_PATH)
+
 def inject_custom_css():
-    """Inject custom CSS from the style.css file."""
+    """Inject the minified style.css once per session, and again only if the file changes.
+
+    A `<style>` element rendered through st.markdown disappears on the next
+    rerun that does not repeat it, so a small script installs the stylesheet
+    in the document <head> instead; it stays there across reruns and page
+    switches until the browser tab is reloaded.
+    """
     try:
-        with open("style.css") as f:
-            st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
+        digest, css = get_stylesheet().load()
     except FileNotFoundError:
         st.warning("Custom CSS file not found. Default styles will be applied.")
+        return
+    if st.session_state.get("custom_css_digest") == digest:
+        return
+    st.html(STYLE_INSTALLER.format(css=json.dumps(css).replace("</", "<\\/")), unsafe_allow_javascript=True)
+    st.session_state["custom_css_digest"] = digest
 
 # -----------------------------------------------------------------------------
 # Session State Initialization
@@ -30,6 +106,9 @@ def init_session_state() -> None:
     st.session_state.setdefault("global_expansion_state", None)
     st.session_state.setdefault("expand_all_triggered", False)
     st.session_state.setdefault("collapse_all_triggered", False)
+    st.session_state.setdefault("expanded_sections", 0)
+    st.session_state.setdefault("progress_saved", {})
+    st.session_state.setdefault("progress_writes_avoided", 0)
 
 # -----------------------------------------------------------------------------
 # Validation Utilities
@@ -42,7 +121,13 @@ def is_valid_email(email: str) -> bool:
 # Expand / Collapse Controls
 # -----------------------------------------------------------------------------
 def display_expand_collapse_controls(current_page: str):
-    """Display expand/collapse buttons for sections."""
+    """Display expand/collapse buttons for sections.
+
+    The buttons open or close every expander in the browser at once, then
+    send a single "toggle" to the server once clicks settle, so a burst of
+    clicks costs one rerun. That rerun records the state and builds the
+    bodies of newly opened sections, which are only rendered when open.
+    """
     visible_on_pages = [
         "Home", "Prompt Engineering", "Temperature & Sampling", "Hallucinations",
         "API Cost Optimization", "Ethics & Bias", "FAQs", "Glossary"
@@ -51,47 +136,85 @@ def display_expand_collapse_controls(current_page: str):
     if current_page not in visible_on_pages:
         return
 
-    # Handle button clicks using Streamlit
-    col1, col2, col3 = st.columns([6, 0.3, 0.5])
-    with col2:
-        if st.button("➕", key="expand-all"):
-            st.session_state["expand_all_triggered"] = True
-            st.session_state["collapse_all_triggered"] = False
-    with col3:
-        if st.button("➖", key="collapse-all"):
-            st.session_state["expand_all_triggered"] = False
-            st.session_state["collapse_all_triggered"] = True
+    # Declared on every run: each runtime keeps its own component registry
+    controls = st.components.v2.component(
+        "expand_collapse_controls",
+        html=EXPAND_COLLAPSE_HTML,
+        js=EXPAND_COLLAPSE_JS,
+        isolate_styles=False,  # use the .expand-collapse-* rules from style.css
+    )
+    result = controls(
+        key="expand-collapse",
+        data={"delay": EXPAND_COLLAPSE_SYNC_DELAY},
+        on_toggle_change=lambda: None,  # surfaces the trigger as result.toggle
+    )
+    # Drawn before the expanders, which read these flags on this run
+    if result.toggle in ("expand", "collapse"):
+        st.session_state["expand_all_triggered"] = result.toggle == "expand"
+        st.session_state["collapse_all_triggered"] = result.toggle == "collapse"
 
 # -----------------------------------------------------------------------------
 # Expander Sections
 # -----------------------------------------------------------------------------
 @contextmanager
 def expander_section(title: str):
-    """Creates a Streamlit expander that respects global or per-section expansion state."""
-    expander_key = f"expander_{title}"
+    """Creates a Streamlit expander that respects global or per-section expansion state.
+
+    Yields whether the expander is open. The expander reports the user
+    opening or closing it, so callers build the body only when it is open:
 
-    # Set default to collapsed
-    if expander_key not in st.session_state:
-        st.session_state[expander_key] = False
+        with expander_section(title) as expanded:
+            if expanded:
+                st.markdown(content)
+    """
+    expand_all = st.session_state.get("expand_all_triggered")
+    collapse_all = st.session_state.get("collapse_all_triggered")
+    sid = section_id(title)
 
-    # Override with global state if set
-    if st.session_state.get("expand_all_triggered"):
-        st.session_state[expander_key] = True
-    elif st.session_state.get("collapse_all_triggered"):
-        st.session_state[expander_key] = False
+    if sid is None:
+        # Sections missing from the registry keep a per-title flag, collapsed by default
+        expander_key = f"expander_{title}"
+        expanded = st.session_state.get(expander_key, False)
+        if expand_all:
+            expanded = True
+        elif collapse_all:
+            expanded = False
+        on_change, args = "rerun", None
+    else:
+        # Expanded sections are bits of one int, indexed by section id
+        expander_key = f"expander_{sid}"
+        bits = st.session_state.get("expanded_sections", 0)
+        if expand_all:
+            bits |= 1 << sid
+        elif collapse_all:
+            bits &= ~(1 << sid)
+        st.session_state["expanded_sections"] = bits
+        expanded = bool(bits >> sid & 1)
+        on_change, args = _sync_expanded_section, (expander_key, sid)
+    st.session_state[expander_key] = expanded
 
     # Return the expander
-    with st.expander(title, expanded=st.session_state[expander_key]):
-        yield
+    with st.expander(title, key=expander_key, on_change=on_change, args=args):
+        yield expanded
+
+def _sync_expanded_section(expander_key: str, sid: int) -> None:
+    """Record a section the user opened or closed in the expanded-sections bits."""
+    bits = st.session_state.get("expanded_sections", 0)
+    if st.session_state[expander_key]:
+        bits |= 1 << sid
+    else:
+        bits &= ~(1 << sid)
+    st.session_state["expanded_sections"] = bits
 
 # -----------------------------------------------------------------------------
 # Reset Controls
 # -----------------------------------------------------------------------------
 def reset_expansion_state() -> None:
     """Reset all expander-related states to collapsed and clear global state."""
+    st.session_state["expanded_sections"] = 0
     for key in list(st.session_state.keys()):
         if key.startswith("expander_"):
-            st.session_state[key] = False
+            del st.session_state[key]  # expander widgets can't be set once drawn this run
     st.session_state.pop("global_expansion_state", None)
 
 def reset_expand_collapse_triggers():
@@ -102,55 +225,339 @@ def reset_expand_collapse_triggers():
 # -----------------------------------------------------------------------------
 # Feedback Persistence
 # -----------------------------------------------------------------------------
-@st.cache_data(ttl=3600)
+@st.cache_resource
+def get_feedback_journal() -> FeedbackJournal:
+    """Process-wide append-only journal backing the feedback CSV."""
+    journal = FeedbackJournal(FEEDBACK_PATH)
+    atexit.register(journal.close)
+    return journal
+
+@st.cache_resource
+def get_feedback_db() -> FeedbackDB:
+    """Process-wide SQLite feedback store; imports feedback.csv on first use."""
+    db = FeedbackDB(FEEDBACK_DB_PATH)
+    db.migrate_from_csv(FEEDBACK_PATH)
+    return db
+
+@st.cache_resource
+def get_feedback_queue() -> FeedbackWriteQueue:
+    """Process-wide write-behind queue in front of the feedback backend."""
+    # Resolve the backend here: the worker thread has no Streamlit script context
+    append_many = get_feedback_db().insert_many if FEEDBACK_BACKEND == "sqlite" else get_feedback_journal().append_many
+    snapshot_cache = get_feedback_snapshot_cache()
+    rollup_store = get_feedback_rollup_store()
+    search_index = get_feedback_search_index()
+
+    def refresh_snapshot(entries):
+        snapshot_cache.bump_version()
+
+    def index_for_search(entries):
+        search_index.append(entry for entry in entries if feedback_store.is_visible(entry))
+
+    # Only append_many writes rows; the derived steps are retried on their own
+    write_queue = FeedbackWriteQueue(
+        append_many, after=(rollup_store.apply, refresh_snapshot, index_for_search),
+        dead_letter=FEEDBACK_DEAD_LETTER_PATH,
+    )
+    atexit.register(write_queue.drain)
+    return write_queue
+
 def store_feedback(entry):
-    """Store feedback entry into a CSV file."""
+    """Queue a feedback entry for a background write. Returns an acknowledgement id."""
     try:
-        if os.path.exists(FEEDBACK_PATH):
-            # Load existing feedback data
-            df = pd.read_csv(FEEDBACK_PATH)
-            # Append the new entry using pd.concat
-            new_entry_df = pd.DataFrame([entry])
-            df = pd.concat([df, new_entry_df], ignore_index=True)
-        else:
-            # Create a new DataFrame for the entry
-            df = pd.DataFrame([entry])
-        # Save the updated DataFrame to the CSV file
-        df.to_csv(FEEDBACK_PATH, index=False)
+        return get_feedback_queue().submit(entry)
+    except queue.Full:
+        st.warning("We're receiving a lot of feedback right now. Please try again in a moment.")
     except Exception as e:
         st.error(f"Error storing feedback: {e}")
+    return None
 
-def load_feedback():
-    """Load feedback entries from the CSV file."""
+def _feedback_rows(**filters):
+    """Zero-argument factory streaming stored rows; safe to call off the script thread."""
+    filters.setdefault("visible_only", False)
+    if FEEDBACK_BACKEND == "sqlite":
+        db = get_feedback_db()
+        return lambda: db.iter_rows(**filters)
+    return lambda: feedback_store.iter_rows(FEEDBACK_PATH, **filters)
+
+@st.cache_resource
+def get_feedback_rollup_store() -> RollupStore:
+    """Process-wide running aggregates; seeded from the store if missing."""
+    rollup_store = RollupStore(FEEDBACK_ROLLUPS_PATH)
+    if not os.path.exists(FEEDBACK_ROLLUPS_PATH):
+        rollup_store.replace(rebuild_rollups(_feedback_rows()()))
+    return rollup_store
+
+def load_feedback_rollups() -> FeedbackRollups:
+    """Current feedback aggregates for the analytics panel."""
     try:
-        if os.path.exists(FEEDBACK_PATH):
-            return pd.read_csv(FEEDBACK_PATH).to_dict(orient="records")
-        return []
+        return get_feedback_rollup_store().load()
+    except Exception as e:
+        st.error(f"Error loading feedback analytics: {e}")
+        return FeedbackRollups()
+
+def check_feedback_rollups() -> bool:
+    """Rebuild the aggregates from scratch and compare them with the running ones."""
+    return rebuild_rollups(_feedback_rows()()) == get_feedback_rollup_store().load()
+
+def make_feedback_export(fmt: str, **filters):
+    """Callable for `st.download_button` that streams the export only when clicked."""
+    rows = _feedback_rows(**filters)
+    return lambda: export_to_buffer(rows(), fmt)
+
+def count_feedback() -> int:
+    """Number of rows shown in the feedback table."""
+    try:
+        if FEEDBACK_BACKEND == "sqlite":
+            return get_feedback_db().count()
+        return len(get_feedback_snapshot_cache().get())
+    except Exception as e:
+        st.error(f"Error counting feedback: {e}")
+        return 0
+
+def load_feedback_page(page: int, page_size: int = 50):
+    """One page (1-based) of the feedback table. SQLite pages with a query; the CSV journal pages the snapshot."""
+    from utils.feedback_cache import build_frame  # pulls in pandas
+    try:
+        if FEEDBACK_BACKEND == "sqlite":
+            return build_frame(get_feedback_db().query_page(page, page_size), max(page - 1, 0) * page_size + 1)
+        return get_feedback_snapshot_cache().get().page(page, page_size)
     except Exception as e:
         st.error(f"Error loading feedback: {e}")
-        return []
+        return None
+
+def clear_feedback() -> bool:
+    """Delete all stored feedback. Returns False if there was nothing to delete."""
+    try:
+        if FEEDBACK_BACKEND == "sqlite":
+            return get_feedback_db().clear() > 0
+        return get_feedback_journal().clear()
+    finally:
+        get_feedback_rollup_store().replace(FeedbackRollups())
+        get_feedback_search_index().clear()
+        get_duplicate_index().clear()
+        get_feedback_snapshot_cache().bump_version()
+
+@st.cache_resource
+def get_feedback_snapshot_cache() -> "FeedbackSnapshotCache":
+    """Process-wide holder of the feedback table view shared by all sessions."""
+    from utils.feedback_cache import FeedbackSnapshotCache, file_stamp  # pulls in pandas
+    if FEEDBACK_BACKEND == "sqlite":
+        return FeedbackSnapshotCache(
+            _feedback_rows(), lambda: file_stamp(FEEDBACK_DB_PATH, FEEDBACK_DB_PATH + "-wal")
+        )
+    return FeedbackSnapshotCache(_feedback_rows(), lambda: file_stamp(FEEDBACK_PATH))
+
+def get_feedback_snapshot():
+    """Current read-only feedback snapshot; rebuilt only after the store changes."""
+    try:
+        return get_feedback_snapshot_cache().get()
+    except Exception as e:
+        st.error(f"Error loading feedback: {e}")
+        return None
+
+@st.cache_resource
+def get_feedback_search_index() -> "FeedbackSearchIndex":
+    """Process-wide BM25 index whose documents are the snapshot's rows, added on write and synced on search."""
+    from utils.feedback_search import FeedbackSearchIndex  # pulls in numpy
+    return FeedbackSearchIndex()
+
+def search_feedback(query: str, limit: int = 20):
+    """Rank visible feedback for `query`. Returns matching rows with a Score column."""
+    index = get_feedback_search_index()
+    with index.lock:
+        snapshot = get_feedback_snapshot()
+        if snapshot is None:
+            return None
+        # Rows written here were indexed on write; other processes' rows are picked up by the resync
+        if index.version != snapshot.version:
+            index.sync(snapshot.frame, snapshot.version)
+        hits = index.search(query, limit)
+
+    results = snapshot.frame.iloc[[doc_id for doc_id, _ in hits]].copy()
+    results.insert(0, "Score", [round(score, 3) for _, score in hits])
+    return results
+
+@st.cache_resource
+def get_duplicate_index() -> "NearDuplicateIndex":
+    """Process-wide MinHash/LSH index, backfilled from the stored comments."""
+    from utils.feedback_dedup import NearDuplicateIndex, dedup_text  # pulls in numpy
+    index = NearDuplicateIndex(DUPLICATE_SIMILARITY_THRESHOLD)
+    for row in _feedback_rows()():
+        text = dedup_text(row)
+        if len(text.strip()) >= DUPLICATE_MIN_CHARS:
+            index.add(text)
+    return index
+
+def is_duplicate_feedback(entry) -> bool:
+    """True if the comment nearly matches one already submitted.
+
+    Only looks the comment up; `index_feedback` adds it once the entry has
+    been accepted, so a submission that fails can be retried.
+    """
+    from utils.feedback_dedup import dedup_text
+    text = dedup_text(entry)
+    if len(text.strip()) < DUPLICATE_MIN_CHARS:
+        return False
+    try:
+        return get_duplicate_index().query(text) is not None
+    except Exception as e:
+        st.error(f"Error checking for duplicate feedback: {e}")
+        return False
+
+def index_feedback(entry) -> None:
+    """Add an accepted entry's comment to the near-duplicate index."""
+    from utils.feedback_dedup import dedup_text
+    text = dedup_text(entry)
+    if len(text.strip()) < DUPLICATE_MIN_CHARS:
+        return
+    try:
+        get_duplicate_index().add(text)
+    except Exception as e:
+        st.error(f"Error indexing feedback for duplicate checks: {e}")
+
+# -----------------------------------------------------------------------------
+# Feedback Attachments
+# -----------------------------------------------------------------------------
+@st.cache_resource
+def get_attachment_store() -> AttachmentStore:
+    """Process-wide content-addressed store for feedback attachments."""
+    return AttachmentStore(ATTACHMENTS_DIR, ATTACHMENT_MAX_BYTES, ATTACHMENTS_MAX_TOTAL_BYTES)
+
+@st.cache_resource
+def get_attachment_worker_pool() -> "ProcessPoolExecutor":
+    """Worker processes for thumbnails and text extraction."""
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    pool = ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context("spawn"))
+    atexit.register(pool.shutdown, wait=False, cancel_futures=True)
+    return pool
+
+def _log_derivative_failure(future):
+    if future.exception() is not None:
+        logging.getLogger(__name__).warning("Attachment preview failed: %s", future.exception())
+
+def store_attachment(uploaded_file):
+    """Persist an uploaded file. Returns `(sha256, is_new)`, or None if it was rejected.
+
+    Hand the result to `finish_attachment` once the feedback that references it was queued or refused.
+    """
+    try:
+        uploaded_file.seek(0)
+        sha256, _, is_new = get_attachment_store().put(uploaded_file)
+    except AttachmentQuotaError as e:
+        st.error(str(e))
+        return None
+    except Exception as e:
+        st.error(f"Error storing attachment: {e}")
+        return None
+    return sha256, is_new
+
+def finish_attachment(uploaded_file, stored, accepted: bool) -> None:
+    """Build derivatives of a newly stored blob whose feedback was queued; release it if the feedback was refused."""
+    sha256, is_new = stored
+    if not is_new:
+        return  # already stored for earlier feedback
+    store = get_attachment_store()
+    if not accepted:
+        try:
+            store.remove(sha256)
+        except Exception as e:
+            st.error(f"Error releasing attachment: {e}")
+        return
+    extension = os.path.splitext(uploaded_file.name)[1]
+    future = get_attachment_worker_pool().submit(
+        build_derivatives, store.blob_path(sha256), store.derived_dir, extension
+    )
+    future.add_done_callback(_log_derivative_failure)
 
 # -----------------------------------------------------------------------------
 # Progress Persistence
 # -----------------------------------------------------------------------------
+@st.cache_resource
+def get_progress_store() -> ProgressStore:
+    """Process-wide sharded store of per-user reading progress."""
+    return ProgressStore(PROGRESS_DIR)
+
+def get_user_id() -> str:
+    """Stable id for the current user: the signed-in email, else a random id kept in the URL."""
+    user_id = st.session_state.get("user_id")
+    if user_id:
+        return user_id
+    try:
+        user_id = st.user.get("email") if st.user.get("is_logged_in") else None
+    except Exception:
+        user_id = None
+    if not user_id:
+        user_id = st.query_params.get("uid", "")
+        if not re.fullmatch(r"[0-9a-f]{32}", user_id):
+            user_id = uuid.uuid4().hex
+            st.query_params["uid"] = user_id
+    st.session_state["user_id"] = user_id
+    return user_id
+
+@st.cache_resource
+def get_progress_writer() -> DebouncedProgressWriter:
+    """Process-wide writer that batches progress changes; flushed at shutdown."""
+    # Counters are updated on the writer thread, never on the checkbox path
+    counter_store = get_progress_counter_store()
+    writer = DebouncedProgressWriter(get_progress_store(), PROGRESS_SAVE_DELAY, on_write=counter_store.apply)
+    atexit.register(writer.close)
+    return writer
+
+@st.cache_resource
+def get_progress_counter_store() -> CounterStore:
+    """Process-wide cross-user progress counters; seeded from the records if missing."""
+    counter_store = CounterStore(PROGRESS_COUNTERS_PATH)
+    if not os.path.exists(PROGRESS_COUNTERS_PATH):
+        counter_store.replace(rebuild_counters(get_progress_store()))
+    return counter_store
+
+def load_progress_counters() -> ProgressCounters:
+    """Current cross-user reading-progress counters for the admin view."""
+    try:
+        return get_progress_counter_store().load()
+    except Exception as e:
+        st.error(f"Error loading progress analytics: {e}")
+        return ProgressCounters()
+
+def check_progress_counters() -> bool:
+    """Rebuild the counters from every record and compare them with the running ones."""
+    return rebuild_counters(get_progress_store()) == get_progress_counter_store().load()
+
 def load_progress():
-    """Load progress from a JSON file."""
+    """Load the current user's progress record, `{"read": bitset}`."""
     try:
-        if os.path.exists(PROGRESS_FILE):
-            with open(PROGRESS_FILE, "r") as f:
-                return json.load(f)
-        return {"read_sections": []}
+        return get_progress_writer().load(get_user_id())
     except Exception as e:
         st.error(f"Error loading progress: {e}")
-        return {"read_sections": []}
+        return {}
+
+def load_read_sections(page_key) -> SectionSet:
+    """The current user's read sections for a page, as a bitset."""
+    sections = SectionSet(page_key, load_progress().get("read", 0))
+    # Remember what is stored so an unchanged page is never rewritten
+    st.session_state.setdefault("progress_saved", {})[page_key] = sections.bits
+    return sections
+
+def read_checkbox_key(title: str) -> str:
+    """Widget key of a section's "Mark as complete" checkbox."""
+    sid = section_id(title)
+    return f"read_checkbox_{title}" if sid is None else f"read_{sid}"
 
 def save_progress(page_key):
-    """Save progress for a specific page to a JSON file."""
+    """Save the current user's progress for a page if it changed since the last save."""
+    sections = st.session_state.get(page_key)
+    bits = sections.bits if isinstance(sections, SectionSet) else 0
+    saved = st.session_state.setdefault("progress_saved", {})
+    if saved.get(page_key, 0) == bits:
+        st.session_state["progress_writes_avoided"] = st.session_state.get("progress_writes_avoided", 0) + 1
+        return
     try:
-        progress_data = load_progress()
-        progress_data[page_key] = list(st.session_state.get(page_key, []))
-        with open(PROGRESS_FILE, "w") as f:
-            json.dump(progress_data, f)
+        if get_progress_writer().submit(get_user_id(), page_key, bits):
+            # Folded into a write that was already waiting
+            st.session_state["progress_writes_avoided"] = st.session_state.get("progress_writes_avoided", 0) + 1
+        saved[page_key] = bits
     except Exception as e:
         st.error(f"Error saving progress: {e}")
 
@@ -161,15 +568,96 @@ def reset_progress(sections, page_key):
 
     # Clear all checkboxes and read sections
     for title in sections.keys():
-        checkbox_key = f"read_checkbox_{title}"
+        checkbox_key = read_checkbox_key(title)
         if checkbox_key in st.session_state:
             del st.session_state[checkbox_key]  # Remove the key entirely
 
     # Reset the read sections set for the current page
-    st.session_state[page_key] = set()
+    st.session_state[page_key] = SectionSet(page_key)
 
     # Set a flag to indicate that reset was triggered
     st.session_state["reset_triggered"] = True
 
     # Save progress to file
-    save_progress(page_key)
\ No newline at end of file
+    save_progress(page_key)
+
+# -----------------------------------------------------------------------------
+# Token Counting
+# -----------------------------------------------------------------------------
+@st.cache_resource
+def get_token_counter() -> "TokenCounter":
+    """Process-wide token counter; the tokenizer is loaded from TOKENIZER_DIR once."""
+    from utils.token_counter import TokenCounter  # may pull in transformers
+    return TokenCounter(TOKENIZER_DIR, TOKEN_COUNT_CACHE_SIZE)
+
+# -----------------------------------------------------------------------------
+# Cost Scenarios
+# -----------------------------------------------------------------------------
+@st.cache_resource
+def get_cost_grid() -> "ScenarioGrid":
+    """Process-wide cost grid over every model and estimator slider position."""
+    from utils.cost_scenarios import axis, build_grid  # pulls in numpy
+    tokens = axis(*SCENARIO_TOKEN_AXIS)
+    return build_grid(MODEL_RATES, tokens, tokens, axis(*SCENARIO_REQUEST_AXIS))
+
+# -----------------------------------------------------------------------------
+# Usage Logs
+# -----------------------------------------------------------------------------
+@st.cache_resource
+def get_usage_log_pool() -> "ProcessPoolExecutor":
+    """Worker processes that summarize byte ranges of large usage logs."""
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    pool = ProcessPoolExecutor(max_workers=USAGE_LOG_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+    atexit.register(pool.shutdown, wait=False, cancel_futures=True)
+    return pool
+
+def list_usage_logs() -> list:
+    """Log files in USAGE_LOG_DIR, the only server-side files the analyzer reads."""
+    if not os.path.isdir(USAGE_LOG_DIR):
+        return []
+    return sorted(
+        name for name in os.listdir(USAGE_LOG_DIR)
+        if name.lower().endswith((".csv", ".jsonl", ".ndjson", ".json"))
+    )
+
+@contextmanager
+def usage_log_path(source):
+    """Path of a usage log: an uploaded file, or the name of a file in USAGE_LOG_DIR.
+
+    Uploads live in memory; they are spooled to a temporary file so the
+    analyzers can read them in blocks and byte ranges.
+    """
+    import shutil
+    import tempfile
+    if isinstance(source, str):
+        yield os.path.join(USAGE_LOG_DIR, os.path.basename(source))
+        return
+    with tempfile.NamedTemporaryFile(suffix=os.path.splitext(source.name)[1], delete=False) as tmp:
+        shutil.copyfileobj(source, tmp, 1024 * 1024)
+    try:
+        yield tmp.name
+    finally:
+        os.remove(tmp.name)
+
+def analyze_usage_log(source, progress=None) -> "UsageReport":
+    """Price a usage log given as an upload or a file name in USAGE_LOG_DIR."""
+    from utils.usage_logs import analyze_log  # pulls in pandas
+    pool = get_usage_log_pool() if USAGE_LOG_WORKERS > 1 else None
+    with usage_log_path(source) as path:
+        return analyze_log(path, MODEL_RATES, pool, USAGE_LOG_BLOCK_BYTES, progress)
+
+def simulate_response_cache(source, scenarios, settings, progress=None) -> "CacheReport":
+    """Replay a request log through response-cache scenarios at the page's rates."""
+    from utils.cache_simulator import simulate_log  # pulls in pandas
+    with usage_log_path(source) as path:
+        return simulate_log(path, scenarios, MODEL_RATES, settings, USAGE_LOG_BLOCK_BYTES, progress)
+
+def estimate_prefix_caching(source, rules, progress=None) -> "PrefixReport":
+    """Estimate prefix-caching savings on a request log's prompts, tokenized by the page's token counter."""
+    from utils.prefix_cache import estimate_log  # pulls in pandas
+    with usage_log_path(source) as path:
+        return estimate_log(
+            path, MODEL_RATES, get_token_counter().token_ids, rules, PREFIX_TREE_MEMORY_BYTES,
+            USAGE_LOG_BLOCK_BYTES, progress,
+        )
@@ -0,0 +1,235 @@
+import argparse
+import os
+import sys
+import time
+from array import array
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from utils.usage_logs import iter_frames
+
+# Columns read from a request log
+PROMPT_COLUMNS = ("model", "prompt")
+# Prompts tokenized per call; bounds the token-id lists held at once
+_ENCODE_BATCH = 1024
+# Dict entry per edge beyond the table itself: its int key and int value
+_EDGE_BYTES = 64
+
+# -----------------------------------------------------------------------------
+# Radix Tree over Token Ids
+# -----------------------------------------------------------------------------
+class PrefixTree:
+    """Radix tree of token-id sequences whose edge labels are slices of one token array.
+
+    Node 0 is the root. Every other node's edge is `tokens[start:start + length]`,
+    reached from its parent under the key `parent << 32 | first token`, so
+    nodes carry no child dicts. Splitting an edge puts the new node above the
+    old one, so no children are re-keyed.
+    """
+
+    def __init__(self):
+        self.tokens = np.zeros(1024, dtype=np.uint32)
+        self.stored = 0
+        self._start = array("q", [0])
+        self._length = array("q", [0])
+        self._parent = array("q", [0])
+        self._edges = {}
+
+    @property
+    def nodes(self) -> int:
+        return len(self._start)
+
+    @property
+    def memory_bytes(self) -> int:
+        """Approximate bytes held: the token array, the node arrays and the edge dict."""
+        node_bytes = self._start.itemsize * 3 * len(self._start)
+        return self.tokens.nbytes + node_bytes + sys.getsizeof(self._edges) + _EDGE_BYTES * len(self._edges)
+
+    def insert(self, ids: np.ndarray, grow: bool = True) -> int:
+        """Length of the longest prefix of `ids` already in the tree; the rest is added if `grow`."""
+        tokens, edges = self.tokens, self._edges
+        node, i, n = 0, 0, len(ids)
+        while i < n:
+            child = edges.get(node << 32 | int(ids[i]))
+            if child is None:
+                break
+            start, length = self._start[child], self._length[child]
+            span = min(length, n - i)
+            mismatch = np.flatnonzero(tokens[start:start + span] != ids[i:i + span])
+            matched = int(mismatch[0]) if len(mismatch) else span
+            i += matched
+            if matched < length:
+                if grow and i < n:
+                    node = self._split(child, matched)
+                break
+            node = child
+        shared = i
+        if grow and i < n:
+            self._add_leaf(node, ids[i:])
+        return shared
+
+    def _add_node(self, parent: int, start: int, length: int) -> int:
+        node = len(self._start)
+        self._start.append(start)
+        self._length.append(length)
+        self._parent.append(parent)
+        self._edges[parent << 32 | int(self.tokens[start])] = node
+        return node
+
+    def _split(self, child: int, at: int) -> int:
+        start = self._start[child]
+        middle = self._add_node(self._parent[child], start, at)  # replaces the parent's edge to `child`
+        self._start[child] = start + at
+        self._length[child] -= at
+        self._parent[child] = middle
+        self._edges[middle << 32 | int(self.tokens[start + at])] = child
+        return middle
+
+    def _add_leaf(self, parent: int, ids: np.ndarray):
+        end = self.stored + len(ids)
+        if end > len(self.tokens):
+            # Grow by a quarter rather than double, so the array overshoots the memory budget by little
+            grown = np.zeros(max(end, len(self.tokens) * 5 // 4), dtype=np.uint32)
+            grown[:self.stored] = self.tokens[:self.stored]
+            self.tokens = grown
+        self.tokens[self.stored:end] = ids
+        self._add_node(parent, self.stored, len(ids))
+        self.stored = end
+
+# -----------------------------------------------------------------------------
+# Provider Caching Rules
+# -----------------------------------------------------------------------------
+class PrefixRules(NamedTuple):
+    min_tokens: int = 1024  # shortest prefix a provider caches
+    step: int = 128  # longer prefixes are cached in whole steps of this many tokens
+    discount: float = 0.5  # share of the input rate waived on cached tokens
+
+    def cached_tokens(self, shared: int) -> int:
+        if shared < self.min_tokens:
+            return 0
+        return self.min_tokens + (shared - self.min_tokens) // max(self.step, 1) * max(self.step, 1)
+
+# -----------------------------------------------------------------------------
+# Estimate
+# -----------------------------------------------------------------------------
+class PrefixStats(NamedTuple):
+    model: str
+    prompts: int
+    prompt_tokens: int
+    shared_tokens: int  # tokens of each prompt already seen as the prefix of an earlier one
+    cached_tokens: int  # shared tokens a provider would bill as cached
+    cost: float  # input cost without prefix caching; NaN for models without a rate
+    cached_cost: float
+
+    @property
+    def saved(self) -> float:
+        return self.cost - self.cached_cost
+
+class PrefixReport(NamedTuple):
+    stats: list
+    prompts: int
+    skipped: int
+    nodes: int
+    stored_tokens: int
+    memory_bytes: int
+    truncated: int  # prompts matched but not added once the memory budget was reached
+    seconds: float
+
+    @property
+    def prompts_per_second(self) -> float:
+        return self.prompts / self.seconds if self.seconds else 0.0
+
+    def frame(self) -> pd.DataFrame:
+        return pd.DataFrame([
+            {
+                "Model": s.model, "Prompts": s.prompts, "Prompt tokens": s.prompt_tokens,
+                "Shared-prefix tokens": s.shared_tokens,
+                "Shared share": s.shared_tokens / s.prompt_tokens if s.prompt_tokens else 0.0,
+                "Cached tokens": s.cached_tokens, "Input cost": s.cost, "With prefix caching": s.cached_cost,
+                "Saved": s.saved,
+            }
+            for s in self.stats
+        ])
+
+def estimate_log(path: str, rates: dict, encode, rules: PrefixRules = PrefixRules(),
+                 memory_budget: int = 256 * 1024 * 1024, block_bytes: int = 32 * 1024 * 1024,
+                 progress=None) -> PrefixReport:
+    """Estimate provider prefix-caching savings for the prompts of a CSV/JSONL request log.
+
+    Prompts are replayed in file order into one prefix tree per model (as
+    provider caches are per model); each prompt's shared prefix is the
+    longest one any earlier prompt of that model started with. `encode`
+    maps a list of texts to token-id lists. Once the trees hold
+    `memory_budget` bytes they stop growing and later prompts are only
+    matched, which makes the estimate a lower bound.
+    """
+    start = time.perf_counter()
+    size = os.path.getsize(path)
+    trees, totals = {}, {}  # model -> PrefixTree, model -> [prompts, tokens, shared, cached]
+    prompts, skipped, truncated, memory = 0, 0, 0, 0
+
+    for frame, done_bytes in iter_frames(path, PROMPT_COLUMNS, block_bytes):
+        if "model" not in frame or "prompt" not in frame:
+            skipped += len(frame)
+            continue
+        valid = frame["model"].notna() & frame["prompt"].notna()
+        skipped += int((~valid).sum())
+        models = frame.loc[valid, "model"].astype(str).tolist()
+        texts = frame.loc[valid, "prompt"].astype(str).tolist()
+        for first in range(0, len(texts), _ENCODE_BATCH):
+            batch = texts[first:first + _ENCODE_BATCH]
+            for model, ids in zip(models[first:first + _ENCODE_BATCH], encode(batch)):
+                tree = trees.get(model)
+                if tree is None:
+                    tree = trees[model] = PrefixTree()
+                    totals[model] = [0, 0, 0, 0]
+                grow = memory < memory_budget
+                before = tree.memory_bytes
+                shared = tree.insert(np.asarray(ids, dtype=np.uint32), grow)
+                memory += tree.memory_bytes - before
+                truncated += not grow and shared < len(ids)
+                total = totals[model]
+                total[0] += 1
+                total[1] += len(ids)
+                total[2] += shared
+                total[3] += rules.cached_tokens(shared)
+        prompts += len(texts)
+        if progress:
+            progress(min(done_bytes / size, 1.0))
+
+    stats = []
+    for model, (count, tokens, shared, cached) in sorted(totals.items()):
+        rate = rates[model]["in"] / 1000 if model in rates else float("nan")
+        cost = tokens * rate
+        stats.append(PrefixStats(model, count, tokens, shared, cached, cost, cost - cached * rate * rules.discount))
+    return PrefixReport(
+        stats, prompts, skipped, sum(t.nodes for t in trees.values()), sum(t.stored for t in trees.values()),
+        memory, truncated, time.perf_counter() - start,
+    )
+
+# -----------------------------------------------------------------------------
+# Command Line: prefix-caching savings of a request log
+# -----------------------------------------------------------------------------
+if __name__ == "__main__":
+    from config import MODEL_RATES, PREFIX_TREE_MEMORY_BYTES, TOKENIZER_DIR, USAGE_LOG_BLOCK_BYTES
+    from utils.token_counter import TokenCounter
+
+    parser = argparse.ArgumentParser(description="Estimate what provider prefix caching saves on a request log.")
+    parser.add_argument("path")
+    parser.add_argument("--tokenizer-dir", default=TOKENIZER_DIR)
+    parser.add_argument("--min-tokens", type=int, default=PrefixRules().min_tokens)
+    parser.add_argument("--step", type=int, default=PrefixRules().step)
+    parser.add_argument("--discount", type=float, default=PrefixRules().discount)
+    parser.add_argument("--memory-mb", type=int, default=PREFIX_TREE_MEMORY_BYTES // 2**20)
+    args = parser.parse_args()
+
+    counter = TokenCounter(args.tokenizer_dir)
+    report = estimate_log(
+        args.path, MODEL_RATES, counter.token_ids, PrefixRules(args.min_tokens, args.step, args.discount),
+        args.memory_mb * 2**20, USAGE_LOG_BLOCK_BYTES,
+    )
+    print(report.frame().to_string(index=False))
+    print(f"{report.prompts:,} prompts ({report.skipped:,} skipped, tokens: {counter.name}) in {report.seconds:.1f}s; "
+          f"{report.nodes:,} nodes, {report.stored_tokens:,} tokens, {report.memory_bytes / 2**20:,.0f} MiB")
@@ -0,0 +1,168 @@
+import argparse
+import json
+import os
+import threading
+
+from utils.feedback_store import file_lock
+from utils.progress_store import decode_record
+from utils.section_registry import GROUP_MASKS, READING_GROUPS, SECTIONS
+
+# -----------------------------------------------------------------------------
+# Running Reading-Progress Counters
+# -----------------------------------------------------------------------------
+class ProgressCounters:
+    """How many learners have read each section and started or finished each page.
+
+    Counters move by the difference between a learner's record before and
+    after a write, so the admin view never has to scan per-user records. A
+    `ProgressCounters` can also hold a batch of such differences (possibly
+    negative) that `add` folds into the stored totals.
+    """
+
+    def __init__(self, data: dict = None):
+        data = data or {}
+        self.learners = data.get("learners", 0)  # users with at least one section read
+        self.sections = data.get("sections", [])  # readers per section id
+        self.started = data.get("started", {})  # page key -> users with a section read there
+        self.completed = data.get("completed", {})  # page key -> users with every section read
+        if len(self.sections) < len(SECTIONS):
+            self.sections += [0] * (len(SECTIONS) - len(self.sections))
+
+    def apply_change(self, before: int, after: int) -> None:
+        """Count one learner's record changing from bits `before` to `after`."""
+        registered = (1 << len(SECTIONS)) - 1
+        before &= registered
+        after &= registered
+        changed = before ^ after
+        if not changed:
+            return
+        self.learners += bool(after) - bool(before)
+        bit = 0
+        while changed >> bit:
+            if changed >> bit & 1:
+                self.sections[bit] += 1 if after >> bit & 1 else -1
+            bit += 1
+        for group in READING_GROUPS:
+            mask = GROUP_MASKS[group]
+            if changed & mask:
+                self.started[group] = self.started.get(group, 0) + bool(after & mask) - bool(before & mask)
+                self.completed[group] = (
+                    self.completed.get(group, 0) + ((after & mask) == mask) - ((before & mask) == mask)
+                )
+
+    def add(self, other: "ProgressCounters") -> None:
+        """Fold in another set of counters or differences."""
+        self.learners += other.learners
+        for i, count in enumerate(other.sections):
+            self.sections[i] += count
+        for group, count in other.started.items():
+            self.started[group] = self.started.get(group, 0) + count
+        for group, count in other.completed.items():
+            self.completed[group] = self.completed.get(group, 0) + count
+
+    def completion_rate(self, group: str) -> float:
+        """Share of learners who started a page and read every section of it."""
+        started = self.started.get(group, 0)
+        return self.completed.get(group, 0) / started if started else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "learners": self.learners,
+            "sections": self.sections,
+            "started": {group: count for group, count in self.started.items() if count},
+            "completed": {group: count for group, count in self.completed.items() if count},
+        }
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, ProgressCounters) and self.to_dict() == other.to_dict()
+
+def counters_from_changes(changes) -> ProgressCounters:
+    """Differences produced by a batch of `(bits before, bits after)` record writes."""
+    delta = ProgressCounters()
+    for before, after in changes:
+        delta.apply_change(before, after)
+    return delta
+
+def rebuild_counters(store) -> ProgressCounters:
+    """Recompute the counters from scratch over every record in a `ProgressStore`."""
+    counters = ProgressCounters()
+    for directory, _, names in os.walk(store.root):
+        for name in names:
+            if name.endswith(".json"):
+                with open(os.path.join(directory, name), encoding="utf-8") as f:
+                    counters.apply_change(0, decode_record(json.load(f))["read"])
+    return counters
+
+# -----------------------------------------------------------------------------
+# Persisted Counters
+# -----------------------------------------------------------------------------
+class CounterStore:
+    """JSON sidecar holding `ProgressCounters`, shared by every process.
+
+    The progress writer folds each batch of record changes in under the
+    cross-process file lock, off the script thread. Readers reuse the last
+    parsed copy until the file changes.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._cached = (None, ProgressCounters())
+
+    def load(self) -> ProgressCounters:
+        try:
+            info = os.stat(self.path)
+            stamp = (info.st_ino, info.st_size, info.st_mtime_ns)
+        except FileNotFoundError:
+            return ProgressCounters()
+        with self._lock:
+            if self._cached[0] != stamp:
+                with open(self.path, encoding="utf-8") as f:
+                    self._cached = (stamp, ProgressCounters(json.load(f)))
+            return self._cached[1]
+
+    def apply(self, changes) -> None:
+        """Fold a batch of `(bits before, bits after)` record writes into the counters."""
+        delta = counters_from_changes(changes)
+        with file_lock(self.path):
+            counters = self._read()
+            counters.add(delta)
+            self._write(counters)
+
+    def replace(self, counters: ProgressCounters) -> None:
+        """Overwrite the persisted counters, e.g. after a rebuild."""
+        with file_lock(self.path):
+            self._write(counters)
+
+    def _read(self) -> ProgressCounters:
+        if not os.path.exists(self.path):
+            return ProgressCounters()
+        with open(self.path, encoding="utf-8") as f:
+            return ProgressCounters(json.load(f))
+
+    def _write(self, counters: ProgressCounters) -> None:
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(counters.to_dict(), f)
+        os.replace(tmp_path, self.path)
+
+# -----------------------------------------------------------------------------
+# Command Line: rebuild and consistency check
+# -----------------------------------------------------------------------------
+if __name__ == "__main__":
+    from config import PROGRESS_COUNTERS_PATH, PROGRESS_DIR
+    from utils.progress_store import ProgressStore
+
+    parser = argparse.ArgumentParser(description="Rebuild reading-progress counters from scratch and compare them.")
+    parser.add_argument("--write", action="store_true", help="replace the stored counters with the rebuilt ones")
+    args = parser.parse_args()
+
+    store = CounterStore(PROGRESS_COUNTERS_PATH)
+    rebuilt = rebuild_counters(ProgressStore(PROGRESS_DIR, cache_size=0))
+    consistent = rebuilt == store.load()
+    print(f"Rebuilt counters over {rebuilt.learners} learners: {'consistent' if consistent else 'MISMATCH'}")
+    if args.write:
+        store.replace(rebuilt)
+        print(f"Wrote {PROGRESS_COUNTERS_PATH}.")
+    elif not consistent:
+        raise SystemExit(1)
@@ -0,0 +1,284 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+from utils.feedback_store import file_lock
+from utils.section_registry import bits_from_titles, group_mask
+
+logger = logging.getLogger(__name__)
+
+def decode_record(raw: dict) -> dict:
+    """Normalise a stored record to `{"read": bitset}`, converting the old title-list format."""
+    if "read" in raw:
+        return {"read": int(raw["read"])}
+    bits = 0
+    for value in raw.values():
+        if isinstance(value, list):
+            bits |= bits_from_titles(value)
+    return {"read": bits}
+
+def apply_pages(record: dict, pages: dict) -> dict:
+    """Record with each page's bits replaced by the given bitsets."""
+    read = record.get("read", 0)
+    for group, bits in pages.items():
+        mask = group_mask(group)
+        read = (read & ~mask) | (bits & mask)
+    return {"read": read}
+
+# -----------------------------------------------------------------------------
+# Sharded Per-User Progress Store
+# -----------------------------------------------------------------------------
+class ProgressStore:
+    """Reading progress kept as one small JSON record per user.
+
+    A record is `{"read": n}`, where bit i of n is set if the user has read
+    the section with registry id i. Records in the older
+    `{page key: [titles]}` format are converted when they are read.
+
+    Records live under `root/ab/cd/<sha256 of user id>.json`, so a directory
+    never holds more than a few hundred files and reading or writing one user
+    touches only that user's record, however many users there are. Writes go
+    to a temp file in the same shard and are renamed into place, so a reader
+    sees either the old record or the new one. Updates to a shard are
+    serialised with a cross-process lock on `root/ab/cd.lock`.
+
+    Parsed records are kept in an LRU of up to `cache_size` users, keyed by
+    path and validated against the file's inode, mtime and size. Since every
+    write renames a new file into place, a change by any process gives the
+    record a new inode and the next load re-reads it; otherwise a load costs
+    one `stat`.
+    """
+
+    def __init__(self, root: str, cache_size: int = 10_000):
+        self.root = root
+        self.cache_size = cache_size
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._cache = OrderedDict()  # path -> (stat key, record)
+        self._cache_lock = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+
+    def record_path(self, user_id: str) -> str:
+        digest = hashlib.sha256(user_id.encode("utf-8")).hexdigest()
+        return os.path.join(self.root, digest[:2], digest[2:4], f"{digest}.json")
+
+    def load(self, user_id: str) -> dict:
+        """The user's progress record, `{"read": bitset}`."""
+        path = self.record_path(user_id)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return {}
+        key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        with self._cache_lock:
+            cached = self._cache.get(path)
+            if cached is not None and cached[0] == key:
+                self._cache.move_to_end(path)
+                self.cache_hits += 1
+                return dict(cached[1])
+            self.cache_misses += 1
+
+        try:
+            with open(path, encoding="utf-8") as f:
+                stat = os.fstat(f.fileno())
+                record = decode_record(json.load(f))
+        except FileNotFoundError:
+            return {}
+        self._remember(path, (stat.st_ino, stat.st_mtime_ns, stat.st_size), record)
+        return dict(record)
+
+    def save(self, user_id: str, record: dict) -> None:
+        """Replace the user's whole record atomically."""
+        path = self.record_path(user_id)
+        shard = os.path.dirname(path)
+        os.makedirs(shard, exist_ok=True)
+        with file_lock(shard):
+            self._write(path, decode_record(record))
+
+    def update(self, user_id: str, pages: dict) -> tuple:
+        """Set the read bits of the given pages (`{page key: bitset}`), keeping the rest.
+
+        Returns the record before and after the update.
+        """
+        path = self.record_path(user_id)
+        shard = os.path.dirname(path)
+        os.makedirs(shard, exist_ok=True)
+        with file_lock(shard):
+            before = self.load(user_id)
+            record = apply_pages(before, pages)
+            self._write(path, record)
+        return before, record
+
+    def _write(self, path: str, record: dict) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(record, f, separators=(",", ":"))
+                f.flush()
+                os.fsync(f.fileno())
+                stat = os.fstat(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        self._remember(path, (stat.st_ino, stat.st_mtime_ns, stat.st_size), dict(record))
+
+    def _remember(self, path: str, key: tuple, record: dict) -> None:
+        if not self.cache_size:
+            return
+        with self._cache_lock:
+            self._cache[path] = (key, record)
+            self._cache.move_to_end(path)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+# -----------------------------------------------------------------------------
+# Debounced Writer
+# -----------------------------------------------------------------------------
+class DebouncedProgressWriter:
+    """Coalesces progress changes per user and writes them on a background thread.
+
+    A change is written `delay` seconds after the first unsaved change for that
+    user, together with every later change made in the meantime, so a burst of
+    checkbox toggles costs one record write. `load` overlays changes that are
+    not on disk yet. Pending changes are written by `close` at shutdown, and a
+    failed write is retried after another `delay`. After each batch,
+    `on_write` (if given) is called on the writer thread with the
+    `(bits before, bits after)` of every record written.
+    """
+
+    def __init__(self, store: ProgressStore, delay: float = 1.0, on_write=None):
+        self.store = store
+        self.delay = delay
+        self.on_write = on_write
+        self.written = 0
+        self._cond = threading.Condition()
+        self._pending = {}  # user id -> {page key: bitset}
+        self._due = {}  # user id -> monotonic time the pending pages are written
+        self._writing = {}  # user id -> pages being written right now
+        self._closing = False
+        self._worker = threading.Thread(target=self._run, name="progress-writer", daemon=True)
+        self._worker.start()
+
+    def submit(self, user_id: str, page_key: str, bits: int) -> bool:
+        """Schedule a page's read bits for writing. True if it replaced an unwritten change."""
+        with self._cond:
+            pages = self._pending.setdefault(user_id, {})
+            replaced = page_key in pages
+            pages[page_key] = bits
+            if user_id not in self._due:
+                self._due[user_id] = time.monotonic() + (0 if self._closing else self.delay)
+                self._cond.notify()
+        return replaced
+
+    def load(self, user_id: str) -> dict:
+        """The user's record including changes not yet written."""
+        # Read under the lock so a write finishing in between cannot be missed
+        with self._cond:
+            record = self.store.load(user_id)
+            record = apply_pages(record, self._writing.get(user_id, {}))
+            return apply_pages(record, self._pending.get(user_id, {}))
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        """Write all pending changes now. False if they were not written within `timeout`."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            now = time.monotonic()
+            for user_id in self._due:
+                self._due[user_id] = now
+            self._cond.notify_all()
+            while self._pending or self._writing:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def close(self, timeout: float = 10.0) -> None:
+        """Write what is pending and stop the worker."""
+        with self._cond:
+            self._closing = True
+        if not self.flush(timeout):
+            logger.error("Progress for %d users was not written at shutdown.", len(self._pending))
+        with self._cond:
+            self._cond.notify_all()
+        self._worker.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    now = time.monotonic()
+                    ready = [user_id for user_id, due in self._due.items() if due <= now]
+                    if ready or (self._closing and not self._due):
+                        break
+                    self._cond.wait(min(self._due.values()) - now if self._due else None)
+                if not ready:
+                    return
+                batch = {}
+                for user_id in ready:
+                    del self._due[user_id]
+                    batch[user_id] = self._pending.pop(user_id)
+                self._writing.update(batch)
+
+            changes = []
+            for user_id, pages in batch.items():
+                try:
+                    before, after = self.store.update(user_id, pages)
+                    changes.append((before.get("read", 0), after["read"]))
+                    self.written += 1
+                except Exception as e:
+                    logger.warning("Retrying progress write: %s", e)
+                    with self._cond:
+                        # Newer changes win over the ones that failed
+                        self._pending[user_id] = {**pages, **self._pending.get(user_id, {})}
+                        self._due.setdefault(user_id, time.monotonic() + self.delay)
+            if self.on_write is not None and changes:
+                try:
+                    self.on_write(changes)
+                except Exception as e:
+                    logger.warning("Progress write hook failed: %s", e)
+            with self._cond:
+                for user_id in batch:
+                    del self._writing[user_id]
+                self._cond.notify_all()
+
+# -----------------------------------------------------------------------------
+# Command Line: convert records to the bitset format
+# -----------------------------------------------------------------------------
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Convert stored progress records to the bitset format.")
+    parser.add_argument("--root", default="progress", help="sharded progress directory")
+    parser.add_argument("--legacy", help="an old single-file progress.json to import")
+    parser.add_argument("--user", help="user id to import --legacy as (the ?uid= value)")
+    args = parser.parse_args()
+
+    store = ProgressStore(args.root, cache_size=0)
+    converted = 0
+    for directory, _, names in os.walk(args.root):
+        for name in names:
+            if not name.endswith(".json"):
+                continue
+            path = os.path.join(directory, name)
+            with open(path, encoding="utf-8") as f:
+                raw = json.load(f)
+            if "read" not in raw:
+                with file_lock(directory):
+                    store._write(path, decode_record(raw))
+                converted += 1
+    print(f"converted {converted} records")
+
+    if args.legacy:
+        if not args.user:
+            parser.error("--legacy needs --user")
+        with open(args.legacy, encoding="utf-8") as f:
+            legacy = decode_record(json.load(f))
+        store.save(args.user, {"read": store.load(args.user).get("read", 0) | legacy["read"]})
+        print(f"imported {args.legacy} as {args.user}: {store.load(args.user)}")
@@ -0,0 +1,136 @@
+from dataclasses import dataclass, field
+from typing import Callable
+
+import streamlit as st
+
+from utils.content_registry import PageContent, footer_html
+from utils.helpers import (
+    display_expand_collapse_controls,
+    expander_section,
+    inject_custom_css,
+    load_read_sections,
+    read_checkbox_key,
+    reset_expand_collapse_triggers,
+    reset_progress,
+    save_progress,
+)
+from utils.section_registry import group_sections
+
+# Fragment key of the reading-progress block; one section page renders per run
+PROGRESS_FRAGMENT_KEY = "reading_progress"
+
+@dataclass(frozen=True)
+class SectionPage:
+    """Declarative spec of a reading page: its text, progress key and interactive sections."""
+    name: str  # menu title, e.g. "Home"
+    heading: str
+    tagline: str  # shown left of the sub-topic selector
+    sections: PageContent
+    progress_key: str  # session-state key of the page's SectionSet
+    subtopic_key: str
+    widgets: dict = field(default_factory=dict)  # section title -> callable(content) drawing an interactive section
+    untracked: frozenset = frozenset()  # sections without a "Mark as complete" checkbox
+    heading_html: bool = False
+
+# -----------------------------------------------------------------------------
+# Section Page Engine
+# -----------------------------------------------------------------------------
+def render_section_page(page: SectionPage) -> None:
+    """Draw a reading page from its spec.
+
+    Only expanded sections build their body. Interactive sections (quizzes,
+    sliders) run in their own fragment, so answering re-executes only that
+    section. Ticking "Mark as complete" updates the progress set in a
+    callback that reruns just the progress fragment. The sub-topic selector,
+    expand/collapse controls, opening a section and the reset button still
+    rerun the whole page. Plain-text sections are not wrapped in fragments,
+    as each fragment adds bookkeeping to every full rerun.
+    """
+    inject_custom_css()
+    if page.heading_html:
+        st.markdown(page.heading, unsafe_allow_html=True)
+    else:
+        st.title(page.heading)
+    display_expand_collapse_controls(page.name)
+
+    # --- Load progress from file ---
+    if page.progress_key not in st.session_state:
+        st.session_state[page.progress_key] = load_read_sections(page.progress_key)
+
+    # --- Sub-topic selector ---
+    col_left, col_right = st.columns([3, 1])
+    with col_left:
+        st.markdown(page.tagline)
+    with col_right:
+        subtopic = st.selectbox("Sub-topic", list(page.sections.subtopic_options), key=page.subtopic_key)
+
+    # --- Display sections with expanders ---
+    for title in page.sections:
+        if subtopic == "All" or subtopic == title:
+            with expander_section(title) as expanded:
+                if not expanded:
+                    continue
+                if title not in page.untracked:
+                    _read_checkbox(page, title)
+                draw = page.widgets.get(title)
+                if draw is None:
+                    st.markdown(page.sections[title])
+                else:
+                    _interactive_section(draw, page.sections[title])
+
+    # --- Progress tracking ---
+    _reading_progress(page)
+
+    if st.button("Reset Progress"):
+        reset_progress(page.sections, page.progress_key)
+        st.rerun()
+
+    # Display success message if reset was triggered
+    if st.session_state.get("reset_triggered", False):
+        st.success("Progress reset! All checkboxes have been cleared.")
+        # Clear the flag after displaying the message
+        st.session_state["reset_triggered"] = False
+    reset_expand_collapse_triggers()
+
+    # --- Footer ---
+    st.markdown("---")
+    st.markdown(footer_html(), unsafe_allow_html=True)
+
+def _read_checkbox(page: SectionPage, title: str) -> None:
+    # Header with checkbox on the right
+    _, top_col_right = st.columns([5, 1])
+    with top_col_right:
+        st.checkbox(
+            "Mark as complete",
+            key=read_checkbox_key(title),
+            value=title in st.session_state[page.progress_key],
+            on_change=_mark_read,
+            args=(page, title),
+        )
+
+def _mark_read(page: SectionPage, title: str) -> None:
+    """Sync the progress set with a "Mark as complete" checkbox, then redraw only the progress bar."""
+    if st.session_state[read_checkbox_key(title)]:
+        st.session_state[page.progress_key].add(title)
+    else:
+        st.session_state[page.progress_key].discard(title)
+    # Replaces the interaction's full rerun; the checkbox already shows its new state
+    st.rerun(PROGRESS_FRAGMENT_KEY)
+
+@st.fragment
+def _interactive_section(draw: Callable, content: str) -> None:
+    draw(content)
+
+@st.fragment(key=PROGRESS_FRAGMENT_KEY)
+def _reading_progress(page: SectionPage) -> None:
+    # Only the page's progress group counts; tools registered elsewhere have no checkbox
+    total_sections = len(group_sections(page.progress_key))
+    read_sections = len(st.session_state[page.progress_key])
+    progress = int((read_sections / total_sections) * 100)
+
+    st.markdown("### Your Reading Progress")
+    st.progress(progress)
+    st.caption(f"You’ve completed **{read_sections} of {total_sections}** sections ({progress}%)")
+
+    # Save progress to file whenever it changes
+    save_progress(page.progress_key)
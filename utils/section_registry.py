@@ -0,0 +1,169 @@
+# -----------------------------------------------------------------------------
+# Section Registry
+# -----------------------------------------------------------------------------
+# Every section that can be marked read or expanded, as (group, title). A
+# section's id is its position here and is stored in users' progress records,
+# so only ever append: never reorder or remove entries. Reading pages group
+# their sections under their progress key. Interactive tools added to a page
+# later go in a group of their own, outside READING_GROUPS, so they never
+# change what completing that page means for stored progress and counters.
+SECTIONS = (
+    ("home_read_sections", "Introduction to Large Language Models"),
+    ("home_read_sections", "How Language Models Work"),
+    ("home_read_sections", "Why LLMs Matter for Startups"),
+    ("home_read_sections", "Best Practices & Ethics"),
+    ("home_read_sections", "Who Should Use This Guide"),
+    ("home_read_sections", "Let's Get Started!"),
+    ("prompt_read_sections", "Introduction to Prompt Engineering"),
+    ("prompt_read_sections", "Types of Prompts"),
+    ("prompt_read_sections", "Vague vs. Clear Examples"),
+    ("prompt_read_sections", "Prompt Best Practices"),
+    ("prompt_read_sections", "Common Pitfalls"),
+    ("prompt_read_sections", "Prompt Engineering vs Prompt Tuning"),
+    ("prompt_read_sections", "Startup Use Cases"),
+    ("prompt_read_sections", "Prompt Learning Resources"),
+    ("prompt_read_sections", "Quiz"),
+    ("temperature_read_sections", "What is Temperature?"),
+    ("temperature_read_sections", "What is Sampling?"),
+    ("temperature_read_sections", "Adjust the Temperature"),
+    ("temperature_read_sections", "Match Temp to Task"),
+    ("temperature_read_sections", "Summary Table"),
+    ("temperature_read_sections", "Common Misconceptions"),
+    ("temperature_read_sections", "Final Takeaway"),
+    ("hallucination_read_sections", "What Are Hallucinations?"),
+    ("hallucination_read_sections", "Startup Example"),
+    ("hallucination_read_sections", "Why It Happens"),
+    ("hallucination_read_sections", "How to Minimize"),
+    ("hallucination_read_sections", "Spot the Hallucination (Quiz)"),
+    ("api_cost_read_sections", "What Is API Cost?"),
+    ("api_cost_read_sections", "Why API Costs Matter"),
+    ("api_cost_read_sections", "What Drives Cost"),
+    ("api_cost_read_sections", "Optimization Strategies"),
+    ("api_cost_read_sections", "Estimate Token Cost"),
+    ("api_cost_read_sections", "Test Your Knowledge: API Costs"),
+    ("ethics_read_sections", "Why Ethics and Fairness Matter"),
+    ("ethics_read_sections", "Types of Bias"),
+    ("ethics_read_sections", "Examples of Bias"),
+    ("ethics_read_sections", "Why Bias Happens"),
+    ("ethics_read_sections", "What Founders Can Do"),
+    ("ethics_read_sections", "Bias Detection Example"),
+    ("ethics_read_sections", "Bias Reflection Quiz"),
+    ("ethics_read_sections", "Ethical Review Template"),
+    ("faq", "What is a large language model (LLM)?"),
+    ("faq", "Is ChatGPT the same as a search engine?"),
+    ("faq", "Why does it sometimes say things that are wrong?"),
+    ("faq", "How can I control the tone or creativity of the AI's response?"),
+    ("faq", "Will using LLMs increase my startup’s costs?"),
+    ("faq", "Can I use LLMs for decisions like hiring or pricing?"),
+    ("faq", "How do I avoid biased or exclusionary outputs?"),
+    ("glossary", "LLM (Large Language Model)"),
+    ("glossary", "Prompt"),
+    ("glossary", "Prompt Engineering"),
+    ("glossary", "Zero-shot Prompting"),
+    ("glossary", "Few-shot Prompting"),
+    ("glossary", "Instructional Prompt"),
+    ("glossary", "Conversational Prompt"),
+    ("glossary", "Temperature"),
+    ("glossary", "Token"),
+    ("glossary", "Sampling"),
+    ("glossary", "Top-k Sampling"),
+    ("glossary", "Top-p Sampling (Nucleus Sampling)"),
+    ("glossary", "Hallucination"),
+    ("glossary", "Bias"),
+    ("glossary", "Human-in-the-Loop"),
+    ("glossary", "Model Selection"),
+    ("glossary", "Prompt Tuning"),
+    ("glossary", "Use Case"),
+    ("glossary", "API Token Cost"),
+    ("glossary", "Cost Optimization"),
+    ("glossary", "Hallucination Risk"),
+    ("glossary", "Ethical AI"),
+    ("glossary", "Bias Checklist"),
+    ("glossary", "Prompt Generator"),
+    ("glossary", "Startup Use Case Matcher"),
+    ("glossary", "Temperature Control"),
+    ("glossary", "Try it Yourself"),
+    ("glossary", "Toolkit"),
+    ("api_cost_tools", "Compare Cost Scenarios"),
+    ("api_cost_tools", "Analyze Usage Logs"),
+    ("api_cost_tools", "Simulate Response Caching"),
+    ("api_cost_tools", "Estimate Prefix Caching"),
+)
+
+# Groups whose sections learners mark as read, with their page titles
+READING_GROUPS = {
+    "home_read_sections": "Home",
+    "prompt_read_sections": "Prompt Engineering",
+    "temperature_read_sections": "Temperature & Sampling",
+    "hallucination_read_sections": "Hallucinations",
+    "api_cost_read_sections": "API Cost Optimization",
+    "ethics_read_sections": "Ethics & Bias",
+}
+
+SECTION_IDS = {}
+GROUP_MASKS = {}
+for _id, (_group, _title) in enumerate(SECTIONS):
+    SECTION_IDS.setdefault(_title, _id)
+    GROUP_MASKS[_group] = GROUP_MASKS.get(_group, 0) | (1 << _id)
+
+def section_id(title: str):
+    """Stable integer id of a section, or None if it is not registered."""
+    return SECTION_IDS.get(title)
+
+def group_mask(group: str) -> int:
+    """Bitmask covering every section of a page."""
+    return GROUP_MASKS.get(group, 0)
+
+def bits_from_titles(titles) -> int:
+    """Bitset of the registered titles; unknown titles are dropped."""
+    bits = 0
+    for title in titles:
+        if title in SECTION_IDS:
+            bits |= 1 << SECTION_IDS[title]
+    return bits
+
+def group_sections(group: str) -> list:
+    """`(id, title)` of a page's sections, in page order."""
+    return [(i, title) for i, (g, title) in enumerate(SECTIONS) if g == group]
+
+def titles_from_bits(bits: int) -> list:
+    return [title for i, (_, title) in enumerate(SECTIONS) if bits >> i & 1]
+
+# -----------------------------------------------------------------------------
+# Set-like View of a Page's Read Sections
+# -----------------------------------------------------------------------------
+class SectionSet:
+    """Read sections of one page held as an integer bitset.
+
+    Supports the set operations the pages use (`add`, `discard`, `in`, `len`,
+    iteration over titles) while costing one int per page in session state.
+    """
+
+    __slots__ = ("group", "bits")
+
+    def __init__(self, group: str, bits: int = 0):
+        self.group = group
+        self.bits = bits & group_mask(group)
+
+    def add(self, title: str) -> None:
+        if title in SECTION_IDS:
+            self.bits |= (1 << SECTION_IDS[title]) & group_mask(self.group)
+
+    def discard(self, title: str) -> None:
+        if title in SECTION_IDS:
+            self.bits &= ~(1 << SECTION_IDS[title])
+
+    def __contains__(self, title) -> bool:
+        return title in SECTION_IDS and bool(self.bits >> SECTION_IDS[title] & 1)
+
+    def __len__(self) -> int:
+        return bin(self.bits).count("1")
+
+    def __iter__(self):
+        return iter(titles_from_bits(self.bits))
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, SectionSet) and (self.group, self.bits) == (other.group, other.bits)
+
+    def __repr__(self) -> str:
+        return f"SectionSet({self.group!r}, {self.bits:#x})"
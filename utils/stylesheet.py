@@ -0,0 +1,76 @@
+import argparse
+import hashlib
+import os
+import re
+import threading
+
+# Comments, quoted strings (kept verbatim) and runs of whitespace
+_CSS_TOKENS = re.compile(r'/\*.*?\*/|"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\'|\s+', re.S)
+# Whitespace that carries no meaning next to these characters
+_CSS_PUNCTUATION = re.compile(r"\s*([{};,>])\s*")
+
+def minify_css(css: str) -> str:
+    """Strip comments and redundant whitespace from a stylesheet.
+
+    Whitespace inside selectors (descendant combinators) and before `:`
+    (pseudo-classes) is collapsed, not removed; quoted strings are untouched.
+    """
+    strings = []
+
+    def token(match):
+        text = match.group(0)
+        if text.startswith("/*"):
+            return ""
+        if text[0] in "\"'":
+            strings.append(text)
+            return f"\0{len(strings) - 1}\0"
+        return " "
+
+    css = _CSS_TOKENS.sub(token, css)
+    css = _CSS_PUNCTUATION.sub(r"\1", css)
+    css = re.sub(r":\s+", ":", css).replace(";}", "}").strip()
+    return re.sub(r"\0(\d+)\0", lambda match: strings[int(match.group(1))], css)
+
+# -----------------------------------------------------------------------------
+# Cached Stylesheet
+# -----------------------------------------------------------------------------
+class Stylesheet:
+    """A CSS file, minified once and reloaded only when it changes on disk.
+
+    `load` costs one `stat` while the file is unchanged, so it can be called
+    on every rerun; editing the file during development is picked up on the
+    next one.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._cached = (None, None, "")
+
+    def load(self) -> tuple:
+        """Return `(digest, minified css)`; raises FileNotFoundError if the file is missing."""
+        info = os.stat(self.path)
+        stamp = (info.st_ino, info.st_size, info.st_mtime_ns)
+        with self._lock:
+            if self._cached[0] != stamp:
+                with open(self.path, encoding="utf-8") as f:
+                    css = minify_css(f.read())
+                digest = hashlib.sha256(css.encode("utf-8")).hexdigest()[:16]
+                self._cached = (stamp, digest, css)
+            return self._cached[1], self._cached[2]
+
+# -----------------------------------------------------------------------------
+# Command Line: show the minified stylesheet
+# -----------------------------------------------------------------------------
+if __name__ == "__main__":
+    from config import STYLESHEET_PATH
+
+    parser = argparse.ArgumentParser(description="Print the minified stylesheet and its size.")
+    parser.add_argument("path", nargs="?", default=STYLESHEET_PATH)
+    args = parser.parse_args()
+
+    with open(args.path, encoding="utf-8") as f:
+        original = f.read()
+    digest, css = Stylesheet(args.path).load()
+    print(css)
+    print(f"{len(original.encode())} -> {len(css.encode())} bytes ({digest})")
@@ -0,0 +1,150 @@
+import argparse
+import hashlib
+import os
+import re
+import threading
+from collections import OrderedDict
+
+# GPT-2 style pre-tokenization: contractions, letter runs, digit runs, symbol runs, whitespace
+_PRETOKENS = re.compile(r"'(?:[sdmt]|ll|ve|re)| ?[^\W\d_]+| ?\d+| ?[^\s\w]+|\s+(?!\S)|\s+")
+
+def estimate_tokens(text: str) -> int:
+    """Approximate BPE token count without a vocabulary.
+
+    Text is split the way GPT-style tokenizers pre-tokenize it, then each
+    piece is charged what a typical English BPE vocabulary spends on it:
+    one token per word of up to six letters (plus one per six more), digits
+    in groups of three, symbols in pairs and one token per whitespace run.
+    """
+    total = 0
+    for piece in _PRETOKENS.findall(text):
+        word = piece.strip()
+        if not word:
+            total += 1
+        elif word[0].isdigit():
+            total += -(-len(word) // 3)
+        elif word[0].isalpha() or word[0] == "'":
+            total += 1 + (len(word) - 1) // 6
+        else:
+            total += -(-len(word) // 2)
+    return total
+
+def load_tokenizer(path: str):
+    """Load a Hugging Face tokenizer saved in `path`, or return None.
+
+    Nothing is downloaded: the directory must hold the tokenizer files (as
+    written by `save_pretrained`). Missing `transformers`, a missing
+    directory or unreadable files all fall back to the estimate.
+    """
+    if not path or not os.path.isdir(path):
+        return None
+    try:
+        from transformers import AutoTokenizer  # slow import, paid once per process
+        return AutoTokenizer.from_pretrained(path, local_files_only=True)
+    except (ImportError, OSError, ValueError):
+        return None
+
+# -----------------------------------------------------------------------------
+# Token Counter
+# -----------------------------------------------------------------------------
+class TokenCounter:
+    """Count prompt tokens with a local tokenizer, remembering recent counts.
+
+    Counts are kept in an LRU keyed by a 16-byte BLAKE2 digest of the text,
+    so long prompts are not held in memory. `count_batch` tokenizes all
+    uncached texts in one tokenizer call, which fast (Rust) tokenizers spread
+    over several threads.
+    """
+
+    def __init__(self, tokenizer_dir: str = None, cache_size: int = 4096):
+        self.tokenizer = load_tokenizer(tokenizer_dir)
+        self.cache_size = cache_size
+        self._lock = threading.Lock()
+        self._cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def exact(self) -> bool:
+        return self.tokenizer is not None
+
+    @property
+    def name(self) -> str:
+        if self.tokenizer is None:
+            return "estimate"
+        return os.path.basename(os.path.normpath(self.tokenizer.name_or_path)) or "local tokenizer"
+
+    def count(self, text: str) -> int:
+        return self.count_batch([text])[0]
+
+    def count_batch(self, texts) -> list:
+        """Token counts of `texts`, in order; only texts not seen recently are tokenized."""
+        keys = [hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest() for text in texts]
+        counts = [None] * len(texts)
+        missing = {}
+        with self._lock:
+            for i, key in enumerate(keys):
+                if key in self._cache:
+                    self._cache.move_to_end(key)
+                    counts[i] = self._cache[key]
+                    self.hits += 1
+                else:
+                    missing.setdefault(key, []).append(i)
+            self.misses += len(missing)
+        if not missing:
+            return counts
+
+        batch = [texts[positions[0]] for positions in missing.values()]
+        for key, n in zip(missing, self._tokenize(batch)):
+            for i in missing[key]:
+                counts[i] = n
+        with self._lock:
+            for key, positions in missing.items():
+                self._cache[key] = counts[positions[0]]
+                self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return counts
+
+    def token_ids(self, texts) -> list:
+        """Token ids of each text (not cached).
+
+        Without a tokenizer, each pre-tokenizer piece stands in for a token,
+        with a per-process hash of the piece as its id: equal pieces get equal
+        ids, which is all prefix matching needs.
+        """
+        if self.tokenizer is None:
+            return [[hash(piece) & 0xFFFFFFFF for piece in _PRETOKENS.findall(text)] for text in texts]
+        backend = getattr(self.tokenizer, "backend_tokenizer", None)
+        if backend is not None:
+            # Fast tokenizers: skip the transformers wrapper and its padding/tensor bookkeeping
+            return [encoding.ids for encoding in backend.encode_batch(texts, add_special_tokens=False)]
+        return self.tokenizer(texts, add_special_tokens=False, return_attention_mask=False)["input_ids"]
+
+    def _tokenize(self, texts: list) -> list:
+        if self.tokenizer is None:
+            return [estimate_tokens(text) for text in texts]
+        return [len(ids) for ids in self.token_ids(texts)]
+
+def split_prompts(text: str) -> list:
+    """Split pasted text into prompts on lines holding only `---`."""
+    prompts = re.split(r"^\s*---\s*$", text, flags=re.M)
+    return [prompt.strip() for prompt in prompts if prompt.strip()]
+
+# -----------------------------------------------------------------------------
+# Command Line: count tokens in files
+# -----------------------------------------------------------------------------
+if __name__ == "__main__":
+    from config import TOKENIZER_DIR
+
+    parser = argparse.ArgumentParser(description="Count the tokens of each prompt in the given files.")
+    parser.add_argument("files", nargs="+")
+    parser.add_argument("--tokenizer-dir", default=TOKENIZER_DIR)
+    args = parser.parse_args()
+
+    counter = TokenCounter(args.tokenizer_dir)
+    for path in args.files:
+        with open(path, encoding="utf-8") as f:
+            prompts = split_prompts(f.read())
+        counts = counter.count_batch(prompts)
+        print(f"{path}: {len(prompts)} prompts, {sum(counts)} tokens ({counter.name})")
@@ -0,0 +1,272 @@
+import argparse
+import csv
+import io
+import os
+import time
+from concurrent.futures import as_completed
+from typing import NamedTuple
+
+import pandas as pd
+
+# Columns read from a usage log; "endpoint" is optional
+COLUMNS = ("timestamp", "model", "endpoint", "prompt_tokens", "completion_tokens")
+KEYS = ["day", "model", "endpoint"]
+SUMS = ["requests", "prompt_tokens", "completion_tokens"]
+# Endpoint of rows that have none, whether the field is empty or the log has no such column
+NO_ENDPOINT = "(none)"
+# Partial summaries merged in memory before they are folded together
+_MAX_PARTIALS = 16
+
+def log_format(path: str) -> str:
+    """ "jsonl" for .jsonl/.ndjson/.json files, "csv" otherwise."""
+    return "jsonl" if path.lower().endswith((".jsonl", ".ndjson", ".json")) else "csv"
+
+# -----------------------------------------------------------------------------
+# Splitting a Log into Line-Aligned Ranges and Blocks
+# -----------------------------------------------------------------------------
+def read_header(path: str, fmt: str) -> bytes:
+    if fmt != "csv":
+        return b""
+    with open(path, "rb") as f:
+        return f.readline()
+
+def split_ranges(path: str, fmt: str, parts: int) -> list:
+    """Split the file's data lines into about `parts` byte ranges that start on a line."""
+    size = os.path.getsize(path)
+    start = len(read_header(path, fmt))
+    bounds = [start]
+    with open(path, "rb") as f:
+        for i in range(1, parts):
+            f.seek(max(start + (size - start) * i // parts - 1, bounds[-1]))
+            f.readline()
+            if bounds[-1] < f.tell() < size:
+                bounds.append(f.tell())
+    bounds.append(size)
+    return [(a, b) for a, b in zip(bounds, bounds[1:]) if b > a]
+
+def iter_blocks(path: str, start: int, end: int, block_bytes: int):
+    """Yield the lines of `[start, end)` in blocks of about `block_bytes`, never splitting a line."""
+    with open(path, "rb") as f:
+        f.seek(start)
+        while f.tell() < end:
+            block = f.read(min(block_bytes, end - f.tell()))
+            if f.tell() < end:
+                block += f.readline()  # `end` is a line start, so this stops at or before it
+            yield block
+
+# -----------------------------------------------------------------------------
+# Summaries
+# -----------------------------------------------------------------------------
+def parse_block(block: bytes, fmt: str, header: bytes = b"", columns=COLUMNS) -> pd.DataFrame:
+    """Parse a block of log lines, with pyarrow when it can (2.5-4x faster than the default parsers).
+
+    No dtypes are forced on the pyarrow CSV reader: doing so makes it ~30x
+    slower. Timestamps may come back as datetimes or text; `day_keys`
+    handles both.
+    """
+    if fmt == "csv":
+        names = next(csv.reader([header.decode("utf-8-sig")]), [])
+        usecols = [name for name in names if name in columns]
+        try:
+            return pd.read_csv(io.BytesIO(header + block), engine="pyarrow", usecols=usecols)
+        except (ImportError, ValueError):
+            return pd.read_csv(io.BytesIO(header + block), usecols=usecols, dtype={"timestamp": "string"})
+    try:
+        return pd.read_json(io.BytesIO(block), lines=True, dtype=False, convert_dates=False, engine="pyarrow")
+    except (ImportError, ValueError):
+        # Lines whose fields change type (e.g. numeric and text timestamps) need the default parser
+        return pd.read_json(io.BytesIO(block), lines=True, dtype=False, convert_dates=False)
+
+def iter_frames(path: str, columns=COLUMNS, block_bytes: int = 32 * 1024 * 1024):
+    """Yield `(frame, bytes read so far)` for a whole log, read in order.
+
+    CSV goes through a quote-aware streaming reader, so quoted fields may
+    span lines (prompts often do); every column is read as text, leaving
+    conversion to the caller, so a block that looks different from the
+    first cannot fail the read. JSONL has one record per line and is split
+    into raw line blocks. Byte-range splitting (`split_ranges`) stays
+    line-based, which is why only the sequential replays use this reader.
+    """
+    fmt = log_format(path)
+    if fmt != "csv":
+        header, done = read_header(path, fmt), 0
+        for block in iter_blocks(path, 0, os.path.getsize(path), block_bytes):
+            done += len(block)
+            yield parse_block(block, fmt, header, columns), done
+        return
+    names = next(csv.reader([read_header(path, fmt).decode("utf-8-sig")]), [])
+    usecols = [name for name in names if name in columns]
+    with open(path, "rb") as f:
+        try:
+            from pyarrow import csv as pa_csv, string
+        except ImportError:
+            rows = max(block_bytes // 256, 1000)  # pandas chunks by rows, not bytes
+            for chunk in pd.read_csv(f, usecols=usecols, dtype="string", chunksize=rows):
+                yield chunk, f.tell()
+            return
+        reader = pa_csv.open_csv(
+            f,
+            read_options=pa_csv.ReadOptions(block_size=block_bytes),
+            parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+            convert_options=pa_csv.ConvertOptions(
+                include_columns=usecols, column_types={name: string() for name in usecols}, strings_can_be_null=True,
+            ),
+        )
+        for batch in reader:
+            yield batch.to_pandas(), f.tell()
+
+def day_keys(timestamps: pd.Series) -> pd.Series:
+    """Day of each timestamp: a floored datetime, or the date part of an ISO 8601 string.
+
+    Numbers (and all-digit strings) are Unix seconds. Datetimes are floored
+    rather than formatted, which is ~20x cheaper; `summarize_frame` formats
+    the few distinct days left after grouping.
+    """
+    if pd.api.types.is_datetime64_any_dtype(timestamps):
+        return timestamps.dt.floor("D")
+    if pd.api.types.is_numeric_dtype(timestamps):
+        return pd.to_datetime(timestamps, unit="s", errors="coerce").dt.floor("D")
+    text = timestamps.astype("string")
+    days = text.str.slice(0, 10)
+    epoch = ~text.str.contains("-", regex=False).fillna(True)
+    if epoch.any():
+        seconds = pd.to_numeric(text[epoch], errors="coerce")
+        days[epoch] = pd.to_datetime(seconds, unit="s", errors="coerce").dt.strftime("%Y-%m-%d")
+    return days
+
+def summarize_frame(frame: pd.DataFrame) -> tuple:
+    """Token sums per (day, model, endpoint), the row count and the rows skipped.
+
+    Rows without a model or a readable timestamp are skipped and counted.
+    """
+    timestamps = frame["timestamp"] if "timestamp" in frame else pd.Series(pd.NA, index=frame.index, dtype="string")
+    endpoints = frame["endpoint"].astype("string").fillna(NO_ENDPOINT) if "endpoint" in frame else NO_ENDPOINT
+    rows = pd.DataFrame({
+        "day": day_keys(timestamps),
+        "model": frame["model"].astype("string") if "model" in frame else pd.NA,
+        "endpoint": endpoints,
+        "prompt_tokens": pd.to_numeric(frame.get("prompt_tokens", 0), errors="coerce"),
+        "completion_tokens": pd.to_numeric(frame.get("completion_tokens", 0), errors="coerce"),
+        "requests": 1,
+    }, index=frame.index)
+    valid = rows["day"].notna() & rows["model"].notna()
+    # One grouped sum over every column; a separate size() pass doubles the grouping cost
+    summary = rows[valid].groupby(KEYS, sort=False)[SUMS].sum()
+    days = summary.index.levels[0]
+    if pd.api.types.is_datetime64_any_dtype(days):
+        summary.index = summary.index.set_levels(days.strftime("%Y-%m-%d"), level=0)
+    return summary, len(rows), int((~valid).sum())
+
+def merge_summaries(summaries) -> pd.DataFrame:
+    summaries = [s for s in summaries if len(s)]
+    if not summaries:
+        return pd.DataFrame(columns=KEYS + SUMS).set_index(KEYS)
+    return pd.concat(summaries).groupby(level=KEYS, sort=False).sum()
+
+def summarize_range(path: str, fmt: str, start: int, end: int, block_bytes: int) -> tuple:
+    """Summarize one byte range block by block; runs in a worker process.
+
+    Memory is bounded by one parsed block plus a handful of partial
+    summaries, whose size depends on days × models × endpoints only.
+    """
+    header = read_header(path, fmt)
+    partials, rows, skipped = [], 0, 0
+    for block in iter_blocks(path, start, end, block_bytes):
+        summary, n, bad = summarize_frame(parse_block(block, fmt, header))
+        partials.append(summary)
+        rows += n
+        skipped += bad
+        if len(partials) >= _MAX_PARTIALS:
+            partials = [merge_summaries(partials)]
+    return merge_summaries(partials), rows, skipped
+
+# -----------------------------------------------------------------------------
+# Usage Report
+# -----------------------------------------------------------------------------
+class UsageReport(NamedTuple):
+    """Priced usage per day, model and endpoint, with throughput of the scan."""
+    daily: pd.DataFrame  # day, model, endpoint, requests, prompt_tokens, completion_tokens, cost
+    rows: int
+    skipped: int
+    seconds: float
+    bytes: int
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    @property
+    def unpriced_models(self) -> list:
+        return sorted(self.daily.loc[self.daily["cost"].isna(), "model"].unique())
+
+    def monthly(self) -> pd.DataFrame:
+        monthly = self.daily.assign(month=self.daily["day"].str.slice(0, 7))
+        return monthly.groupby(["month", "model", "endpoint"], as_index=False)[SUMS + ["cost"]].sum(min_count=1)
+
+def price(summary: pd.DataFrame, rates: dict) -> pd.DataFrame:
+    """Add a cost column using `rates` (model -> {"in", "out"} per 1K tokens); unknown models cost NaN.
+
+    Cost is linear in tokens, so pricing the summed tokens of a group gives
+    the same total as pricing each request.
+    """
+    daily = summary.reset_index()
+    rate_in = daily["model"].map({model: rate["in"] for model, rate in rates.items()}).astype(float)
+    rate_out = daily["model"].map({model: rate["out"] for model, rate in rates.items()}).astype(float)
+    daily["cost"] = (daily["prompt_tokens"] * rate_in + daily["completion_tokens"] * rate_out) / 1000
+    return daily.sort_values(KEYS, ignore_index=True)
+
+def analyze_log(path: str, rates: dict, pool=None, block_bytes: int = 32 * 1024 * 1024, progress=None) -> UsageReport:
+    """Stream a CSV/JSONL usage log into a priced daily report.
+
+    The file is cut into line-aligned ranges of about `block_bytes`. With a
+    `pool` (a concurrent.futures executor) the ranges are summarized in
+    parallel; `progress(done_fraction)` is called as each one finishes.
+    """
+    start = time.perf_counter()
+    fmt = log_format(path)
+    size = os.path.getsize(path)
+    ranges = split_ranges(path, fmt, max(1, -(-size // block_bytes)))
+    summaries, rows, skipped = [], 0, 0
+
+    def collect(result, done):
+        nonlocal rows, skipped
+        summaries.append(result[0])
+        rows += result[1]
+        skipped += result[2]
+        if len(summaries) >= _MAX_PARTIALS:
+            summaries[:] = [merge_summaries(summaries)]
+        if progress:
+            progress(done / len(ranges))
+
+    if pool is None or len(ranges) == 1:
+        for done, (a, b) in enumerate(ranges, 1):
+            collect(summarize_range(path, fmt, a, b, block_bytes), done)
+    else:
+        futures = [pool.submit(summarize_range, path, fmt, a, b, block_bytes) for a, b in ranges]
+        for done, future in enumerate(as_completed(futures), 1):
+            collect(future.result(), done)
+    daily = price(merge_summaries(summaries), rates)
+    return UsageReport(daily, rows, skipped, time.perf_counter() - start, size)
+
+# -----------------------------------------------------------------------------
+# Command Line: monthly cost of a usage log
+# -----------------------------------------------------------------------------
+if __name__ == "__main__":
+    from concurrent.futures import ProcessPoolExecutor
+
+    from config import MODEL_RATES, USAGE_LOG_BLOCK_BYTES
+
+    parser = argparse.ArgumentParser(description="Print the monthly API cost per model and endpoint of a usage log.")
+    parser.add_argument("path")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    pool = ProcessPoolExecutor(args.workers) if args.workers > 1 else None
+    try:
+        report = analyze_log(args.path, MODEL_RATES, pool, USAGE_LOG_BLOCK_BYTES)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    print(report.monthly().to_string(index=False))
+    print(f"{report.rows:,} rows ({report.skipped:,} skipped) in {report.seconds:.1f}s, "
+          f"{report.rows_per_second:,.0f} rows/s")